@@ -19,6 +19,10 @@ along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 import base64
 import base58
 
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
 from ontology.crypto.curve import Curve
 from ontology.crypto.digest import Digest
 from ontology.crypto.scrypt import Scrypt
@@ -57,23 +61,64 @@ class Account(object):
         else:
             raise SDKException(ErrorCode.invalid_private_key)
         self.__curve_name = Curve.P256
-        self.__public_key = Signature.ec_get_public_key_by_private_key(self.__private_key, self.__curve_name)
+        self.__self_verify = True
+        self.__ec_private_key = None
+        self.__ec_public_key = None
+        self.__public_key = self.__get_ec_public_key().public_bytes(Encoding.X962, PublicFormat.CompressedPoint)
         self.__address = Address.from_public_key(self.__public_key)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_Account__curve_name'] = self.__curve_name.name
+        state['_Account__ec_private_key'] = None
+        state['_Account__ec_public_key'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__curve_name = Curve[self.__curve_name]
+
+    def __get_ec_private_key(self) -> ec.EllipticCurvePrivateKey:
+        if self.__ec_private_key is None:
+            try:
+                self.__ec_private_key = ec.derive_private_key(int.from_bytes(self.__private_key, 'big'),
+                                                              self.__curve_name.value, default_backend())
+            except ValueError:
+                raise SDKException(ErrorCode.invalid_private_key)
+        return self.__ec_private_key
+
+    def __get_ec_public_key(self) -> ec.EllipticCurvePublicKey:
+        if self.__ec_public_key is None:
+            self.__ec_public_key = self.__get_ec_private_key().public_key()
+        return self.__ec_public_key
+
+    @property
+    def self_verify(self) -> bool:
+        """
+        Whether the signature is verified after it is generated, True by default.
+        """
+        return self.__self_verify
+
+    @self_verify.setter
+    def self_verify(self, self_verify: bool):
+        if not isinstance(self_verify, bool):
+            raise SDKException(ErrorCode.param_error)
+        self.__self_verify = self_verify
+
     def generate_signature(self, msg: bytes):
-        handler = SignatureHandler(self.__signature_scheme)
-        signature_value = handler.generate_signature(bytes.hex(self.__private_key), msg)
+        handler = SignatureHandler(self.__signature_scheme, self.__curve_name)
+        signature_value = handler.generate_signature(self.__get_ec_private_key(), msg)
         bytes_signature = Signature(self.__signature_scheme, signature_value).to_bytes()
-        result = handler.verify_signature(self.__public_key, msg, bytes_signature)
-        if not result:
+        if self.__self_verify and not handler.verify_signature_by_key(self.__get_ec_public_key(), msg,
+                                                                      bytes_signature, self.__signature_scheme):
             raise SDKException(ErrorCode.invalid_signature_data)
         return bytes_signature
 
     def verify_signature(self, msg: bytes, signature: bytes):
         if msg is None or signature is None:
             raise Exception(ErrorCode.param_err("param should not be None"))
-        handler = SignatureHandler(self.__signature_scheme)
-        return handler.verify_signature(self.get_public_key_bytes(), msg, signature)
+        return SignatureHandler.verify_signature_by_key(self.__get_ec_public_key(), msg, signature,
+                                                        self.__signature_scheme)
 
     def get_ont_id(self):
         return DID_ONT + self.get_address_base58()
@@ -20,17 +20,21 @@ import uuid
 import base64
 
 from time import time, sleep
+from typing import List
 
 from ontology.claim.header import Header
 from ontology.crypto.digest import Digest
 from ontology.claim.payload import Payload
 from ontology.account.account import Account
 from ontology.claim.proof import BlockchainProof
+from ontology.utils.scan import aio_ordered_map
+from ontology.network.websocket import Websocket
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 from ontology.merkle.merkle_verifier import MerkleVerifier
 from ontology.core.invoke_transaction import InvokeTransaction
 from ontology.crypto.signature_handler import SignatureHandler
+from ontology.network.tx_waiter import aio_wait_for_transactions, DEFAULT_WAIT_TIMEOUT
 
 
 class Claim(object):
@@ -164,6 +168,10 @@ class Claim(object):
                     raise e
                 sleep(6)
             count += 1
+        return self.__set_merkle_proof(commit_tx_hash, merkle_proof, is_big_endian, hex_contract_address)
+
+    def __set_merkle_proof(self, commit_tx_hash: str, merkle_proof: dict, is_big_endian: bool,
+                           hex_contract_address: str) -> BlockchainProof:
         tx_block_height = merkle_proof['BlockHeight']
         current_block_height = merkle_proof['CurBlockHeight']
         target_hash = merkle_proof['TransactionsRoot']
@@ -176,6 +184,76 @@ class Claim(object):
         self.__blk_proof.set_proof(commit_tx_hash, hex_contract_address, tx_block_height, merkle_root, proof_node)
         return self.__blk_proof
 
+    async def aio_generate_blk_proof(self, commit_tx_hash: str, is_big_endian: bool = True,
+                                     hex_contract_address: str = '', timeout: float = DEFAULT_WAIT_TIMEOUT,
+                                     websocket: Websocket = None) -> BlockchainProof:
+        """
+        This interface is used to wait for the commit transaction without blocking the event loop,
+        and generate the blockchain proof of the claim.
+
+        :param timeout: the seconds waited for the commit transaction.
+        :param websocket: if set, the new blocks are received from its block subscription instead of polling.
+        """
+        result = await Claim.aio_generate_blk_proof_batch([self], [commit_tx_hash], is_big_endian,
+                                                          hex_contract_address, timeout, websocket)
+        if isinstance(result[0], SDKException):
+            raise result[0]
+        return result[0]
+
+    @staticmethod
+    async def aio_generate_blk_proof_batch(claims: List['Claim'], commit_tx_hashes: List[str],
+                                           is_big_endian: bool = True, hex_contract_address: str = '',
+                                           timeout: float = DEFAULT_WAIT_TIMEOUT, websocket: Websocket = None,
+                                           concurrency: int = 16) -> list:
+        """
+        This interface is used to generate the blockchain proofs of many claims at once. All the commit
+        transactions are waited together, so that each new block is queried once no matter how many claims
+        are pending.
+
+        :return: the blockchain proof of each claim, or the SDKException if the proof of it is not generated.
+        """
+        if len(claims) != len(commit_tx_hashes):
+            raise SDKException(ErrorCode.param_err('the length of claim list should be equal to tx hash list.'))
+        if len(claims) == 0:
+            return list()
+        sdk = claims[0].__sdk
+        network = sdk.default_aio_network
+        if len(hex_contract_address) == 0:
+            hex_contract_address = sdk.neo_vm.claim_record().hex_contract_address
+        heights = await aio_wait_for_transactions(network, commit_tx_hashes, timeout, websocket=websocket)
+
+        async def get_merkle_proof(tx_hash: str):
+            if tx_hash not in heights:
+                return tx_hash, SDKException(ErrorCode.other_error(f'transaction {tx_hash} is not committed.'))
+            try:
+                merkle_proof = await network.get_merkle_proof(tx_hash)
+            except SDKException as e:
+                return tx_hash, e
+            if not isinstance(merkle_proof, dict) or len(merkle_proof) == 0:
+                return tx_hash, SDKException(ErrorCode.other_error('Invalid merkle proof'))
+            return tx_hash, merkle_proof
+
+        merkle_proofs = dict()
+        results = aio_ordered_map(get_merkle_proof, list(dict.fromkeys(commit_tx_hashes)), concurrency)
+        try:
+            async for tx_hash, merkle_proof in results:
+                merkle_proofs[tx_hash] = merkle_proof
+        finally:
+            await results.aclose()
+        blk_proofs = list()
+        for claim, tx_hash in zip(claims, commit_tx_hashes):
+            merkle_proof = merkle_proofs[tx_hash]
+            if isinstance(merkle_proof, SDKException):
+                blk_proofs.append(merkle_proof)
+                continue
+            try:
+                blk_proofs.append(claim.__set_merkle_proof(tx_hash, merkle_proof, is_big_endian, hex_contract_address))
+            except SDKException as e:
+                blk_proofs.append(e)
+            except (KeyError, IndexError):
+                blk_proofs.append(SDKException(ErrorCode.other_error('Invalid merkle proof')))
+        return blk_proofs
+
     def validate_blk_proof(self, is_big_endian: bool = True):
         return self.__blk_proof.validate_blk_proof(is_big_endian)
 
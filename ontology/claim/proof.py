@@ -98,6 +98,15 @@ class BlockchainProof(object):
         except KeyError:
             raise SDKException(ErrorCode.invalid_blk_proof)
         block = self.__sdk.default_network.get_block_by_height(blk_height)
+        return BlockchainProof.validate_proof_in_block(tx_hash, proof_node, merkle_root, block, is_big_endian)
+
+    @staticmethod
+    def validate_proof_in_block(tx_hash: str, proof_node: list, merkle_root: str, block: dict,
+                                is_big_endian: bool = False) -> bool:
+        """
+        This interface is used to validate a merkle proof with the block of the proof, so that a block which has
+        been queried can be reused by the proofs of the same height.
+        """
         tx_list = block.get('Transactions', list())
         tx_exist = False
         for tx in tx_list:
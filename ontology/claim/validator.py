@@ -0,0 +1,316 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import json
+import time
+import base64
+import threading
+
+from typing import List, Callable, Iterable
+
+from ontology.claim.header import Header
+from ontology.claim.payload import Payload
+from ontology.utils.scan import BatchMapper
+from ontology.claim.proof import BlockchainProof
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.contract.neo.claim_record import ClaimRecord
+from ontology.crypto.signature_handler import verify_signature_entries, DEFAULT_VERIFY_CHUNK_SIZE
+
+DEFAULT_ISSUER_KEY_TTL = 600
+DEFAULT_KEY_REFRESH_INTERVAL = 10
+DEFAULT_FETCH_CONCURRENCY = 8
+
+
+def _check_interval(interval: float):
+    if isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval < 0:
+        raise SDKException(ErrorCode.param_error)
+
+
+class IssuerKeyCache(object):
+    """
+    A cache of the public keys of ONT IDs. The keys of an ONT ID are loaded again when they are older than the ttl,
+    so that a revoked key is dropped in the ttl, or when a key id is not found and they are older than the refresh
+    interval, so that a newly added key is found at once.
+    """
+
+    def __init__(self, get_public_keys: Callable[[str], list], ttl: float = DEFAULT_ISSUER_KEY_TTL,
+                 refresh_interval: float = DEFAULT_KEY_REFRESH_INTERVAL):
+        """
+        :param get_public_keys: a function which queries the public keys of an ONT ID in the form of
+         [dict(PubKeyId=kid, Value=hex_public_key)], e.g. OntId.get_public_keys.
+        """
+        _check_interval(ttl)
+        _check_interval(refresh_interval)
+        self.__get_public_keys = get_public_keys
+        self.__ttl = ttl
+        self.__refresh_interval = refresh_interval
+        self.__entries = dict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__entries)
+
+    @property
+    def ttl(self) -> float:
+        return self.__ttl
+
+    @property
+    def refresh_interval(self) -> float:
+        return self.__refresh_interval
+
+    def __load(self, ont_id: str) -> dict:
+        keys = {info.get('PubKeyId', ''): info.get('Value', '') for info in self.__get_public_keys(ont_id)}
+        with self.__lock:
+            self.__entries[ont_id] = (time.monotonic(), keys)
+        return keys
+
+    def __get_entry(self, ont_id: str):
+        with self.__lock:
+            entry = self.__entries.get(ont_id)
+        if entry is None or time.monotonic() - entry[0] >= self.__ttl:
+            return None
+        return entry
+
+    def get_public_keys(self, ont_id: str) -> dict:
+        """
+        This interface is used to get the public keys of an ONT ID in the form of {kid: hex_public_key}.
+        """
+        entry = self.__get_entry(ont_id)
+        if entry is None:
+            return self.__load(ont_id)
+        return entry[1]
+
+    def get_public_key(self, ont_id: str, kid: str) -> str:
+        """
+        This interface is used to get the public key of a key id, an empty string is returned if the key
+        is not found or has been revoked.
+        """
+        entry = self.__get_entry(ont_id)
+        if entry is None:
+            return self.__load(ont_id).get(kid, '')
+        loaded_at, keys = entry
+        if kid not in keys and time.monotonic() - loaded_at >= self.__refresh_interval:
+            keys = self.__load(ont_id)
+        return keys.get(kid, '')
+
+    def invalidate(self, ont_id: str) -> bool:
+        """
+        This interface is used to drop the cached keys of an ONT ID, e.g. when a key of it is known to be revoked.
+        """
+        with self.__lock:
+            return self.__entries.pop(ont_id, None) is not None
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+
+class ClaimValidationResult(object):
+    """
+    The result of validating a claim. The blk_proof is None if the claim has no blockchain proof or it is not
+    checked, and the revoked is None if the claim status is not checked.
+    """
+
+    def __init__(self):
+        self.claim_id = ''
+        self.iss = ''
+        self.kid = ''
+        self.signature = False
+        self.expired = None
+        self.blk_proof = None
+        self.revoked = None
+        self.error = ''
+
+    def __iter__(self):
+        data = dict(claim_id=self.claim_id, iss=self.iss, kid=self.kid, signature=self.signature,
+                    expired=self.expired, blk_proof=self.blk_proof, revoked=self.revoked, error=self.error,
+                    valid=self.valid)
+        for key, value in data.items():
+            yield key, value
+
+    @property
+    def valid(self) -> bool:
+        return self.error == '' and self.signature and self.expired is False and self.blk_proof is not False \
+               and self.revoked is not True
+
+
+class ClaimValidator(object):
+    """
+    Validates claims in bulk. The public keys of issuers are cached, the signatures are verified in a process pool,
+    and the issuer keys, blocks and claim status which are required by a batch are queried once and concurrently.
+    """
+
+    def __init__(self, sdk, ttl: float = DEFAULT_ISSUER_KEY_TTL, max_workers: int = None,
+                 concurrency: int = DEFAULT_FETCH_CONCURRENCY, chunk_size: int = DEFAULT_VERIFY_CHUNK_SIZE):
+        """
+        :param ttl: the seconds for which the public keys of an issuer are cached.
+        :param max_workers: the number of processes used to verify signatures, 0 means verifying in current process,
+         and None means the number of processors.
+        :param concurrency: the number of concurrent queries sent to the node.
+        :param chunk_size: the number of signatures verified by a process at a time.
+        """
+        self.__sdk = sdk
+        self.__key_cache = IssuerKeyCache(self.__query_public_keys, ttl)
+        self.__max_workers = max_workers
+        self.__concurrency = concurrency
+        self.__chunk_size = chunk_size
+
+    @property
+    def key_cache(self) -> IssuerKeyCache:
+        return self.__key_cache
+
+    def __query_public_keys(self, ont_id: str) -> list:
+        return self.__sdk.native_vm.ont_id().get_public_keys(ont_id)
+
+    def invalidate(self, ont_id: str) -> bool:
+        return self.__key_cache.invalidate(ont_id)
+
+    @staticmethod
+    def __parse(b64_claim: str) -> tuple:
+        try:
+            b64_head, b64_payload, b64_signature, b64_blk_proof = b64_claim.split('.')
+        except (ValueError, AttributeError):
+            raise SDKException(ErrorCode.invalid_b64_claim_data)
+        try:
+            head = Header.from_base64(b64_head)
+            payload = Payload.from_base64(b64_payload)
+            signature = base64.b64decode(b64_signature)
+            blk_proof = json.loads(base64.b64decode(b64_blk_proof).decode('utf-8')) if b64_blk_proof else dict()
+        except (ValueError, TypeError, KeyError):
+            raise SDKException(ErrorCode.invalid_b64_claim_data)
+        if isinstance(payload.exp, bool) or not isinstance(payload.exp, (int, float)):
+            raise SDKException(ErrorCode.invalid_b64_claim_data)
+        if not isinstance(blk_proof, dict):
+            raise SDKException(ErrorCode.invalid_blk_proof)
+        msg = f'{b64_head}.{b64_payload}'.encode('ascii')
+        return head, payload, msg, signature, blk_proof
+
+    def __map(self, func: Callable, items: list) -> dict:
+        def call(item):
+            try:
+                return func(item)
+            except SDKException as e:
+                return e
+
+        with BatchMapper(call, concurrency=self.__concurrency) as mapper:
+            return dict(zip(items, mapper(items)))
+
+    def __get_block(self, height: int) -> dict:
+        return self.__sdk.default_network.get_block_by_height(height)
+
+    def __get_status(self, record: tuple) -> bool:
+        hex_contract_address, claim_id = record
+        return ClaimRecord(self.__sdk, hex_contract_address).get_status(claim_id)
+
+    def __check_signatures(self, claims: list, results: List[ClaimValidationResult]):
+        issuers = list(dict.fromkeys(payload.iss for _, _, payload, *_ in claims))
+        issuer_keys = self.__map(self.__key_cache.get_public_keys, issuers)
+        entries = list()
+        indexes = list()
+        for index, head, payload, msg, signature, _ in claims:
+            keys = issuer_keys[payload.iss]
+            if isinstance(keys, SDKException):
+                results[index].error = keys.args[1]
+                continue
+            if len(keys) == 0:
+                results[index].error = ErrorCode.invalid_claim_head_params['desc']
+                continue
+            try:
+                public_key = self.__key_cache.get_public_key(payload.iss, head.kid)
+            except SDKException as e:
+                results[index].error = e.args[1]
+                continue
+            if public_key == '':
+                results[index].error = ErrorCode.other_error(f'public key {head.kid} is not found.')['desc']
+                continue
+            entries.append(([public_key], 1, msg, [signature]))
+            indexes.append(index)
+        for index, verified in zip(indexes, verify_signature_entries(entries, self.__max_workers, self.__chunk_size)):
+            results[index].signature = verified
+
+    def __check_blk_proofs(self, claims: list, results: List[ClaimValidationResult], is_big_endian: bool):
+        proofs = list()
+        for index, _, _, _, _, blk_proof in claims:
+            if len(blk_proof) == 0:
+                continue
+            if blk_proof.get('Type', '') != 'MerkleProof' or not isinstance(blk_proof.get('BlockHeight'), int):
+                results[index].blk_proof = False
+                continue
+            proofs.append((index, blk_proof))
+        blocks = self.__map(self.__get_block, list(dict.fromkeys(proof['BlockHeight'] for _, proof in proofs)))
+        for index, blk_proof in proofs:
+            block = blocks[blk_proof['BlockHeight']]
+            if isinstance(block, SDKException):
+                results[index].error = block.args[1]
+                continue
+            results[index].blk_proof = BlockchainProof.validate_proof_in_block(
+                blk_proof.get('TxnHash', ''), blk_proof.get('Nodes', list()), blk_proof.get('MerkleRoot', ''), block,
+                is_big_endian)
+
+    def __check_status(self, claims: list, results: List[ClaimValidationResult]):
+        records = dict()
+        for index, _, payload, _, _, _ in claims:
+            clm_rev = payload.clm_rev if isinstance(payload.clm_rev, dict) else dict()
+            if clm_rev.get('typ', '') == 'AttestContract':
+                records[index] = (clm_rev.get('addr', ''), payload.jti)
+        status = self.__map(self.__get_status, list(dict.fromkeys(records.values())))
+        for index, record in records.items():
+            if isinstance(status[record], SDKException):
+                results[index].error = status[record].args[1]
+            else:
+                results[index].revoked = not status[record]
+
+    def validate_many(self, b64_claims: Iterable[str], check_blk_proof: bool = True, check_status: bool = False,
+                      is_big_endian: bool = True, now: float = None) -> List[ClaimValidationResult]:
+        """
+        This interface is used to validate the signature, expiration and blockchain proof of the base64 encoded
+        claims, and return the results in the same order as the claims.
+
+        :param check_blk_proof: whether to validate the blockchain proofs with the blocks of them.
+        :param check_status: whether to query the claim record contract to find out the revoked claims.
+        :param now: the timestamp which the expiration is compared with, None means current time.
+        """
+        if now is None:
+            now = time.time()
+        results = list()
+        claims = list()
+        for index, b64_claim in enumerate(b64_claims):
+            result = ClaimValidationResult()
+            results.append(result)
+            try:
+                head, payload, msg, signature, blk_proof = self.__parse(b64_claim)
+            except SDKException as e:
+                result.error = e.args[1]
+                continue
+            result.claim_id = payload.jti
+            result.iss = payload.iss
+            result.kid = head.kid
+            result.expired = payload.exp <= now
+            claims.append((index, head, payload, msg, signature, blk_proof))
+        self.__check_signatures(claims, results)
+        if check_blk_proof:
+            self.__check_blk_proofs(claims, results, is_big_endian)
+        if check_status:
+            self.__check_status(claims, results)
+        return results
+
+    def validate(self, b64_claim: str, check_blk_proof: bool = True, check_status: bool = False,
+                 is_big_endian: bool = True, now: float = None) -> ClaimValidationResult:
+        return self.validate_many([b64_claim], check_blk_proof, check_status, is_big_endian, now)[0]
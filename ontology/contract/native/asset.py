@@ -16,7 +16,7 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from typing import Union
+from typing import List, Union, Sequence
 
 from ontology.common.address import Address
 from ontology.utils.neo import NeoData
@@ -24,8 +24,9 @@ from ontology.account.account import Account
 from ontology.core.transaction import Transaction, TxType
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
-from ontology.vm.build_vm import build_native_invoke_code
 from ontology.core.invoke_transaction import InvokeTransaction
+from ontology.core.batch_transaction import new_transfer_tx_batch
+from ontology.vm.build_vm import build_native_invoke_code, build_native_invoke_code_template
 
 
 class Asset(object):
@@ -34,6 +35,7 @@ class Asset(object):
         self._version = b'\x00'
         self._contract_address = b''
         self._invoke_address = b''
+        self.__transfer_template = None
 
     @property
     def contract_address(self) -> Address:
@@ -73,6 +75,22 @@ class Asset(object):
         invoke_code = build_native_invoke_code(self._invoke_address, self._version, 'transfer', state)
         return InvokeTransaction(Address.b58decode(payer), gas_price, gas_limit, invoke_code)
 
+    def new_transfer_tx_batch(self, from_list: Sequence[Union[str, Address]], to_list: Sequence[Union[str, Address]],
+                              amount_list: Sequence[int], payer: Union[str, Address], gas_price: int, gas_limit: int,
+                              nonce: int = None) -> List[InvokeTransaction]:
+        """
+        This interface is used to generate the transfer transactions of the columnar (from, to, amount) lists,
+        the invoke codes are generated from one shared template.
+
+        :param nonce: the nonce of the first transaction, and the nonce of the next transactions increase by one.
+         If it is None, random nonces are used.
+        """
+        if self.__transfer_template is None:
+            self.__transfer_template = build_native_invoke_code_template(self._invoke_address, self._version,
+                                                                         'transfer', 3)
+        return new_transfer_tx_batch(self.__transfer_template.build, from_list, to_list, amount_list, payer,
+                                     gas_price, gas_limit, nonce)
+
     def new_approve_tx(self, approver: Union[str, Address], spender: Union[str, Address], amount: int,
                        payer: Union[str, Address], gas_price: int, gas_limit: int) -> Transaction:
         """
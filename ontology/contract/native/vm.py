@@ -16,12 +16,16 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+from typing import Union, Iterable, Iterator
+
 from ontology.contract.native.ont import Ont
 from ontology.contract.native.ong import Ong
 from ontology.contract.native.ontid import OntId
 from ontology.contract.native.aio_ont import AioOnt
 from ontology.contract.native.aio_ong import AioOng
 from ontology.contract.native.aio_ontid import AioOntId
+from ontology.contract.neo.oep4 import Oep4
+from ontology.utils.scan import ScanCheckpoint, BatchMapper, scan
 
 
 class NativeVm(object):
@@ -46,3 +50,38 @@ class NativeVm(object):
     def ont_id(self):
         return OntId(self.__sdk)
 
+    def balance_of_many(self, addresses: Iterable[str], token: Union[str, Oep4] = None, batch_size: int = 100,
+                        concurrency: int = 8, checkpoint: ScanCheckpoint = None) -> Iterator[tuple]:
+        """
+        This interface is used to get the ONT, ONG and optional OEP4 token balances of many addresses.
+        The (address, ont, ong, token) tuples are yielded in the order of the addresses, and token is None
+        if no token contract is given. The balances are queried in batch requests if the default network supports
+        them, otherwise by concurrent requests.
+
+        :param addresses: an iterable of base58 encoded account address.
+        :param token: the hexadecimal contract address or the Oep4 object of an OEP4 token.
+        :param batch_size: the number of addresses queried in one batch.
+        :param concurrency: the number of concurrent requests when batch request is not supported.
+        :param checkpoint: a ScanCheckpoint object which allows to resume an interrupted scan.
+        """
+        network = self.__sdk.default_network
+        if isinstance(token, str):
+            token = Oep4(token, self.__sdk)
+        balance_mapper = BatchMapper(network.get_balance, getattr(network, 'get_balance_batch', None), concurrency)
+        token_mapper = None if token is None else token.new_balance_of_mapper(concurrency)
+
+        def query(chunk: list) -> list:
+            balance_list = balance_mapper(chunk)
+            if token_mapper is None:
+                token_balance_list = [None] * len(chunk)
+            else:
+                token_balance_list = token._balance_of_chunk(chunk, token_mapper)
+            return list(zip(balance_list, token_balance_list))
+
+        try:
+            for address, (balance, token_balance) in scan(addresses, query, batch_size, checkpoint):
+                yield address, balance.get('ONT', 0), balance.get('ONG', 0), token_balance
+        finally:
+            balance_mapper.close()
+            if token_mapper is not None:
+                token_mapper.close()
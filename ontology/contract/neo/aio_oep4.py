@@ -16,10 +16,11 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from typing import Union
+from typing import Union, Iterable
 
 from ontology.utils.neo import NeoData
 from ontology.utils.event import Event
+from ontology.utils.scan import ScanCheckpoint, aio_scan
 from ontology.common.address import Address
 from ontology.contract.neo.oep4 import Oep4
 from ontology.account.account import Account
@@ -81,11 +82,16 @@ class AioOep4(Oep4):
         """
         tx = self.new_balance_of_tx(owner)
         result = await self._sdk.default_aio_network.send_raw_transaction_pre_exec(tx)
-        try:
-            balance = NeoData.to_int(result['Result'])
-        except SDKException:
-            balance = 0
-        return balance
+        return self._parse_balance(result)
+
+    async def balance_of_many(self, owners: Iterable[str], concurrency: int = 16, checkpoint: ScanCheckpoint = None,
+                              checkpoint_interval: int = 100):
+        """
+        This interface is used to get the account balances of many owners asynchronously, with at most concurrency
+        requests in flight. The (owner, balance) pairs are yielded in the order of the owners.
+        """
+        async for owner, balance in aio_scan(owners, self.balance_of, concurrency, checkpoint, checkpoint_interval):
+            yield owner, balance
 
     async def transfer(self, from_acct: Account, to_address: Union[str, Address], amount: int, payer: Account,
                        gas_price: int, gas_limit: int) -> str:
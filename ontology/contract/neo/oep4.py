@@ -16,22 +16,29 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from typing import Union
+from typing import Union, Iterable, Iterator, Tuple, List, Sequence
 
 from ontology.utils.neo import NeoData
 from ontology.utils.event import Event
+from ontology.utils.scan import ScanCheckpoint, BatchMapper, scan
 from ontology.contract.neo.oep import Oep
 from ontology.common.address import Address
 from ontology.account.account import Account
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
+from ontology.vm.op_code import PACK, APPCALL
+from ontology.vm.build_vm import InvokeCodeTemplate
 from ontology.core.invoke_transaction import InvokeTransaction
+from ontology.core.batch_transaction import new_transfer_tx_batch
+from ontology.contract.neo.params_builder import NeoParamsBuilder
 from ontology.contract.neo.invoke_function import NeoInvokeFunction
+from ontology.utils.transaction import ensure_bytearray_contract_address
 
 
 class Oep4(Oep):
     def __init__(self, hex_contract_address: str = '', sdk=None):
         super().__init__(hex_contract_address, sdk)
+        self.__transfer_template = None
 
     def __new_token_setting_tx(self, func_name: str) -> InvokeTransaction:
         func = NeoInvokeFunction(func_name)
@@ -138,12 +145,35 @@ class Oep4(Oep):
         """
         tx = self.new_balance_of_tx(owner)
         result = self._sdk.default_network.send_raw_transaction_pre_exec(tx)
+        return self._parse_balance(result)
+
+    @staticmethod
+    def _parse_balance(result: dict) -> int:
         try:
             balance = NeoData.to_int(result['Result'])
         except SDKException:
             balance = 0
         return balance
 
+    def new_balance_of_mapper(self, concurrency: int = 8) -> BatchMapper:
+        network = self._sdk.default_network
+        batch_func = getattr(network, 'send_raw_transaction_pre_exec_batch', None)
+        return BatchMapper(network.send_raw_transaction_pre_exec, batch_func, concurrency)
+
+    def _balance_of_chunk(self, owners: list, mapper: BatchMapper) -> List[int]:
+        result_list = mapper([self.new_balance_of_tx(owner) for owner in owners])
+        return [self._parse_balance(result) for result in result_list]
+
+    def balance_of_many(self, owners: Iterable[str], batch_size: int = 100, concurrency: int = 8,
+                        checkpoint: ScanCheckpoint = None) -> Iterator[Tuple[str, int]]:
+        """
+        This interface is used to get the account balances of many owners, the (owner, balance) pairs are yielded
+        in the order of the owners. The balances are pre-executed in batch requests if the default network supports
+        them, otherwise by concurrent requests.
+        """
+        with self.new_balance_of_mapper(concurrency) as mapper:
+            yield from scan(owners, lambda chunk: self._balance_of_chunk(chunk, mapper), batch_size, checkpoint)
+
     def new_transfer_tx(self, from_address: Union[str, Address], to_address: Union[str, Address], amount: int,
                         payer: Union[str, Address], gas_price: int, gas_limit: int) -> InvokeTransaction:
         """
@@ -155,6 +185,32 @@ class Oep4(Oep):
         tx = InvokeTransaction(payer, gas_price, gas_limit, params)
         return tx
 
+    def __get_transfer_template(self) -> InvokeCodeTemplate:
+        contract_address = bytes(ensure_bytearray_contract_address(self._contract_address))
+        if self.__transfer_template is None or self.__transfer_template[0] != contract_address:
+            builder = NeoParamsBuilder()
+            builder.push_int(3)
+            builder.emit(PACK)
+            builder.push_bytearray(b'transfer')
+            builder.emit_push_call(contract_address)
+            self.__transfer_template = (contract_address, InvokeCodeTemplate([b'', b'', b'', builder.to_bytes()]))
+        return self.__transfer_template[1]
+
+    def new_transfer_tx_batch(self, from_list: Sequence[Union[str, Address]], to_list: Sequence[Union[str, Address]],
+                              amount_list: Sequence[int], payer: Union[str, Address], gas_price: int, gas_limit: int,
+                              nonce: int = None) -> List[InvokeTransaction]:
+        """
+        This interface is used to generate the transfer transactions of the columnar (from, to, amount) lists,
+        the invoke codes are generated from one shared template.
+
+        :param nonce: the nonce of the first transaction, and the nonce of the next transactions increase by one.
+         If it is None, random nonces are used.
+        """
+        template = self.__get_transfer_template()
+        return new_transfer_tx_batch(lambda from_address, to_address, amount: template.build(amount, to_address,
+                                                                                               from_address),
+                                     from_list, to_list, amount_list, payer, gas_price, gas_limit, nonce)
+
     def transfer(self, from_acct: Account, to_address: Union[str, Address], amount: int, payer: Account, gas_price: int,
                  gas_limit: int) -> str:
         """
@@ -0,0 +1,150 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Union, Callable, Sequence
+
+from ontology.core.sig import Sig
+from ontology.common.address import Address
+from ontology.account.account import Account
+from ontology.core.transaction import Transaction, TX_MAX_SIG_SIZE
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.crypto.signature_handler import verify_signature_entries, DEFAULT_VERIFY_CHUNK_SIZE
+from ontology.core.invoke_transaction import InvokeTransaction
+
+MAX_NONCE = 0xFFFFFFFF
+DEFAULT_SIGN_CHUNK_SIZE = 256
+
+_worker_accounts = list()
+
+
+def new_transfer_tx_batch(build_code: Callable[[Address, Address, int], bytearray], from_list: Sequence,
+                          to_list: Sequence, amount_list: Sequence[int], payer: Union[str, Address],
+                          gas_price: int, gas_limit: int, nonce: int = None) -> List[InvokeTransaction]:
+    """
+    This interface is used to generate the transfer transactions of the columnar (from, to, amount) lists.
+
+    :param build_code: a function which generates the invoke code of a transfer.
+    :param nonce: the nonce of the first transaction, and the nonce of the next transactions increase by one.
+     If it is None, random nonces are used.
+    """
+    if not len(from_list) == len(to_list) == len(amount_list):
+        raise SDKException(ErrorCode.param_err('the length of from, to and amount lists should be equal.'))
+    payer = Address.b58decode(payer).to_bytes()
+    addresses = dict()
+
+    def decode(address: Union[str, Address]) -> Address:
+        if not isinstance(address, str):
+            return Address.b58decode(address)
+        decoded = addresses.get(address)
+        if decoded is None:
+            decoded = addresses[address] = Address.b58decode(address)
+        return decoded
+
+    tx_list = list()
+    for index, (from_address, to_address, amount) in enumerate(zip(from_list, to_list, amount_list)):
+        if amount <= 0:
+            raise SDKException(ErrorCode.other_error('the amount should be greater than zero.'))
+        code = build_code(decode(from_address), decode(to_address), amount)
+        tx = InvokeTransaction(payer, gas_price, gas_limit, code)
+        if nonce is not None:
+            tx.nonce = (nonce + index) % (MAX_NONCE + 1)
+        tx_list.append(tx)
+    return tx_list
+
+
+def _init_sign_worker(key_list: List[tuple]):
+    global _worker_accounts
+    _worker_accounts = [Account(private_key, scheme) for private_key, scheme in key_list]
+
+
+def _sign_chunk(chunk: List[tuple], accounts: List[Account] = None) -> List[List[bytes]]:
+    if accounts is None:
+        accounts = _worker_accounts
+    return [[accounts[index].generate_signature(tx_hash) for index in indexes] for tx_hash, indexes in chunk]
+
+
+def sign_transaction_batch(tx_list: List[Transaction], signers: Union[List[Account], List[List[Account]]],
+                           max_workers: int = None, chunk_size: int = DEFAULT_SIGN_CHUNK_SIZE) -> List[Transaction]:
+    """
+    This interface is used to sign the transactions in a process pool, the signatures are appended to the
+    transactions in the same order as sign_transaction.
+    Note that the raw private keys of the signers are sent to the worker processes, use max_workers=0 to
+    keep them in current process.
+
+    :param signers: a list of accounts which sign every transaction, or a list of accounts for each transaction.
+    :param max_workers: the number of processes, 0 means signing in current process,
+     and None means the number of processors.
+    :param chunk_size: the number of transactions signed by a process at a time.
+    """
+    if len(signers) != 0 and isinstance(signers[0], Account):
+        signers = [signers] * len(tx_list)
+    if len(signers) != len(tx_list):
+        raise SDKException(ErrorCode.param_err('the length of signer list should be equal to transaction list.'))
+    accounts = list()
+    account_index = dict()
+    tasks = list()
+    for tx, tx_signers in zip(tx_list, signers):
+        indexes = list()
+        for signer in tx_signers:
+            address = signer.get_address_bytes()
+            if address not in account_index:
+                account_index[address] = len(accounts)
+                accounts.append(signer)
+            index = account_index[address]
+            if index not in indexes:
+                indexes.append(index)
+        if tx.sig_list is None:
+            tx.sig_list = []
+        if len(tx.sig_list) + len(indexes) > TX_MAX_SIG_SIZE:
+            raise SDKException(ErrorCode.param_err('the number of transaction signatures should not be over 16'))
+        tasks.append((tx.hash256(), indexes))
+    chunk_size = max(chunk_size, 1)
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+    if max_workers == 0 or len(chunks) <= 1:
+        results = [_sign_chunk(item, accounts) for item in chunks]
+    else:
+        key_list = [(acct.get_private_key_bytes(), acct.get_signature_scheme()) for acct in accounts]
+        with ProcessPoolExecutor(max_workers, initializer=_init_sign_worker, initargs=(key_list,)) as executor:
+            results = list(executor.map(_sign_chunk, chunks))
+    tx_iter = iter(zip(tx_list, tasks))
+    for result in results:
+        for sig_data_list in result:
+            tx, (_, indexes) = next(tx_iter)
+            for index, sig_data in zip(indexes, sig_data_list):
+                tx.sig_list.append(Sig([accounts[index].get_public_key_bytes()], 1, [sig_data]))
+    return tx_list
+
+
+def verify_transaction_batch(tx_list: List[Transaction], max_workers: int = None,
+                             chunk_size: int = DEFAULT_VERIFY_CHUNK_SIZE) -> List[List[bool]]:
+    """
+    This interface is used to verify the signatures of the transactions in a process pool,
+    and return the results of Sig entries for each transaction.
+
+    :param max_workers: the number of processes, 0 means verifying in current process,
+     and None means the number of processors.
+    :param chunk_size: the number of Sig entries verified by a process at a time.
+    """
+    entries = list()
+    for tx in tx_list:
+        tx_hash = tx.hash256()
+        entries.extend((sig.public_keys, sig.m, tx_hash, sig.sig_data) for sig in tx.sig_list)
+    results = iter(verify_signature_entries(entries, max_workers, chunk_size))
+    return [[next(results) for _ in tx.sig_list] for tx in tx_list]
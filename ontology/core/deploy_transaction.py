@@ -23,7 +23,7 @@ from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 
 from ontology.common.address import Address
-from ontology.io.binary_writer import BinaryWriter
+from ontology.io.codec import BufferWriter
 from ontology.core.transaction import Transaction, TxType
 from ontology.vm.vm_type import VmType
 
@@ -45,7 +45,7 @@ class DeployTransaction(Transaction):
         self.__email = email
         self.__description = description
 
-    def serialize_exclusive_data(self, writer: BinaryWriter):
+    def serialize_exclusive_data(self, writer: BufferWriter):
         writer.write_var_bytes(self.__code)
         writer.write_byte(self.__vm_type.value)
         writer.write_var_str(self.__name)
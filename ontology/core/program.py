@@ -21,17 +21,20 @@ from typing import List
 
 from ontology.core.base_params_builder import BaseParamsBuilder
 from ontology.crypto.key_type import KeyType
-from ontology.utils.utils import bytes_reader
-from ontology.io.binary_reader import BinaryReader
-from ontology.io.binary_writer import BinaryWriter
 from ontology.core.program_info import ProgramInfo
-from ontology.io.memory_stream import StreamManager
+from ontology.io.codec import BufferReader, UINT8, UINT16, UINT32
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 from ontology.vm.op_code import PUSHBYTES75, PUSHBYTES1, PUSHDATA1, PUSHDATA2, PUSHDATA4, CHECKSIG, CHECKMULTISIG, PUSH1
 
 MULTI_SIG_MAX_PUBKEY_SIZE = 16
 
+OP_PUSHBYTES1 = int.from_bytes(PUSHBYTES1, 'little')
+OP_PUSHBYTES75 = int.from_bytes(PUSHBYTES75, 'little')
+OP_PUSHDATA1 = int.from_bytes(PUSHDATA1, 'little')
+OP_PUSHDATA2 = int.from_bytes(PUSHDATA2, 'little')
+OP_PUSHDATA4 = int.from_bytes(PUSHDATA4, 'little')
+
 
 class ProgramBuilder(object):
 
@@ -50,44 +53,32 @@ class ProgramBuilder(object):
         return builder.to_bytes()
 
     @staticmethod
-    def push_bytes(data):
-        ms = StreamManager.get_stream()
-        writer = BinaryWriter(ms)
-        if len(data) == 0:
+    def push_bytes(data) -> bytearray:
+        data_len = len(data)
+        if data_len == 0:
             raise ValueError("push data error: data is null")
-        if len(data) <= int.from_bytes(PUSHBYTES75, 'little') + 1 - int.from_bytes(PUSHBYTES1, 'little'):
-            num = len(data) + int.from_bytes(PUSHBYTES1, 'little') - 1
-            writer.write_byte(num)
-        elif len(data) < 0x100:
-            writer.write_byte(PUSHDATA1)
-            writer.write_uint8(len(data))
-        elif len(data) < 0x10000:
-            writer.write_byte(PUSHDATA2)
-            writer.write_uint16(len(data))
+        if data_len <= OP_PUSHBYTES75 + 1 - OP_PUSHBYTES1:
+            code = bytearray(UINT8.pack(data_len + OP_PUSHBYTES1 - 1))
+        elif data_len < 0x100:
+            code = bytearray(PUSHDATA1 + UINT8.pack(data_len))
+        elif data_len < 0x10000:
+            code = bytearray(PUSHDATA2 + UINT16.pack(data_len))
         else:
-            writer.write_byte(PUSHDATA4)
-            writer.write_uint32(len(data))
-        writer.write_bytes(data)
-        ms.flush()
-        res = ms.hexlify()
-        StreamManager.release_stream(ms)
-        res = bytes_reader(res)
-        return res
+            code = bytearray(PUSHDATA4 + UINT32.pack(data_len))
+        code += data
+        return code
 
     @staticmethod
-    def read_bytes(reader: BinaryReader):
+    def read_bytes(reader: BufferReader):
         code = reader.read_byte()
-        if code == int.from_bytes(PUSHDATA4, 'little'):
-            temp = reader.read_uint32()
-            key_len = temp
-        elif code == int.from_bytes(PUSHDATA2, 'little'):
-            temp = reader.read_uint16()
-            key_len = int(temp)
-        elif code == int.from_bytes(PUSHDATA1, 'little'):
-            temp = reader.read_uint8()
-            key_len = int(temp)
-        elif int.from_bytes(PUSHBYTES75, 'little') >= code >= int.from_bytes(PUSHBYTES1, 'little'):
-            key_len = code - int.from_bytes(PUSHBYTES1, 'little') + 1
+        if code == OP_PUSHDATA4:
+            key_len = reader.read_uint32()
+        elif code == OP_PUSHDATA2:
+            key_len = reader.read_uint16()
+        elif code == OP_PUSHDATA1:
+            key_len = reader.read_uint8()
+        elif OP_PUSHBYTES75 >= code >= OP_PUSHBYTES1:
+            key_len = code - OP_PUSHBYTES1 + 1
         else:
             key_len = 0
         res = reader.read_bytes(key_len)
@@ -137,8 +128,7 @@ class ProgramBuilder(object):
 
     @staticmethod
     def get_param_info(program: bytes):
-        ms = StreamManager.get_stream(program)
-        reader = BinaryReader(ms)
+        reader = BufferReader(program)
         param_info = []
         while True:
             try:
@@ -153,8 +143,7 @@ class ProgramBuilder(object):
         length = len(program)
         end = program[length - 1]
         temp = program[:length - 1]
-        ms = StreamManager.get_stream(temp)
-        reader = BinaryReader(ms)
+        reader = BufferReader(temp)
         info = ProgramInfo()
         if end == int.from_bytes(CHECKSIG, 'little'):
             pub_keys = ProgramBuilder.read_bytes(reader)
@@ -20,10 +20,7 @@ from typing import List
 from ontology.core.program import ProgramBuilder
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
-from ontology.io.binary_reader import BinaryReader
-from ontology.io.binary_writer import BinaryWriter
-from ontology.io.memory_stream import StreamManager
-from ontology.utils.utils import bytes_reader
+from ontology.io.codec import BufferReader, BufferWriter, pooled_writer
 
 
 class Sig(object):
@@ -51,7 +48,7 @@ class Sig(object):
     def sig_data(self, sig_data):
         self.__sig_data = sig_data
 
-    def serialize(self) -> bytes:
+    def serialize_to(self, writer: BufferWriter):
         invoke_script = ProgramBuilder.program_from_params(self.__sig_data)
         if len(self.public_keys) == 0:
             raise SDKException(ErrorCode.other_error('Public key in sig is empty.'))
@@ -60,24 +57,21 @@ class Sig(object):
             verification_script = ProgramBuilder.program_from_pubkey(self.public_keys[0])
         else:
             verification_script = ProgramBuilder.program_from_multi_pubkey(self.m, self.public_keys)
-        ms = StreamManager.get_stream()
-        writer = BinaryWriter(ms)
         writer.write_var_bytes(invoke_script)
         writer.write_var_bytes(verification_script)
-        ms.flush()
-        res = ms.hexlify()
-        res = bytes_reader(res)
-        StreamManager.release_stream(ms)
-        return res
+
+    def serialize(self) -> bytearray:
+        with pooled_writer() as writer:
+            self.serialize_to(writer)
+            return bytearray(writer.to_bytes())
 
     @staticmethod
     def deserialize_from(sig_bytes: bytes):
-        ms = StreamManager.get_stream(sig_bytes)
-        reader = BinaryReader(ms)
+        reader = BufferReader(sig_bytes)
         return Sig.deserialize(reader)
 
     @staticmethod
-    def deserialize(reader: BinaryReader):
+    def deserialize(reader: BufferReader):
         invocation_script = reader.read_var_bytes()
         verification_script = reader.read_var_bytes()
         sig = Sig()
@@ -27,11 +27,10 @@ from ontology.common.address import Address
 from ontology.core.program import ProgramBuilder
 from ontology.core.sig import Sig
 from ontology.crypto.digest import Digest
+from ontology.crypto.signature_handler import verify_signature_entries
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
-from ontology.io.binary_reader import BinaryReader
-from ontology.io.binary_writer import BinaryWriter
-from ontology.io.memory_stream import StreamManager
+from ontology.io.codec import BufferReader, pooled_writer
 
 
 class TxType(Enum):
@@ -47,6 +46,8 @@ class TxType(Enum):
 
 TX_MAX_SIG_SIZE = 16
 
+UNSIGNED_EXCLUSIVE_FIELDS = ('sig_list',)
+
 
 class Transaction(object):
     def __init__(self, version=0, tx_type: TxType or int = None, gas_price: int = 0, gas_limit: int = 0,
@@ -79,6 +80,26 @@ class Transaction(object):
             sig_list = list()
         self.sig_list = sig_list
 
+    def __setattr__(self, key, value):
+        super().__setattr__(key, value)
+        if key not in UNSIGNED_EXCLUSIVE_FIELDS and not key.startswith('_Transaction__'):
+            self.__unsigned_cache = None
+
+    @staticmethod
+    def __snapshot(value) -> bytes or None:
+        if value is None:
+            return None
+        return bytes(value)
+
+    def __get_unsigned_cache(self) -> list or None:
+        cache = self.__dict__.get('_Transaction__unsigned_cache')
+        if cache is None:
+            return None
+        if cache[1] != self.payload or cache[2] != self.attributes:
+            self.__unsigned_cache = None
+            return None
+        return cache
+
     def __iter__(self):
         data = dict()
         data['version'] = self.version
@@ -96,48 +117,54 @@ class Transaction(object):
             yield (key, value)
 
     def serialize_unsigned(self) -> bytes or str:
-        ms = StreamManager.get_stream()
-        writer = BinaryWriter(ms)
-        writer.write_uint8(self.version)
-        writer.write_uint8(self.tx_type)
-        writer.write_uint32(self.nonce)
-        writer.write_uint64(self.gas_price)
-        writer.write_uint64(self.gas_limit)
-        writer.write_bytes(self.payer)
-        self.serialize_exclusive_data(writer)
-        if self.payload is not None and len(self.payload) != 0:
-            writer.write_var_bytes(bytes(self.payload))
-        writer.write_var_int(len(self.attributes))
-        ms.flush()
-        hex_bytes = ms.to_bytes()
-        StreamManager.release_stream(ms)
-        return hex_bytes
+        """
+        This interface is used to serialize the transaction without signatures. The result is cached until
+        a field of the transaction is changed.
+        """
+        cache = self.__get_unsigned_cache()
+        if cache is not None:
+            return cache[0]
+        with pooled_writer() as writer:
+            writer.write_uint8(self.version)
+            writer.write_uint8(self.tx_type)
+            writer.write_uint32(self.nonce)
+            writer.write_uint64(self.gas_price)
+            writer.write_uint64(self.gas_limit)
+            writer.write_bytes(self.payer)
+            self.serialize_exclusive_data(writer)
+            if self.payload is not None and len(self.payload) != 0:
+                writer.write_var_bytes(self.payload)
+            writer.write_var_int(len(self.attributes))
+            tx_bytes = writer.to_bytes()
+        self.__unsigned_cache = [tx_bytes, self.__snapshot(self.payload), self.__snapshot(self.attributes), None]
+        return tx_bytes
 
     def serialize_exclusive_data(self, writer):
         pass
 
     def hash256_explorer(self) -> str:
-        tx_serial = self.serialize_unsigned()
-        digest = Digest.hash256(tx_serial)
+        digest = self.hash256()
         if not isinstance(digest, bytes):
             raise SDKException(ErrorCode.require_bytes_params)
         return bytes.hex(digest[::-1])
 
     def hash256(self, is_hex: bool = False) -> bytes or str:
         tx_serial = self.serialize_unsigned()
-        digest = Digest.hash256(tx_serial, is_hex)
-        return digest
+        cache = self.__unsigned_cache
+        if cache[3] is None:
+            cache[3] = Digest.hash256(tx_serial)
+        if is_hex:
+            return cache[3].hex()
+        return cache[3]
 
     def serialize(self, is_hex: bool = False) -> bytes or str:
-        ms = StreamManager.get_stream()
-        writer = BinaryWriter(ms)
-        writer.write_bytes(self.serialize_unsigned())
-        writer.write_var_int(len(self.sig_list))
-        for sig in self.sig_list:
-            writer.write_bytes(sig.serialize())
-        ms.flush()
-        bytes_tx = ms.to_bytes()
-        StreamManager.release_stream(ms)
+        unsigned_tx = self.serialize_unsigned()
+        with pooled_writer() as writer:
+            writer.write_bytes(unsigned_tx)
+            writer.write_var_int(len(self.sig_list))
+            for sig in self.sig_list:
+                sig.serialize_to(writer)
+            bytes_tx = writer.to_bytes()
         if is_hex:
             return bytes_tx.hex()
         else:
@@ -145,8 +172,7 @@ class Transaction(object):
 
     @staticmethod
     def deserialize_from(bytes_tx: bytes):
-        ms = StreamManager.get_stream(bytes_tx)
-        reader = BinaryReader(ms)
+        reader = BufferReader(bytes_tx)
         tx = Transaction()
         tx.version = reader.read_uint8()
         tx.tx_type = reader.read_uint8()
@@ -156,7 +182,7 @@ class Transaction(object):
         tx.payer = reader.read_bytes(20)
         tx.payload = reader.read_var_bytes()
         attribute_len = reader.read_var_int()
-        if attribute_len is 0:
+        if attribute_len == 0:
             tx.attributes = bytearray()
         sig_len = reader.read_var_int()
         tx.sig_list = list()
@@ -174,6 +200,15 @@ class Transaction(object):
             sig = Sig([signer.get_public_key_bytes()], 1, [sig_data])
             self.sig_list.append(sig)
 
+    def verify_signatures(self) -> List[bool]:
+        """
+        This interface is used to verify the signatures of the transaction, and return a result for each Sig entry.
+        A multi signature entry is verified if m signatures are generated by different public keys of the entry.
+        """
+        tx_hash = self.hash256()
+        entries = [(sig.public_keys, sig.m, tx_hash, sig.sig_data) for sig in self.sig_list]
+        return verify_signature_entries(entries, max_workers=0)
+
     def add_sign_transaction(self, signer: Account):
         """
         This interface is used to add signature into the transaction.
@@ -16,72 +16,119 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from ecdsa import (
-    util,
-    keys,
-    NIST256p,
-    VerifyingKey,
-    ellipticcurve,
-    numbertheory
-)
-
-from hashlib import sha256
+from functools import lru_cache
+from typing import List, Union, Sequence
+from concurrent.futures import ProcessPoolExecutor
 
+from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.asymmetric import utils
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
 
+from ontology.crypto.curve import Curve
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 from ontology.crypto.signature_scheme import SignatureScheme
 
 
+PUBLIC_KEY_CACHE_SIZE = 4096
+DEFAULT_VERIFY_CHUNK_SIZE = 512
+
+SCHEME_HASH_ALGORITHMS = {
+    SignatureScheme.SHA224withECDSA: hashes.SHA224,
+    SignatureScheme.SHA256withECDSA: hashes.SHA256,
+    SignatureScheme.SHA384withECDSA: hashes.SHA384,
+}
+
+
+def _get_hash_algorithm(scheme: SignatureScheme):
+    hash_algorithm = SCHEME_HASH_ALGORITHMS.get(scheme)
+    if hash_algorithm is None:
+        raise SDKException(ErrorCode.other_error('Invalid signature scheme.'))
+    return hash_algorithm
+
+
 class SignatureHandler(object):
-    def __init__(self, scheme: SignatureScheme):
+    def __init__(self, scheme: SignatureScheme, curve: Curve = Curve.P256):
         self.__scheme = scheme
+        self.__curve = curve
 
-    def generate_signature(self, pri_key: str, msg: bytes) -> str:
-        if self.__scheme == SignatureScheme.SHA224withECDSA:
-            private_key = ec.derive_private_key(int(pri_key, 16), ec.SECP224R1(), default_backend())
-            signature = private_key.sign(
-                msg,
-                ec.ECDSA(hashes.SHA224())
-            )
-        elif self.__scheme == SignatureScheme.SHA256withECDSA:
-            private_key = ec.derive_private_key(int(pri_key, 16), ec.SECP256R1(), default_backend())
-            signature = private_key.sign(
-                msg,
-                ec.ECDSA(hashes.SHA256())
-            )
-        elif self.__scheme == SignatureScheme.SHA384withECDSA:
-            private_key = ec.derive_private_key(int(pri_key, 16), ec.SECP384R1(), default_backend())
-            signature = private_key.sign(
-                msg,
-                ec.ECDSA(hashes.SHA384())
-            )
-        else:
-            raise SDKException(ErrorCode.other_error('Invalid signature scheme.'))
+    def get_private_key(self, pri_key: str) -> ec.EllipticCurvePrivateKey:
+        """
+        This interface is used to derive the private key object on the curve of the key, which is P-256 for
+        the keys of an Account whatever the hash of the signature scheme is, and the object can be reused to
+        generate signatures.
+        """
+        return ec.derive_private_key(int(pri_key, 16), self.__curve.value, default_backend())
+
+    def generate_signature(self, pri_key: Union[str, ec.EllipticCurvePrivateKey], msg: bytes) -> str:
+        hash_algorithm = _get_hash_algorithm(self.__scheme)
+        if isinstance(pri_key, str):
+            pri_key = self.get_private_key(pri_key)
+        signature = pri_key.sign(msg, ec.ECDSA(hash_algorithm()))
         sign = SignatureHandler.dsa_der_to_plain(signature)
         return sign
 
     @staticmethod
-    def verify_signature(public_key: bytes or str, msg: bytes, signature: bytes):
-        if isinstance(public_key, str):
-            public_key = bytes.fromhex(public_key)
-        if public_key.startswith(b'\x02') or public_key.startswith(b'\x03'):
-            public_key = SignatureHandler.uncompress_public_key(public_key)
-        elif public_key.startswith(b'\x04'):
-            pass
-        else:
-            raise SDKException(ErrorCode.unknown_asymmetric_key_type)
+    def verify_signature_by_key(public_key: ec.EllipticCurvePublicKey, msg: bytes, signature: bytes,
+                                scheme: SignatureScheme = SignatureScheme.SHA256withECDSA) -> bool:
+        """
+        This interface is used to verify a signature with a public key object, the message is hashed by the
+        hash algorithm of the signature scheme, e.g. SHA384 for SHA384withECDSA.
+        """
+        hash_algorithm = _get_hash_algorithm(scheme)
         if len(signature) == 65:
             signature = signature[1:]
-        vk = VerifyingKey.from_string(public_key, curve=NIST256p)
+        if len(signature) != 64:
+            return False
+        r = int.from_bytes(signature[:32], 'big')
+        s = int.from_bytes(signature[32:], 'big')
         try:
-            return vk.verify(signature, msg, hashfunc=sha256)
-        except (AssertionError, keys.BadSignatureError, keys.BadDigestError):
+            public_key.verify(utils.encode_dss_signature(r, s), msg, ec.ECDSA(hash_algorithm()))
+        except (InvalidSignature, ValueError):
+            return False
+        return True
+
+    @staticmethod
+    def verify_signature(public_key: bytes or str, msg: bytes, signature: bytes):
+        if isinstance(public_key, str):
+            public_key = bytes.fromhex(public_key)
+        return SignatureHandler.verify_signature_by_key(load_public_key(bytes(public_key)), msg, signature)
+
+    @staticmethod
+    def verify_multi_signature(public_keys: List[bytes], m: int, msg: bytes, sig_data: List[bytes]) -> bool:
+        """
+        This interface is used to verify a m-of-n signature, each of the first m signatures should be generated
+        by a different public key, and the order of signatures is not required to be the same as public keys.
+        """
+        if m <= 0 or m > len(public_keys) or len(sig_data) < m:
             return False
+        used = [False] * len(public_keys)
+        for signature in sig_data[:m]:
+            for index, public_key in enumerate(public_keys):
+                if not used[index] and _verify_by_public_key(public_key, msg, signature):
+                    used[index] = True
+                    break
+            else:
+                return False
+        return True
+
+    @staticmethod
+    def verify_many(items: Sequence[tuple], max_workers: int = None,
+                    chunk_size: int = DEFAULT_VERIFY_CHUNK_SIZE) -> List[bool]:
+        """
+        This interface is used to verify a list of (public_key, msg, signature) in a process pool,
+        and return the results in the same order as the items.
+        An item with an invalid public key is regarded as not verified instead of raising an exception.
+
+        :param max_workers: the number of processes, 0 means verifying in current process,
+         and None means the number of processors.
+        :param chunk_size: the number of items verified by a process at a time.
+        """
+        entries = [([public_key], 1, msg, [signature]) for public_key, msg, signature in items]
+        return verify_signature_entries(entries, max_workers, chunk_size)
 
     @staticmethod
     def dsa_der_to_plain(signature):
@@ -101,16 +148,60 @@ class SignatureHandler(object):
         :param public_key: compressed public key
         :return: uncompressed public key
         """
-        is_even = public_key.startswith(b'\x02')
-        x = util.string_to_number(public_key[1:])
-        curve = NIST256p.curve
-        order = NIST256p.order
-        p = curve.p()
-        alpha = (pow(x, 3, p) + (curve.a() * x) + curve.b()) % p
-        beta = numbertheory.square_root_mod_prime(alpha, p)
-        if is_even == bool(beta & 1):
-            y = p - beta
-        else:
-            y = beta
-        point = ellipticcurve.Point(curve, x, y, order)
-        return b''.join([util.number_to_string(point.x(), order), util.number_to_string(point.y(), order)])
+        point = load_public_key(bytes(public_key)).public_bytes(Encoding.X962, PublicFormat.UncompressedPoint)
+        return point[1:]
+
+
+@lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+def load_public_key(public_key: bytes) -> ec.EllipticCurvePublicKey:
+    """
+    This interface is used to parse a compressed or uncompressed P-256 public key, the parsed keys are cached.
+    """
+    if not public_key.startswith((b'\x02', b'\x03', b'\x04')):
+        raise SDKException(ErrorCode.unknown_asymmetric_key_type)
+    if public_key.startswith(b'\x04') and len(public_key) == 65:
+        pass
+    elif len(public_key) != 33:
+        raise SDKException(ErrorCode.unknown_asymmetric_key_type)
+    try:
+        return ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256R1(), public_key)
+    except ValueError as e:
+        raise SDKException(ErrorCode.other_error(e.args[0]))
+
+
+def _verify_by_public_key(public_key: Union[bytes, str], msg: bytes, signature: bytes) -> bool:
+    if isinstance(public_key, str):
+        public_key = bytes.fromhex(public_key)
+    try:
+        key = load_public_key(bytes(public_key))
+    except SDKException:
+        return False
+    return SignatureHandler.verify_signature_by_key(key, msg, signature)
+
+
+def _verify_chunk(chunk: List[tuple]) -> List[bool]:
+    return [SignatureHandler.verify_multi_signature(*entry) for entry in chunk]
+
+
+def verify_signature_entries(entries: Sequence[tuple], max_workers: int = None,
+                             chunk_size: int = DEFAULT_VERIFY_CHUNK_SIZE) -> List[bool]:
+    """
+    This interface is used to verify a list of (public_keys, m, msg, sig_data) in a process pool,
+    the entries are grouped by public keys so that each process parses a public key as few times as possible.
+    """
+    normalized = list()
+    for public_keys, m, msg, sig_data in entries:
+        public_keys = [bytes.fromhex(key) if isinstance(key, str) else bytes(key) for key in public_keys]
+        normalized.append((public_keys, m, bytes(msg), [bytes(signature) for signature in sig_data]))
+    order = sorted(range(len(normalized)), key=lambda i: normalized[i][0])
+    chunk_size = max(chunk_size, 1)
+    chunks = [[normalized[i] for i in order[j:j + chunk_size]] for j in range(0, len(order), chunk_size)]
+    if max_workers == 0 or len(chunks) <= 1:
+        results = [_verify_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers) as executor:
+            results = list(executor.map(_verify_chunk, chunks))
+    verified = [False] * len(normalized)
+    for index, result in zip(order, (item for result in results for item in result)):
+        verified[index] = result
+    return verified
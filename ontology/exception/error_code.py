@@ -79,6 +79,12 @@ class ErrorCode:
     def connect_timeout(url: str):
         return ErrorCode.get_error(60002, f'Network Error, ConnectionError: {url}')
 
+    no_available_node = get_error.__func__(60003, 'Network Error, no available node in the pool.')
+
+    @staticmethod
+    def batch_not_supported(msg: str):
+        return ErrorCode.get_error(60004, f'Network Error, batch request is not supported: {msg}')
+
     hd_index_out_of_range = get_error.__func__(70001, 'Crypto Error, index is out of range: 0 <= index <= 2**32 - 1')
     hd_root_key_not_master_key = get_error.__func__(70002,
                                                     "Crypto Error, root_key must be a master key if m is the first element of the path")
@@ -200,3 +206,6 @@ class ErrorCode:
     @staticmethod
     def other_error(msg: str) -> dict:
         return ErrorCode.get_error(59000, "Other Error, " + msg)
+
+
+CONNECT_ERROR_CODES = (ErrorCode.connect_err('')['error'], ErrorCode.connect_timeout('')['error'])
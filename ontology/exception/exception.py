@@ -21,7 +21,13 @@ class SDKException(Exception):
     def __init__(self, error_code: dict):
         super().__init__(error_code['error'], error_code['desc'])
 
+    def __reduce__(self):
+        return self.__class__, (dict(error=self.args[0], desc=self.args[1]),)
+
 
 class SDKRuntimeException(RuntimeError):
     def __init__(self, error_code: dict):
         super().__init__(error_code['error'], error_code['desc'])
+
+    def __reduce__(self):
+        return self.__class__, (dict(error=self.args[0], desc=self.args[1]),)
@@ -0,0 +1,288 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import sys
+import struct
+import threading
+
+from typing import Union
+from contextlib import contextmanager
+
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+BOOL = struct.Struct('<?')
+INT8 = struct.Struct('<b')
+UINT8 = struct.Struct('<B')
+INT16 = struct.Struct('<h')
+UINT16 = struct.Struct('<H')
+INT32 = struct.Struct('<i')
+UINT32 = struct.Struct('<I')
+INT64 = struct.Struct('<q')
+UINT64 = struct.Struct('<Q')
+
+DEFAULT_WRITER_CAPACITY = 256
+MAX_POOLED_WRITERS = 8
+MAX_POOLED_CAPACITY = 1024 * 1024
+
+_local = threading.local()
+
+
+class BufferWriter(object):
+    """
+    A little endian binary writer which packs the values into a preallocated bytearray with precompiled structs.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_WRITER_CAPACITY):
+        self.__buffer = bytearray(max(capacity, 1))
+        self.__position = 0
+
+    def __len__(self):
+        return self.__position
+
+    @property
+    def capacity(self) -> int:
+        return len(self.__buffer)
+
+    def __reserve(self, size: int) -> int:
+        end = self.__position + size
+        capacity = len(self.__buffer)
+        if end > capacity:
+            self.__buffer.extend(bytes(max(end, capacity * 2) - capacity))
+        return end
+
+    def __pack(self, fmt: struct.Struct, value):
+        end = self.__reserve(fmt.size)
+        try:
+            fmt.pack_into(self.__buffer, self.__position, value)
+        except struct.error as e:
+            raise SDKException(ErrorCode.param_err(e.args[0]))
+        self.__position = end
+
+    def write_bytes(self, value: Union[bytes, bytearray, memoryview]):
+        end = self.__reserve(len(value))
+        self.__buffer[self.__position:end] = value
+        self.__position = end
+
+    def write_byte(self, value: Union[bytes, str, int]):
+        """
+        Write a single byte to the buffer.
+        """
+        if isinstance(value, (bytes, bytearray)):
+            self.write_bytes(value[:1])
+        elif isinstance(value, str):
+            self.write_bytes(value.encode('utf-8')[:1])
+        elif isinstance(value, int):
+            self.__pack(UINT8, value)
+
+    def write_bool(self, value: bool):
+        self.__pack(BOOL, value)
+
+    def write_int8(self, value: int):
+        self.__pack(INT8, value)
+
+    def write_uint8(self, value: int):
+        self.__pack(UINT8, value)
+
+    def write_int16(self, value: int):
+        self.__pack(INT16, value)
+
+    def write_uint16(self, value: int):
+        self.__pack(UINT16, value)
+
+    def write_int32(self, value: int):
+        self.__pack(INT32, value)
+
+    def write_uint32(self, value: int):
+        self.__pack(UINT32, value)
+
+    def write_int64(self, value: int):
+        self.__pack(INT64, value)
+
+    def write_uint64(self, value: int):
+        self.__pack(UINT64, value)
+
+    def write_var_int(self, value: int):
+        """
+        Write an integer value in a space saving way to the buffer.
+        """
+        if not isinstance(value, int):
+            raise SDKException(ErrorCode.param_err('%s not int type.' % value))
+        if value < 0:
+            raise SDKException(ErrorCode.param_err('%d too small.' % value))
+        elif value < 0xfd:
+            self.__pack(UINT8, value)
+        elif value <= 0xffff:
+            self.__pack(UINT8, 0xfd)
+            self.__pack(UINT16, value)
+        elif value <= 0xffffffff:
+            self.__pack(UINT8, 0xfe)
+            self.__pack(UINT32, value)
+        else:
+            self.__pack(UINT8, 0xff)
+            self.__pack(UINT64, value)
+
+    def write_var_bytes(self, value: Union[bytes, bytearray, memoryview]):
+        self.write_var_int(len(value))
+        self.write_bytes(value)
+
+    def write_var_str(self, value: Union[str, bytes], encoding: str = 'utf-8'):
+        if isinstance(value, str):
+            value = value.encode(encoding)
+        self.write_var_bytes(value)
+
+    def to_bytes(self) -> bytes:
+        with memoryview(self.__buffer) as view, view[:self.__position] as data:
+            return data.tobytes()
+
+    def clear(self):
+        self.__position = 0
+
+
+class BufferReader(object):
+    """
+    A little endian binary reader which unpacks the values through memoryview slices of the data.
+    """
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview]):
+        self.__view = memoryview(data)
+        self.__position = 0
+
+    def __len__(self):
+        return len(self.__view)
+
+    @property
+    def position(self) -> int:
+        return self.__position
+
+    @property
+    def remaining(self) -> int:
+        return len(self.__view) - self.__position
+
+    def __unpack(self, fmt: struct.Struct):
+        try:
+            value = fmt.unpack_from(self.__view, self.__position)[0]
+        except struct.error as e:
+            raise SDKException(ErrorCode.unpack_error(e.args[0]))
+        self.__position += fmt.size
+        return value
+
+    def read_view(self, length: int) -> memoryview:
+        """
+        Read the specified number of bytes as a memoryview of the data, without copying them.
+        """
+        end = self.__position + length
+        if length < 0 or end > len(self.__view):
+            raise SDKException(ErrorCode.unpack_error(f'read {length} bytes with {self.remaining} bytes left.'))
+        view = self.__view[self.__position:end]
+        self.__position = end
+        return view
+
+    def read_bytes(self, length: int) -> bytes:
+        return self.read_view(length).tobytes()
+
+    def read_byte(self) -> int:
+        if self.__position >= len(self.__view):
+            raise SDKException(ErrorCode.read_byte_error('no more byte to read.'))
+        value = self.__view[self.__position]
+        self.__position += 1
+        return value
+
+    def read_bool(self) -> bool:
+        return self.__unpack(BOOL)
+
+    def read_int8(self) -> int:
+        return self.__unpack(INT8)
+
+    def read_uint8(self) -> int:
+        return self.__unpack(UINT8)
+
+    def read_int16(self) -> int:
+        return self.__unpack(INT16)
+
+    def read_uint16(self) -> int:
+        return self.__unpack(UINT16)
+
+    def read_int32(self) -> int:
+        return self.__unpack(INT32)
+
+    def read_uint32(self) -> int:
+        return self.__unpack(UINT32)
+
+    def read_int64(self) -> int:
+        return self.__unpack(INT64)
+
+    def read_uint64(self) -> int:
+        return self.__unpack(UINT64)
+
+    def read_var_int(self, max_size: int = sys.maxsize) -> int:
+        """
+        Read an integer value which is written in a space saving way.
+        """
+        fb = self.read_byte()
+        if fb == 0xfd:
+            value = self.__unpack(UINT16)
+        elif fb == 0xfe:
+            value = self.__unpack(UINT32)
+        elif fb == 0xff:
+            value = self.__unpack(UINT64)
+        else:
+            value = fb
+        if value > max_size:
+            raise SDKException(ErrorCode.param_err('Invalid format'))
+        return value
+
+    def read_var_bytes(self, max_size: int = sys.maxsize) -> bytes:
+        return self.read_bytes(self.read_var_int(max_size))
+
+    def read_var_str(self, max_size: int = sys.maxsize) -> bytes:
+        return self.read_var_bytes(max_size)
+
+
+def acquire_writer() -> BufferWriter:
+    """
+    This interface is used to get a cleared writer from the pool of current thread.
+    """
+    writers = getattr(_local, 'writers', None)
+    if writers:
+        return writers.pop()
+    return BufferWriter()
+
+
+def release_writer(writer: BufferWriter):
+    """
+    This interface is used to return a writer to the pool of current thread, the writers which grow too large
+    are dropped.
+    """
+    if writer.capacity > MAX_POOLED_CAPACITY:
+        return
+    writer.clear()
+    writers = getattr(_local, 'writers', None)
+    if writers is None:
+        writers = _local.writers = list()
+    if len(writers) < MAX_POOLED_WRITERS:
+        writers.append(writer)
+
+
+@contextmanager
+def pooled_writer():
+    writer = acquire_writer()
+    try:
+        yield writer
+    finally:
+        release_writer(writer)
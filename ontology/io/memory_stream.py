@@ -16,11 +16,14 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import threading
+
 from io import BytesIO
 from binascii import hexlify
 
 __mstreams__ = []
 __mstreams_available__ = []
+__mstreams_lock__ = threading.Lock()
 
 
 class StreamManager:
@@ -46,17 +49,18 @@ class StreamManager:
         Returns:
             MemoryStream: instance.
         """
-        if len(__mstreams_available__) == 0:
+        with __mstreams_lock__:
+            mstream = __mstreams_available__.pop() if len(__mstreams_available__) != 0 else None
+        if mstream is None:
             if data:
                 mstream = MemoryStream(data)
                 mstream.seek(0)
             else:
                 mstream = MemoryStream()
-            __mstreams__.append(mstream)
+            with __mstreams_lock__:
+                __mstreams__.append(mstream)
             return mstream
 
-        mstream = __mstreams_available__.pop()
-
         if data is not None and len(data):
             mstream.clean_up()
             mstream.write(data)
@@ -73,7 +77,8 @@ class StreamManager:
             mstream (MemoryStream): instance.
         """
         mstream.clean_up()
-        __mstreams_available__.append(mstream)
+        with __mstreams_lock__:
+            __mstreams_available__.append(mstream)
 
 
 class MemoryStream(BytesIO):
@@ -0,0 +1,311 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import hashlib
+
+from typing import List, Iterable
+
+from ontology.utils.scan import aio_ordered_map
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.merkle.merkle_verifier import CompactMerkleProof, HASH_SIZE, hash_children
+
+EMPTY_ROOT = hashlib.sha256(b'').digest()
+
+
+def _stored_count(tree_size: int) -> int:
+    return 2 * tree_size - bin(tree_size).count('1')
+
+
+class MemoryHashStore(object):
+    """
+    Keeps the hashes of the tree nodes in a contiguous buffer in memory.
+    """
+
+    def __init__(self):
+        self.__buffer = bytearray()
+
+    def __len__(self):
+        return len(self.__buffer) // HASH_SIZE
+
+    def append(self, node: bytes):
+        self.__buffer += node
+
+    def read(self, position: int) -> bytes:
+        return bytes(self.__buffer[position * HASH_SIZE:(position + 1) * HASH_SIZE])
+
+    def truncate(self, count: int):
+        del self.__buffer[count * HASH_SIZE:]
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FileHashStore(object):
+    """
+    Keeps the hashes of the tree nodes in an append-only file of 32-byte records, so that a tree is reopened
+    without replaying the leaves, and only the nodes of a proof are read into memory.
+    """
+
+    def __init__(self, path: str):
+        if not isinstance(path, str):
+            raise SDKException(ErrorCode.require_str_params)
+        self.__path = path
+        self.__file = open(path, 'r+b' if os.path.isfile(path) else 'w+b')
+        self.__count = os.path.getsize(path) // HASH_SIZE
+
+    def __len__(self):
+        return self.__count
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def append(self, node: bytes):
+        self.__file.seek(self.__count * HASH_SIZE)
+        self.__file.write(node)
+        self.__count += 1
+
+    def read(self, position: int) -> bytes:
+        self.__file.seek(position * HASH_SIZE)
+        return self.__file.read(HASH_SIZE)
+
+    def truncate(self, count: int):
+        self.__file.truncate(count * HASH_SIZE)
+        self.__count = count
+
+    def flush(self):
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+
+    def close(self):
+        self.__file.close()
+
+
+class CompactMerkleTree(object):
+    """
+    A local merkle tree of the block transactions roots, which is the tree the node builds its CurBlockRoot from.
+    The roots of the perfect subtrees are kept in memory to append leaves, and all the tree nodes are kept in a
+    hash store, so that the root, inclusion proofs and consistency proofs of any tree size are generated by
+    reading O(log n) nodes without querying the node.
+    """
+
+    def __init__(self, hash_store=None):
+        """
+        :param hash_store: a MemoryHashStore or FileHashStore, the tree is recovered from it if it is not empty.
+        """
+        if hash_store is None:
+            hash_store = MemoryHashStore()
+        self.__store = hash_store
+        self.__tree_size = 0
+        self.__peaks = list()
+        self.__recover()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __recover(self):
+        count = len(self.__store)
+        low, high = 0, count
+        while low < high:
+            middle = (low + high + 1) // 2
+            if _stored_count(middle) <= count:
+                low = middle
+            else:
+                high = middle - 1
+        tree_size = low
+        if _stored_count(tree_size) != count:
+            self.__store.truncate(_stored_count(tree_size))
+        self.__tree_size = tree_size
+        start = 0
+        for bit in reversed(range(tree_size.bit_length())):
+            size = 1 << bit
+            if tree_size & size:
+                self.__peaks.append((size, self.__read_node(start, size)))
+                start += size
+
+    @property
+    def tree_size(self) -> int:
+        return self.__tree_size
+
+    @property
+    def root(self) -> bytes:
+        if len(self.__peaks) == 0:
+            return EMPTY_ROOT
+        root = self.__peaks[-1][1]
+        for _, peak in reversed(self.__peaks[:-1]):
+            root = hash_children(peak, root)
+        return root
+
+    def append(self, leaf: bytes):
+        """
+        This interface is used to append a leaf hash in the byte order in which it is hashed.
+        """
+        if len(leaf) != HASH_SIZE:
+            raise SDKException(ErrorCode.other_error('the leaf should be a 32-byte hash.'))
+        leaf = bytes(leaf)
+        self.__store.append(leaf)
+        self.__peaks.append((1, leaf))
+        while len(self.__peaks) > 1 and self.__peaks[-1][0] == self.__peaks[-2][0]:
+            size, right = self.__peaks.pop()
+            _, left = self.__peaks.pop()
+            node = hash_children(left, right)
+            self.__store.append(node)
+            self.__peaks.append((size * 2, node))
+        self.__tree_size += 1
+
+    def extend(self, leaves: Iterable[bytes]):
+        for leaf in leaves:
+            self.append(leaf)
+
+    def append_block(self, block: dict):
+        """
+        This interface is used to append the transactions root of a block in json form, e.g. the block returned
+        by get_block_by_height or pushed by websocket. The blocks should be appended in height order.
+        """
+        header = block.get('Header', dict())
+        if header.get('Height') != self.__tree_size:
+            raise SDKException(ErrorCode.param_err(f'the height of next block should be {self.__tree_size}.'))
+        self.append(CompactMerkleProof.decode_hash(header['TransactionsRoot'], True))
+
+    async def aio_sync(self, network, end: int = None, concurrency: int = 16) -> int:
+        """
+        This interface is used to append the blocks from the next height to the end height (inclusive),
+        None means the current block height, and return the tree size.
+
+        :param network: an asynchronous network client, e.g. sdk.default_aio_network.
+        """
+        if end is None:
+            end = await network.get_block_height()
+        blocks = aio_ordered_map(network.get_block_by_height, range(self.__tree_size, end + 1), concurrency)
+        try:
+            async for block in blocks:
+                self.append_block(block)
+        finally:
+            await blocks.aclose()
+        return self.__tree_size
+
+    def flush(self):
+        self.__store.flush()
+
+    def close(self):
+        self.__store.close()
+
+    def __read_node(self, start: int, size: int) -> bytes:
+        end = start + size
+        return self.__store.read(_stored_count(end - 1) + size.bit_length() - 1)
+
+    def __subtree_root(self, start: int, end: int) -> bytes:
+        size = end - start
+        if size & (size - 1) == 0:
+            return self.__read_node(start, size)
+        k = 1 << ((size - 1).bit_length() - 1)
+        return hash_children(self.__subtree_root(start, start + k), self.__subtree_root(start + k, end))
+
+    def __check_tree_size(self, tree_size: int) -> int:
+        if tree_size is None:
+            return self.__tree_size
+        if not isinstance(tree_size, int) or tree_size < 0 or tree_size > self.__tree_size:
+            raise SDKException(ErrorCode.param_err(f'the tree size should be in [0, {self.__tree_size}].'))
+        return tree_size
+
+    def get_root(self, tree_size: int = None) -> bytes:
+        """
+        This interface is used to get the merkle root of the first tree_size leaves, None means all the leaves.
+        """
+        tree_size = self.__check_tree_size(tree_size)
+        if tree_size == self.__tree_size:
+            return self.root
+        if tree_size == 0:
+            return EMPTY_ROOT
+        return self.__subtree_root(0, tree_size)
+
+    def get_leaf(self, index: int) -> bytes:
+        if not isinstance(index, int) or index < 0 or index >= self.__tree_size:
+            raise SDKException(ErrorCode.merkle_verifier_err)
+        return self.__read_node(index, 1)
+
+    def get_inclusion_proof(self, index: int, tree_size: int = None) -> CompactMerkleProof:
+        """
+        This interface is used to generate the proof that the leaf of the index is in the tree of tree_size leaves,
+        which is validated by CompactMerkleProof.validate with the root of the tree.
+        """
+        tree_size = self.__check_tree_size(tree_size)
+        if not isinstance(index, int) or index < 0 or index >= tree_size:
+            raise SDKException(ErrorCode.merkle_verifier_err)
+        siblings = list()
+        directions = list()
+        start, end = 0, tree_size
+        while end - start > 1:
+            k = 1 << ((end - start - 1).bit_length() - 1)
+            if index < start + k:
+                siblings.append(self.__subtree_root(start + k, end))
+                directions.append(0)
+                end = start + k
+            else:
+                siblings.append(self.__subtree_root(start, start + k))
+                directions.append(1)
+                start += k
+        mask = 0
+        for i, direction in enumerate(reversed(directions)):
+            mask |= direction << i
+        return CompactMerkleProof(self.get_leaf(index), mask, b''.join(reversed(siblings)), index, tree_size)
+
+    def get_merkle_proof(self, index: int, tree_size: int = None) -> dict:
+        """
+        This interface is used to generate the inclusion proof in the same form as the merkle proof queried from
+        the node, which can be used by MerkleVerifier.get_proof and the blockchain proof of claims.
+        """
+        tree_size = self.__check_tree_size(tree_size)
+        proof = self.get_inclusion_proof(index, tree_size)
+        siblings = proof.siblings
+        target_hashes = [siblings[i:i + HASH_SIZE][::-1].hex() for i in range(0, len(siblings), HASH_SIZE)]
+        return dict(TransactionsRoot=proof.target_hash[::-1].hex(), BlockHeight=index,
+                    CurBlockRoot=self.get_root(tree_size)[::-1].hex(), CurBlockHeight=tree_size - 1,
+                    TargetHashes=target_hashes)
+
+    def get_consistency_proof(self, old_size: int, new_size: int = None) -> List[bytes]:
+        """
+        This interface is used to generate the proof that the tree of old_size leaves is a prefix of the tree of
+        new_size leaves, which is validated by MerkleVerifier.validate_consistency_proof.
+        """
+        new_size = self.__check_tree_size(new_size)
+        if not isinstance(old_size, int) or old_size <= 0 or old_size > new_size:
+            raise SDKException(ErrorCode.param_err(f'the old tree size should be in [1, {new_size}].'))
+        proof = list()
+        start, end, size, complete = 0, new_size, old_size, True
+        while size != end - start:
+            k = 1 << ((end - start - 1).bit_length() - 1)
+            if size <= k:
+                proof.append(self.__subtree_root(start + k, end))
+                end = start + k
+            else:
+                proof.append(self.__subtree_root(start, start + k))
+                start += k
+                size -= k
+                complete = False
+        if not complete:
+            proof.append(self.__subtree_root(start, end))
+        return list(reversed(proof))
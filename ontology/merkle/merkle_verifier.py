@@ -16,13 +16,153 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from typing import List
+import hashlib
+
+from typing import List, Union
 
-from ontology.utils.neo import NeoData
-from ontology.crypto.digest import Digest
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 
+HASH_SIZE = 32
+
+
+def hash_children(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b'\x01' + left + right).digest()
+
+
+def _path_levels(index: int, last_index: int) -> List[int]:
+    levels = list()
+    level = 0
+    while last_index > 0:
+        if index % 2 == 1 or index < last_index:
+            levels.append(level)
+        index //= 2
+        last_index //= 2
+        level += 1
+    return levels
+
+
+class CompactMerkleProof(object):
+    """
+    A merkle audit path in compact form. The sibling hashes are concatenated into a buffer of 32 bytes each,
+    and the i-th bit of the direction mask is set if the i-th sibling is on the left. All the hashes are kept in
+    the byte order in which they are hashed.
+    """
+
+    def __init__(self, target_hash: bytes, directions: int, siblings: bytes, index: int = None,
+                 tree_size: int = None):
+        """
+        :param index: the index of the leaf, which is the height of the block.
+        :param tree_size: the number of leaves, which is the current block height plus one.
+        """
+        if len(target_hash) != HASH_SIZE or len(siblings) % HASH_SIZE != 0:
+            raise SDKException(ErrorCode.other_error('Invalid proof.'))
+        self.__target_hash = bytes(target_hash)
+        self.__directions = directions
+        self.__siblings = bytes(siblings)
+        self.__index = index
+        self.__tree_size = tree_size
+
+    def __len__(self):
+        return len(self.__siblings) // HASH_SIZE
+
+    @property
+    def target_hash(self) -> bytes:
+        return self.__target_hash
+
+    @property
+    def directions(self) -> int:
+        return self.__directions
+
+    @property
+    def siblings(self) -> bytes:
+        return self.__siblings
+
+    @property
+    def index(self) -> int:
+        return self.__index
+
+    @property
+    def tree_size(self) -> int:
+        return self.__tree_size
+
+    @staticmethod
+    def decode_hash(hex_hash: str, is_big_endian: bool = False) -> bytes:
+        if is_big_endian:
+            return bytes.fromhex(hex_hash)[::-1]
+        return bytes.fromhex(hex_hash)
+
+    @staticmethod
+    def from_proof_node(proof: List[dict], hex_target_hash: str, is_big_endian: bool = False):
+        """
+        This interface is used to convert a proof in the form of [dict(Direction=..., TargetHash=...)].
+        """
+        directions = 0
+        siblings = bytearray()
+        for i, node in enumerate(proof):
+            try:
+                direction = node['Direction'].lower()
+            except KeyError:
+                raise SDKException(ErrorCode.other_error('Invalid proof'))
+            if direction == 'left':
+                directions |= 1 << i
+            elif direction != 'right':
+                raise SDKException(ErrorCode.other_error('Invalid proof.'))
+            siblings += CompactMerkleProof.decode_hash(node['TargetHash'], is_big_endian)
+        return CompactMerkleProof(CompactMerkleProof.decode_hash(hex_target_hash, is_big_endian), directions,
+                                  siblings)
+
+    @staticmethod
+    def from_merkle_proof(merkle_proof: dict, is_big_endian: bool = True):
+        """
+        This interface is used to convert a merkle proof queried from the node, which contains the BlockHeight,
+        CurBlockHeight, TransactionsRoot and TargetHashes.
+        """
+        index = merkle_proof['BlockHeight']
+        last_index = merkle_proof['CurBlockHeight']
+        if index > last_index:
+            raise SDKException(ErrorCode.merkle_verifier_err)
+        levels = _path_levels(index, last_index)
+        target_hash_list = merkle_proof['TargetHashes']
+        if len(target_hash_list) != len(levels):
+            raise SDKException(ErrorCode.other_error('Invalid proof.'))
+        directions = 0
+        for i, level in enumerate(levels):
+            if (index >> level) % 2 == 1:
+                directions |= 1 << i
+        siblings = b''.join(CompactMerkleProof.decode_hash(item, is_big_endian) for item in target_hash_list)
+        target_hash = CompactMerkleProof.decode_hash(merkle_proof['TransactionsRoot'], is_big_endian)
+        return CompactMerkleProof(target_hash, directions, siblings, index, last_index + 1)
+
+    def to_proof_node(self, is_big_endian: bool = False) -> List[dict]:
+        proof_node = list()
+        for i in range(len(self)):
+            sibling = self.__siblings[i * HASH_SIZE:(i + 1) * HASH_SIZE]
+            if is_big_endian:
+                sibling = sibling[::-1]
+            direction = 'Left' if self.__directions >> i & 1 else 'Right'
+            proof_node.append(dict(Direction=direction, TargetHash=sibling.hex()))
+        return proof_node
+
+    def root(self) -> bytes:
+        """
+        This interface is used to compute the merkle root which the proof leads to.
+        """
+        node = self.__target_hash
+        siblings = self.__siblings
+        directions = self.__directions
+        sha256 = hashlib.sha256
+        for offset in range(0, len(siblings), HASH_SIZE):
+            if directions & 1:
+                node = sha256(b'\x01' + siblings[offset:offset + HASH_SIZE] + node).digest()
+            else:
+                node = sha256(b'\x01' + node + siblings[offset:offset + HASH_SIZE]).digest()
+            directions >>= 1
+        return node
+
+    def validate(self, merkle_root: bytes) -> bool:
+        return self.root() == merkle_root
+
 
 class MerkleVerifier(object):
     @staticmethod
@@ -45,28 +185,96 @@ class MerkleVerifier(object):
 
     @staticmethod
     def validate_proof(proof: List[dict], hex_target_hash: str, hex_merkle_root: str, is_big_endian: bool = False):
-        if is_big_endian:
-            hex_merkle_root = NeoData.to_reserve_hex_str(hex_merkle_root)
-            hex_target_hash = NeoData.to_reserve_hex_str(hex_target_hash)
+        try:
+            merkle_root = CompactMerkleProof.decode_hash(hex_merkle_root, is_big_endian)
+        except ValueError:
+            return False
         if len(proof) == 0:
-            return hex_target_hash == hex_merkle_root
-        else:
-            hex_proof_hash = hex_target_hash
-            for node in proof:
-                if is_big_endian:
-                    sibling = NeoData.to_reserve_hex_str(node['TargetHash'])
-                else:
-                    sibling = node['TargetHash']
-                try:
-                    direction = node['Direction'].lower()
-                except KeyError:
-                    raise SDKException(ErrorCode.other_error('Invalid proof'))
-                if direction == 'left':
-                    value = bytes.fromhex('01' + sibling + hex_proof_hash)
-                    hex_proof_hash = Digest.sha256(value, is_hex=True)
-                elif direction == 'right':
-                    value = bytes.fromhex('01' + hex_proof_hash + sibling)
-                    hex_proof_hash = Digest.sha256(value, is_hex=True)
+            return CompactMerkleProof.decode_hash(hex_target_hash, is_big_endian) == merkle_root
+        return CompactMerkleProof.from_proof_node(proof, hex_target_hash, is_big_endian).validate(merkle_root)
+
+    @staticmethod
+    def validate_consistency_proof(old_size: int, new_size: int, old_root: bytes, new_root: bytes,
+                                   proof: List[bytes]) -> bool:
+        """
+        This interface is used to validate that the tree of old size is a prefix of the tree of new size,
+        with a consistency proof in the form of RFC 6962.
+        """
+        if old_size <= 0 or old_size > new_size:
+            return False
+        if old_size == new_size:
+            return len(proof) == 0 and old_root == new_root
+        if old_size & (old_size - 1) == 0:
+            proof = [old_root] + list(proof)
+        if len(proof) == 0:
+            return False
+        fn = old_size - 1
+        sn = new_size - 1
+        while fn & 1:
+            fn >>= 1
+            sn >>= 1
+        fr = sr = proof[0]
+        for node in proof[1:]:
+            if sn == 0:
+                return False
+            if fn & 1 or fn == sn:
+                fr = hash_children(node, fr)
+                sr = hash_children(node, sr)
+                while fn & 1 == 0 and fn != 0:
+                    fn >>= 1
+                    sn >>= 1
+            else:
+                sr = hash_children(sr, node)
+            fn >>= 1
+            sn >>= 1
+        return fr == old_root and sr == new_root and sn == 0
+
+    @staticmethod
+    def validate_compact_proofs(proofs: List[CompactMerkleProof], merkle_root: Union[bytes, str],
+                                is_big_endian: bool = True) -> List[bool]:
+        """
+        This interface is used to validate many proofs against the same merkle root. The hashes of the tree nodes
+        which have been validated are memorized by their positions, so the path of a proof is only computed until
+        it reaches a node shared with a validated proof.
+
+        :param merkle_root: the merkle root in bytes, or in hex string of which the byte order is given by
+         is_big_endian.
+        """
+        if isinstance(merkle_root, str):
+            merkle_root = CompactMerkleProof.decode_hash(merkle_root, is_big_endian)
+        validated = dict()
+        results = list()
+        sha256 = hashlib.sha256
+        for proof in proofs:
+            if proof.index is None or proof.tree_size is None:
+                results.append(proof.validate(merkle_root))
+                continue
+            tree_size = proof.tree_size
+            leaf_index = proof.index
+            path = list()
+            node = proof.target_hash
+            siblings = proof.siblings
+            directions = proof.directions
+            result = None
+            levels = _path_levels(leaf_index, tree_size - 1)
+            if len(levels) != len(proof):
+                results.append(False)
+                continue
+            for i, level in enumerate(levels):
+                sibling = siblings[i * HASH_SIZE:(i + 1) * HASH_SIZE]
+                if directions >> i & 1:
+                    node = sha256(b'\x01' + sibling + node).digest()
                 else:
-                    raise SDKException(ErrorCode.other_error('Invalid proof.'))
-            return hex_proof_hash == hex_merkle_root
+                    node = sha256(b'\x01' + node + sibling).digest()
+                position = (tree_size, level + 1, leaf_index >> (level + 1))
+                known = validated.get(position)
+                if known is not None:
+                    result = known == node
+                    break
+                path.append((position, node))
+            if result is None:
+                result = node == merkle_root
+            if result:
+                validated.update(path)
+            results.append(result)
+        return results
@@ -16,16 +16,83 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import hashlib
 import threading
 
-from ontology.merkle.merkle_verifier import MerkleVerifier
+from collections import OrderedDict
+from typing import List, Iterable
+
+from ontology.utils.scan import BatchMapper, aio_ordered_map
+from ontology.exception.exception import SDKException
+from ontology.exception.error_code import ErrorCode, CONNECT_ERROR_CODES
+from ontology.merkle.merkle_verifier import MerkleVerifier, CompactMerkleProof
+
+DEFAULT_ROOT_CACHE_SIZE = 4096
+DEFAULT_FETCH_CONCURRENCY = 16
+
+
+def compute_transactions_root(tx_hashes: List[bytes]) -> bytes:
+    """
+    This interface is used to compute the transactions root of a block in the same way as the node, the hashes are
+    paired by double SHA256 level by level, and the last hash of a level of odd length is paired with itself.
+    """
+    if len(tx_hashes) == 0:
+        return bytes(32)
+    hashes = list(tx_hashes)
+    while len(hashes) != 1:
+        if len(hashes) % 2 == 1:
+            hashes.append(hashes[-1])
+        hashes = [hashlib.sha256(hashlib.sha256(hashes[i] + hashes[i + 1]).digest()).digest()
+                  for i in range(0, len(hashes), 2)]
+    return hashes[0]
+
+
+class TxVerificationResult(object):
+    """
+    The result of verifying a transaction. The proof means the transactions root of the block is in the merkle
+    tree of the current block root, and the in_block means the transaction is in the transactions of the block.
+    """
+
+    def __init__(self, tx_hash: str):
+        self.tx_hash = tx_hash
+        self.block_height = -1
+        self.proof = False
+        self.in_block = False
+        self.error = ''
+        self.__exception = None
+
+    def __iter__(self):
+        data = dict(tx_hash=self.tx_hash, block_height=self.block_height, proof=self.proof, in_block=self.in_block,
+                    error=self.error, valid=self.valid)
+        for key, value in data.items():
+            yield key, value
+
+    @property
+    def valid(self) -> bool:
+        return self.error == '' and self.proof and self.in_block
+
+    def set_error(self, error):
+        if isinstance(error, SDKException):
+            self.__exception = error
+            self.error = error.args[1]
+        else:
+            self.__exception = SDKException(ErrorCode.other_error(error))
+            self.error = error
+
+    def raise_for_error(self):
+        if self.__exception is not None:
+            raise self.__exception
 
 
 class TxVerifier(object):
     _instance_lock = threading.Lock()
 
-    def __init__(self, sdk):
+    def __init__(self, sdk, root_cache_size: int = DEFAULT_ROOT_CACHE_SIZE):
         self.__sdk = sdk
+        if not hasattr(self, '_TxVerifier__root_cache'):
+            self.__root_cache = OrderedDict()
+            self.__cache_lock = threading.Lock()
+        self.__root_cache_size = root_cache_size
 
     def __new__(cls, *args, **kwargs):
         if not hasattr(TxVerifier, '_instance'):
@@ -35,12 +102,153 @@ class TxVerifier(object):
         return TxVerifier._instance
 
     def verify_by_tx_hash(self, tx_hash: str):
-        merkle_proof = self.__sdk.default_network.get_merkle_proof(tx_hash)
-        tx_block_height = merkle_proof['BlockHeight']
-        current_block_height = merkle_proof['CurBlockHeight']
-        target_hash_list = merkle_proof['TargetHashes']
-        target_hash = merkle_proof['TransactionsRoot']
-        merkle_root = merkle_proof['CurBlockRoot']
-        proof_node = MerkleVerifier.get_proof(tx_block_height, target_hash_list, current_block_height)
-        result = MerkleVerifier.validate_proof(proof_node, target_hash, merkle_root, True)
-        return result
+        result = self.verify_many([tx_hash], concurrency=1)[0]
+        result.raise_for_error()
+        return result.valid
+
+    def clear_cache(self):
+        with self.__cache_lock:
+            self.__root_cache.clear()
+
+    def __get_cached_txs(self, tx_root: bytes):
+        with self.__cache_lock:
+            tx_hashes = self.__root_cache.get(tx_root)
+            if tx_hashes is not None:
+                self.__root_cache.move_to_end(tx_root)
+            return tx_hashes
+
+    def __cache_txs(self, tx_root: bytes, tx_hashes: frozenset):
+        with self.__cache_lock:
+            self.__root_cache[tx_root] = tx_hashes
+            while len(self.__root_cache) > max(self.__root_cache_size, 0):
+                self.__root_cache.popitem(last=False)
+
+    def __missing_heights(self, merkle_proofs: dict) -> List[int]:
+        heights = list()
+        for merkle_proof in merkle_proofs.values():
+            if not isinstance(merkle_proof, dict) or len(merkle_proof) == 0:
+                continue
+            try:
+                tx_root = CompactMerkleProof.decode_hash(merkle_proof['TransactionsRoot'], True)
+                height = merkle_proof['BlockHeight']
+            except (KeyError, TypeError, ValueError):
+                continue
+            if self.__get_cached_txs(tx_root) is None:
+                heights.append(height)
+        return list(dict.fromkeys(heights))
+
+    def __load_block(self, block) -> bool:
+        if not isinstance(block, dict):
+            return False
+        try:
+            tx_hashes = [tx['Hash'] for tx in block.get('Transactions', list())]
+            tx_root = CompactMerkleProof.decode_hash(block['Header']['TransactionsRoot'], True)
+            computed_root = compute_transactions_root([CompactMerkleProof.decode_hash(h, True) for h in tx_hashes])
+        except (KeyError, TypeError, ValueError):
+            return False
+        if computed_root != tx_root:
+            return False
+        self.__cache_txs(tx_root, frozenset(tx_hashes))
+        return True
+
+    def __verify(self, tx_hashes: List[str], merkle_proofs: dict, blocks: dict) -> List[TxVerificationResult]:
+        for block in blocks.values():
+            self.__load_block(block)
+        results = list()
+        groups = dict()
+        for tx_hash in tx_hashes:
+            result = TxVerificationResult(tx_hash)
+            results.append(result)
+            merkle_proof = merkle_proofs[tx_hash]
+            if isinstance(merkle_proof, SDKException):
+                result.set_error(merkle_proof)
+                continue
+            if not isinstance(merkle_proof, dict) or len(merkle_proof) == 0:
+                result.set_error(f'the merkle proof of {tx_hash} is not found.')
+                continue
+            try:
+                proof = CompactMerkleProof.from_merkle_proof(merkle_proof, True)
+                merkle_root = CompactMerkleProof.decode_hash(merkle_proof['CurBlockRoot'], True)
+            except SDKException as e:
+                result.set_error(e)
+                continue
+            except (KeyError, TypeError, ValueError):
+                result.set_error(f'the merkle proof of {tx_hash} is invalid.')
+                continue
+            result.block_height = proof.index
+            groups.setdefault(merkle_root, list()).append((result, proof))
+            block_txs = self.__get_cached_txs(proof.target_hash)
+            if block_txs is None:
+                block = blocks.get(proof.index)
+                if isinstance(block, SDKException):
+                    result.set_error(block)
+                else:
+                    result.set_error(f'the transactions of block {proof.index} do not match the transactions root.')
+                continue
+            result.in_block = tx_hash in block_txs
+        for merkle_root, items in groups.items():
+            verified = MerkleVerifier.validate_compact_proofs([proof for _, proof in items], merkle_root)
+            for (result, _), proof_verified in zip(items, verified):
+                result.proof = proof_verified
+        return results
+
+    def verify_many(self, tx_hashes: Iterable[str],
+                    concurrency: int = DEFAULT_FETCH_CONCURRENCY) -> List[TxVerificationResult]:
+        """
+        This interface is used to verify that the transactions are in the blocks of the chain, and return the results
+        in the same order as the transactions. The merkle proofs are queried concurrently, and the block of a
+        transactions root is only queried and checked once, the transactions of checked roots are cached.
+        The errors of a transaction are reported in its result, except the connection errors which are raised.
+        """
+        tx_hashes = list(tx_hashes)
+        network = self.__sdk.default_network
+
+        def call(func):
+            def call_func(item):
+                try:
+                    return func(item)
+                except SDKException as e:
+                    if e.args[0] in CONNECT_ERROR_CODES:
+                        raise
+                    return e
+
+            return call_func
+
+        unique_hashes = list(dict.fromkeys(tx_hashes))
+        with BatchMapper(call(network.get_merkle_proof), concurrency=concurrency) as mapper:
+            merkle_proofs = dict(zip(unique_hashes, mapper(unique_hashes)))
+        heights = self.__missing_heights(merkle_proofs)
+        with BatchMapper(call(network.get_block_by_height), concurrency=concurrency) as mapper:
+            blocks = dict(zip(heights, mapper(heights)))
+        return self.__verify(tx_hashes, merkle_proofs, blocks)
+
+    async def aio_verify_many(self, tx_hashes: Iterable[str],
+                              concurrency: int = DEFAULT_FETCH_CONCURRENCY) -> List[TxVerificationResult]:
+        """
+        This interface is used to verify the transactions in the same way as verify_many with the asynchronous
+        network, e.g. the deposits of a settlement window are verified without blocking the event loop.
+        """
+        tx_hashes = list(tx_hashes)
+        network = self.__sdk.default_aio_network
+
+        def call(func):
+            async def call_func(item):
+                try:
+                    return item, await func(item)
+                except SDKException as e:
+                    if e.args[0] in CONNECT_ERROR_CODES:
+                        raise
+                    return item, e
+
+            return call_func
+
+        async def gather(func, items: list) -> dict:
+            results = aio_ordered_map(call(func), items, concurrency)
+            try:
+                return dict([item async for item in results])
+            finally:
+                await results.aclose()
+
+        merkle_proofs = await gather(network.get_merkle_proof, list(dict.fromkeys(tx_hashes)))
+        blocks = await gather(network.get_block_by_height, self.__missing_heights(merkle_proofs))
+        return self.__verify(tx_hashes, merkle_proofs, blocks)
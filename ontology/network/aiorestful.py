@@ -28,12 +28,23 @@ from ontology.core.transaction import Transaction
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 from ontology.network.restful import Restful, RestfulMethod
+from ontology.network.cache import ResponseCache, CacheMethod
+from ontology.network.flight import SingleFlight
+from ontology.network.session import create_client_session, release_client_session, DEFAULT_CONNECTOR_LIMIT
+from ontology.utils.scan import aio_ordered_map
+
+VOLATILE_PATHS = ('/api/v1/block/height', '/api/v1/gasprice')
 
 
 class AioRestful(Restful):
-    def __init__(self, url: str = '', session: ClientSession = None):
-        super().__init__(url)
+    def __init__(self, url: str = '', session: ClientSession = None, connector_limit: int = DEFAULT_CONNECTOR_LIMIT,
+                 cache: ResponseCache = None, volatile_ttl: float = 0):
+        super().__init__(url, cache=cache)
         self.__session = session
+        self.__connector_limit = connector_limit
+        self.__owned_session_loop = None
+        self.__single_flight = SingleFlight()
+        self.__volatile_ttl = volatile_ttl
 
     @property
     def session(self):
@@ -44,16 +55,65 @@ class AioRestful(Restful):
         if not isinstance(session, ClientSession):
             raise SDKException(ErrorCode.param_error)
         self.__session = session
+        self.__owned_session_loop = None
+
+    @property
+    def connector_limit(self) -> int:
+        return self.__connector_limit
+
+    @connector_limit.setter
+    def connector_limit(self, limit: int):
+        if not isinstance(limit, int) or limit < 0:
+            raise SDKException(ErrorCode.param_error)
+        self.__connector_limit = limit
+
+    @property
+    def single_flight(self) -> SingleFlight:
+        return self.__single_flight
+
+    @property
+    def volatile_ttl(self) -> float:
+        return self.__volatile_ttl
+
+    @volatile_ttl.setter
+    def volatile_ttl(self, ttl: float):
+        if not isinstance(ttl, (int, float)) or ttl < 0:
+            raise SDKException(ErrorCode.param_error)
+        self.__volatile_ttl = ttl
+        self.__single_flight.clear()
+
+    def __get_session(self) -> ClientSession:
+        loop = asyncio.get_event_loop()
+        if self.__session is not None and not self.__session.closed:
+            if self.__owned_session_loop is None or self.__owned_session_loop is loop:
+                return self.__session
+            release_client_session(self.__session, self.__owned_session_loop)
+        self.__session = create_client_session(self.__connector_limit)
+        self.__owned_session_loop = loop
+        return self.__session
+
+    async def close(self):
+        """
+        This interface is used to close the session created by the client itself,
+        a session which is injected by the caller will be left open.
+        """
+        if self.__owned_session_loop is None:
+            return
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        self.__session = None
+        self.__owned_session_loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
 
     async def __post(self, url: str, data: str):
         try:
-            if self.__session is None:
-                async with ClientSession() as session:
-                    async with session.post(url, data=data, timeout=10) as response:
-                        res = json.loads(await response.content.read(-1))
-            else:
-                async with self.__session.post(url, data=data, timeout=10) as response:
-                    res = json.loads(await response.content.read(-1))
+            async with self.__get_session().post(url, data=data, timeout=10) as response:
+                res = json.loads(await response.content.read(-1))
             if res['Error'] != 0:
                 if res['Result'] != '':
                     raise SDKException(ErrorCode.other_error(res['Result']))
@@ -64,15 +124,13 @@ class AioRestful(Restful):
             raise SDKException(ErrorCode.connect_timeout(self._url)) from None
 
     async def __get(self, url):
+        ttl = self.__volatile_ttl if url.split('?')[0].endswith(VOLATILE_PATHS) else 0
+        return await self.__single_flight.do(url, lambda: self.__get_once(url), ttl)
+
+    async def __get_once(self, url):
         try:
-            if self.__session is None:
-                async with ClientSession() as session:
-
-                    async with session.get(url, timeout=10) as response:
-                        res = json.loads(await response.content.read(-1))
-            else:
-                async with self.__session.get(url, timeout=10) as response:
-                    res = json.loads(await response.content.read(-1))
+            async with self.__get_session().get(url, timeout=10) as response:
+                res = json.loads(await response.content.read(-1))
             if res['Error'] != 0:
                 if res['Result'] != '':
                     raise SDKException(ErrorCode.other_error(res['Result']))
@@ -82,6 +140,13 @@ class AioRestful(Restful):
         except (asyncio.TimeoutError, client_exceptions.ClientConnectorError):
             raise SDKException(ErrorCode.connect_timeout(self._url)) from None
 
+    async def __cached_get(self, method: str, key, url: str):
+        response = self._get_cached_response(method, key)
+        if response is None:
+            response = await self.__get(url)
+            self._cache_response(method, key, response)
+        return response
+
     async def get_version(self, is_full: bool = False):
         url = RestfulMethod.get_version(self._url)
         response = await self.__get(url)
@@ -143,18 +208,42 @@ class AioRestful(Restful):
     async def get_block_by_hash(self, block_hash: str,
                                 is_full: bool = False) -> int or dict:
         url = RestfulMethod.get_block_by_hash(self._url, block_hash)
-        response = await self.__get(url)
+        response = await self.__cached_get(CacheMethod.BLOCK_BY_HASH, block_hash, url)
         if is_full:
             return response
         return response['Result']
 
     async def get_block_by_height(self, height: int, is_full: bool = False):
         url = RestfulMethod.get_block_by_height(self._url, height)
-        response = await self.__get(url)
+        response = await self.__cached_get(CacheMethod.BLOCK_BY_HEIGHT, height, url)
         if is_full:
             return response
         return response['Result']
 
+    async def fetch_blocks(self, start: int, end: int, concurrency: int = 16, with_events: bool = False):
+        """
+        This interface is used to fetch the blocks from start height to end height (inclusive). At most concurrency
+        blocks are prefetched ahead, and the blocks are yielded in height order.
+
+        :param with_events: if True, the smart contract events of each block are fetched alongside,
+         and (block, event_list) pairs are yielded.
+        """
+        if not isinstance(start, int) or not isinstance(end, int) or start < 0:
+            raise SDKException(ErrorCode.param_err('the block height should be a non-negative integer.'))
+
+        async def fetch(height: int):
+            if not with_events:
+                return await self.get_block_by_height(height)
+            return tuple(await asyncio.gather(self.get_block_by_height(height),
+                                              self.get_contract_event_by_height(height)))
+
+        results = aio_ordered_map(fetch, range(start, end + 1), concurrency)
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()
+
     async def get_balance(self, b58_address: str, is_full: bool = False):
         url = RestfulMethod.get_account_balance(self._url, b58_address)
         response = await self.__get(url)
@@ -211,7 +300,7 @@ class AioRestful(Restful):
 
     async def get_contract_event_by_tx_hash(self, tx_hash: str, is_full: bool = False):
         url = RestfulMethod.get_contract_event_by_tx_hash(self._url, tx_hash)
-        response = await self.__get(url)
+        response = await self.__cached_get(CacheMethod.CONTRACT_EVENT, tx_hash, url)
         if is_full:
             return response
         return response['Result']
@@ -226,7 +315,7 @@ class AioRestful(Restful):
 
     async def get_transaction_by_tx_hash(self, tx_hash: str, is_full: bool = False):
         url = RestfulMethod.get_transaction(self._url, tx_hash)
-        response = await self.__get(url)
+        response = await self.__cached_get(CacheMethod.TRANSACTION, tx_hash, url)
         if is_full:
             return response
         return response['Result']
@@ -252,7 +341,7 @@ class AioRestful(Restful):
 
     async def get_merkle_proof(self, tx_hash: str, is_full: bool = False):
         url = RestfulMethod.get_merkle_proof(self._url, tx_hash)
-        response = await self.__get(url)
+        response = await self.__cached_get(CacheMethod.MERKLE_PROOF, tx_hash, url)
         if is_full:
             return response
         return response['Result']
@@ -27,6 +27,10 @@ from aiohttp.client import ClientSession
 from ontology.contract.neo.vm import NeoVm
 from ontology.account.account import Account
 from ontology.network.rpc import Rpc, RpcMethod
+from ontology.network.cache import ResponseCache, CacheMethod
+from ontology.network.flight import SingleFlight
+from ontology.network.session import create_client_session, release_client_session, DEFAULT_CONNECTOR_LIMIT
+from ontology.utils.scan import aio_ordered_map
 from ontology.core.transaction import Transaction, TxType
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
@@ -35,11 +39,19 @@ from ontology.contract.neo.abi.abi_function import AbiFunction
 from ontology.vm.build_params import BuildParams
 from ontology.contract.neo.invoke_function import NeoInvokeFunction
 
+NON_IDEMPOTENT_METHODS = (RpcMethod.SEND_TRANSACTION, RpcMethod.SEND_EMERGENCY_GOV_REQ)
+VOLATILE_METHODS = (RpcMethod.GET_BLOCK_COUNT, RpcMethod.GET_CURRENT_BLOCK_HASH, RpcMethod.GET_GAS_PRICE)
+
 
 class AioRpc(Rpc):
-    def __init__(self, url: str = '', qid: int = 0, session: ClientSession = None):
-        super().__init__(url, qid)
+    def __init__(self, url: str = '', qid: int = 0, session: ClientSession = None,
+                 connector_limit: int = DEFAULT_CONNECTOR_LIMIT, cache: ResponseCache = None, volatile_ttl: float = 0):
+        super().__init__(url, qid, cache=cache)
         self._session = session
+        self.__connector_limit = connector_limit
+        self.__owned_session_loop = None
+        self.__single_flight = SingleFlight()
+        self.__volatile_ttl = volatile_ttl
 
     @property
     def session(self):
@@ -50,26 +62,111 @@ class AioRpc(Rpc):
         if not isinstance(session, ClientSession):
             raise SDKException(ErrorCode.param_error)
         self._session = session
+        self.__owned_session_loop = None
+
+    @property
+    def connector_limit(self) -> int:
+        return self.__connector_limit
+
+    @connector_limit.setter
+    def connector_limit(self, limit: int):
+        if not isinstance(limit, int) or limit < 0:
+            raise SDKException(ErrorCode.param_error)
+        self.__connector_limit = limit
+
+    @property
+    def single_flight(self) -> SingleFlight:
+        return self.__single_flight
+
+    @property
+    def volatile_ttl(self) -> float:
+        return self.__volatile_ttl
+
+    @volatile_ttl.setter
+    def volatile_ttl(self, ttl: float):
+        if not isinstance(ttl, (int, float)) or ttl < 0:
+            raise SDKException(ErrorCode.param_error)
+        self.__volatile_ttl = ttl
+        self.__single_flight.clear()
+
+    def __get_session(self) -> ClientSession:
+        loop = asyncio.get_event_loop()
+        if self._session is not None and not self._session.closed:
+            if self.__owned_session_loop is None or self.__owned_session_loop is loop:
+                return self._session
+            release_client_session(self._session, self.__owned_session_loop)
+        self._session = create_client_session(self.__connector_limit)
+        self.__owned_session_loop = loop
+        return self._session
+
+    async def close(self):
+        """
+        This interface is used to close the session created by the client itself,
+        a session which is injected by the caller will be left open.
+        """
+        if self.__owned_session_loop is None:
+            return
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self.__owned_session_loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
 
     async def __post(self, payload):
+        method = payload.get('method', '')
+        if method in NON_IDEMPOTENT_METHODS:
+            return await self.__post_once(payload)
+        key = json.dumps([method, payload.get('params', list())])
+        ttl = self.__volatile_ttl if method in VOLATILE_METHODS else 0
+        return await self.__single_flight.do(key, lambda: self.__post_once(payload), ttl)
+
+    async def __post_once(self, payload):
+        res = await self.__send(payload)
+        if res['error'] != 0:
+            if res['result'] != '':
+                raise SDKException(ErrorCode.other_error(res['result']))
+            else:
+                raise SDKException(ErrorCode.other_error(res['desc']))
+        return res
+
+    async def __send(self, payload):
         header = {'Content-type': 'application/json'}
         try:
-            if self._session is None:
-                async with ClientSession() as session:
-                    async with session.post(self._url, json=payload, headers=header, timeout=10) as response:
-                        res = json.loads(await response.content.read(-1))
-            else:
-                async with self._session.post(self._url, json=payload, headers=header, timeout=10) as response:
-                    res = json.loads(await response.content.read(-1))
-            if res['error'] != 0:
-                if res['result'] != '':
-                    raise SDKException(ErrorCode.other_error(res['result']))
-                else:
-                    raise SDKException(ErrorCode.other_error(res['desc']))
+            async with self.__get_session().post(self._url, json=payload, headers=header, timeout=10) as response:
+                res = json.loads(await response.content.read(-1))
         except (asyncio.TimeoutError, client_exceptions.ClientConnectorError):
             raise SDKException(ErrorCode.connect_timeout(self._url)) from None
         return res
 
+    async def __cached_post(self, method: str, key, payload):
+        response = self._get_cached_response(method, key)
+        if response is None:
+            response = await self.__post(payload)
+            self._cache_response(method, key, response)
+        return response
+
+    async def batch(self, calls: List[tuple], is_full: bool = False) -> List:
+        """
+        This interface is used to send a list of (method, params) calls in a single JSON-RPC 2.0 batch request.
+
+        :param calls: a list of (method, params) tuple, e.g. [(RpcMethod.GET_BALANCE, [b58_address, 1])].
+        :param is_full:
+        :return: a list of results in the same order as the calls.
+        """
+        if len(calls) == 0:
+            return list()
+        payload = self.generate_json_rpc_batch_payload(calls)
+        content = await self.__send(payload)
+        response_list = self._demux_batch_response(payload, content)
+        if is_full:
+            return response_list
+        return [response['result'] for response in response_list]
+
     async def get_version(self, is_full: bool = False):
         """
         This interface is used to get the version information of the connected node in current network.
@@ -121,7 +218,7 @@ class AioRpc(Rpc):
         This interface is used to get the hexadecimal hash value of specified block height in current network.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK, [block_hash, 1])
-        response = await self.__post(payload)
+        response = await self.__cached_post(CacheMethod.BLOCK_BY_HASH, block_hash, payload)
         if is_full:
             return response
         return response['result']
@@ -131,11 +228,35 @@ class AioRpc(Rpc):
         This interface is used to get the block information by block height in current network.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK, [height, 1])
-        response = await self.__post(payload)
+        response = await self.__cached_post(CacheMethod.BLOCK_BY_HEIGHT, height, payload)
         if is_full:
             return response
         return response['result']
 
+    async def fetch_blocks(self, start: int, end: int, concurrency: int = 16, with_events: bool = False):
+        """
+        This interface is used to fetch the blocks from start height to end height (inclusive). At most concurrency
+        blocks are prefetched ahead, and the blocks are yielded in height order.
+
+        :param with_events: if True, the smart contract events of each block are fetched alongside,
+         and (block, event_list) pairs are yielded.
+        """
+        if not isinstance(start, int) or not isinstance(end, int) or start < 0:
+            raise SDKException(ErrorCode.param_err('the block height should be a non-negative integer.'))
+
+        async def fetch(height: int):
+            if not with_events:
+                return await self.get_block_by_height(height)
+            return tuple(await asyncio.gather(self.get_block_by_height(height),
+                                              self.get_contract_event_by_height(height)))
+
+        results = aio_ordered_map(fetch, range(start, end + 1), concurrency)
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()
+
     async def get_block_count(self, is_full: bool = False) -> int or dict:
         """
         This interface is used to get the decimal block number in current network.
@@ -254,12 +375,45 @@ class AioRpc(Rpc):
         This interface is used to get the corresponding smart contract event based on the height of block.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_SMART_CONTRACT_EVENT, [tx_hash, 1])
-        response = await self.__post(payload)
+        response = await self.__cached_post(CacheMethod.CONTRACT_EVENT, tx_hash, payload)
         if is_full:
             return response
         result = response['result']
         return dict() if result is None else result
 
+    async def get_balance_batch(self, b58_address_list: List[str], is_full: bool = False) -> List[dict]:
+        """
+        This interface is used to get the account balances of a list of base58 encoded addresses in one request.
+        """
+        calls = [(RpcMethod.GET_BALANCE, [b58_address, 1]) for b58_address in b58_address_list]
+        response_list = await self.batch(calls, is_full=True)
+        for response in response_list:
+            response['result'] = dict((k.upper(), int(v)) for k, v in response.get('result', dict()).items())
+        if is_full:
+            return response_list
+        return [response['result'] for response in response_list]
+
+    async def get_storage_batch(self, hex_contract_address: str, hex_key_list: List[str],
+                                is_full: bool = False) -> List[str]:
+        """
+        This interface is used to get the stored values of a list of hexadecimal keys in one request.
+        """
+        calls = [(RpcMethod.GET_STORAGE, [hex_contract_address, hex_key, 1]) for hex_key in hex_key_list]
+        response_list = await self.batch(calls, is_full=True)
+        if is_full:
+            return response_list
+        return [response['result'] for response in response_list]
+
+    async def get_contract_event_by_tx_hash_batch(self, tx_hash_list: List[str], is_full: bool = False) -> List[dict]:
+        """
+        This interface is used to get the smart contract events of a list of transaction hash in one request.
+        """
+        calls = [(RpcMethod.GET_SMART_CONTRACT_EVENT, [tx_hash, 1]) for tx_hash in tx_hash_list]
+        response_list = await self.batch(calls, is_full=True)
+        if is_full:
+            return response_list
+        return [dict() if response['result'] is None else response['result'] for response in response_list]
+
     async def get_contract_event_by_height(self, height: int, is_full: bool = False) -> List[dict]:
         """
         This interface is used to get the corresponding smart contract event based on the height of block.
@@ -282,7 +436,7 @@ class AioRpc(Rpc):
         This interface is used to get the corresponding transaction information based on the specified hash value.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_TRANSACTION, [tx_hash, 1])
-        response = await self.__post(payload)
+        response = await self.__cached_post(CacheMethod.TRANSACTION, tx_hash, payload)
         if is_full:
             return response
         result = response['result']
@@ -308,7 +462,7 @@ class AioRpc(Rpc):
         This interface is used to get the corresponding merkle proof based on the specified hexadecimal hash value.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_MERKLE_PROOF, [tx_hash, 1])
-        response = await self.__post(payload)
+        response = await self.__cached_post(CacheMethod.MERKLE_PROOF, tx_hash, payload)
         if is_full:
             return response
         result = response['result']
@@ -0,0 +1,152 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import json
+import sqlite3
+import threading
+
+from collections import OrderedDict
+
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class CacheMethod(object):
+    BLOCK_BY_HEIGHT = 'block_height'
+    BLOCK_BY_HASH = 'block_hash'
+    TRANSACTION = 'transaction'
+    CONTRACT_EVENT = 'contract_event'
+    MERKLE_PROOF = 'merkle_proof'
+
+
+class ResponseCache(object):
+    """
+    A cache of the node responses which never change once the block is final, e.g. blocks, transactions,
+    smart contract events and merkle proofs. The responses are kept in a LRU list bounded by their encoded size,
+    and optionally persisted in a sqlite database. The clients put the responses under a namespace which contains
+    their node address, so that a cache can be shared by the clients of different networks.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MAX_BYTES, disk_path: str = ''):
+        """
+        :param max_bytes: the maximum number of bytes of the responses kept in memory.
+        :param disk_path: the path of the sqlite database used to persist the responses, empty means memory only.
+        """
+        if not isinstance(max_bytes, int) or max_bytes < 0:
+            raise SDKException(ErrorCode.param_err('the max bytes of cache should be a non-negative integer.'))
+        self.__max_bytes = max_bytes
+        self.__entries = OrderedDict()
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = threading.Lock()
+        self.__db = None
+        if disk_path:
+            self.__db = sqlite3.connect(disk_path, check_same_thread=False)
+            self.__db.execute('CREATE TABLE IF NOT EXISTS response (key TEXT PRIMARY KEY, value BLOB NOT NULL)')
+            self.__db.commit()
+
+    @staticmethod
+    def __make_key(namespace: str, method: str, key) -> str:
+        if isinstance(key, str):
+            key = key.lower()
+        return f'{namespace}:{method}:{key}'
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @property
+    def max_bytes(self) -> int:
+        return self.__max_bytes
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __put_memory(self, cache_key: str, value: bytes):
+        old = self.__entries.pop(cache_key, None)
+        if old is not None:
+            self.__size -= len(old)
+        if len(value) > self.__max_bytes:
+            return
+        self.__entries[cache_key] = value
+        self.__size += len(value)
+        while self.__size > self.__max_bytes:
+            _, evicted = self.__entries.popitem(last=False)
+            self.__size -= len(evicted)
+
+    def get(self, namespace: str, method: str, key):
+        """
+        This interface is used to get a cached response, a new object is returned on every call.
+
+        :return: the cached response, or None if it is not cached.
+        """
+        cache_key = self.__make_key(namespace, method, key)
+        with self.__lock:
+            value = self.__entries.get(cache_key)
+            if value is not None:
+                self.__entries.move_to_end(cache_key)
+            elif self.__db is not None:
+                row = self.__db.execute('SELECT value FROM response WHERE key = ?', (cache_key,)).fetchone()
+                if row is not None:
+                    value = bytes(row[0])
+                    self.__put_memory(cache_key, value)
+            if value is None:
+                self.__misses += 1
+                return None
+            self.__hits += 1
+        return json.loads(value)
+
+    def put(self, namespace: str, method: str, key, response: dict):
+        """
+        This interface is used to cache a response, a response without result is never cached.
+        """
+        result = response.get('result', response.get('Result'))
+        if result is None or result == '' or result == dict() or result == list():
+            return
+        cache_key = self.__make_key(namespace, method, key)
+        value = json.dumps(response, separators=(',', ':')).encode('utf-8')
+        with self.__lock:
+            self.__put_memory(cache_key, value)
+            if self.__db is not None:
+                self.__db.execute('INSERT OR REPLACE INTO response (key, value) VALUES (?, ?)', (cache_key, value))
+                self.__db.commit()
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+            if self.__db is not None:
+                self.__db.execute('DELETE FROM response')
+                self.__db.commit()
+
+    def close(self):
+        with self.__lock:
+            if self.__db is not None:
+                self.__db.close()
+                self.__db = None
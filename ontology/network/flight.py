@@ -0,0 +1,81 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import time
+import asyncio
+
+from copy import deepcopy
+from typing import Callable, Awaitable
+
+
+class SingleFlight(object):
+    """
+    Coalesces concurrent identical requests: while a request is in flight, the callers which ask for the same key
+    wait for it instead of sending their own, and each of them receives a copy of the result. The request is
+    cancelled once all of its callers are cancelled, and the later callers send a new one.
+    """
+
+    def __init__(self):
+        self.__calls = dict()
+        self.__values = dict()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self.__calls)
+
+    def __done(self, key: str, future: asyncio.Future, ttl: float):
+        call = self.__calls.get(key)
+        if call is not None and call[0] is future:
+            del self.__calls[key]
+        if ttl > 0 and not future.cancelled() and future.exception() is None:
+            self.__values[key] = (time.monotonic() + ttl, future.result())
+
+    async def do(self, key: str, func: Callable[[], Awaitable], ttl: float = 0):
+        """
+        This interface is used to run func, or to join the call of func which is in flight for the same key.
+
+        :param key: the key which identifies the request.
+        :param func: a function which returns the awaitable request.
+        :param ttl: the seconds for which the result is reused by the later calls, 0 means no reuse.
+        :return: a copy of the result.
+        """
+        if ttl > 0:
+            value = self.__values.get(key)
+            if value is not None:
+                if value[0] > time.monotonic():
+                    return deepcopy(value[1])
+                del self.__values[key]
+        loop = asyncio.get_event_loop()
+        call = self.__calls.get(key)
+        if call is None or call[1] is not loop:
+            future = asyncio.ensure_future(func())
+            call = [future, loop, 0]
+            self.__calls[key] = call
+            future.add_done_callback(lambda f: self.__done(key, f, ttl))
+        call[2] += 1
+        try:
+            return deepcopy(await asyncio.shield(call[0]))
+        finally:
+            call[2] -= 1
+            if call[2] == 0 and not call[0].done():
+                if self.__calls.get(key) is call:
+                    del self.__calls[key]
+                call[0].cancel()
+
+    def clear(self):
+        self.__values.clear()
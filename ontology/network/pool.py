@@ -0,0 +1,292 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import time
+import random
+import asyncio
+import inspect
+import requests
+import threading
+
+from functools import wraps
+from typing import List, Union
+
+from aiohttp import client_exceptions
+
+from ontology.network.rpc import Rpc
+from ontology.network.restful import Restful
+from ontology.network.aiorpc import AioRpc
+from ontology.network.aiorestful import AioRestful
+from ontology.exception.error_code import ErrorCode, CONNECT_ERROR_CODES
+from ontology.exception.exception import SDKException
+
+TRANSPORT_ERRORS = (OSError, asyncio.TimeoutError, requests.exceptions.RequestException,
+                    client_exceptions.ClientError)
+
+
+class SelectStrategy(object):
+    LEAST_OUTSTANDING = 'least_outstanding'
+    LATENCY_WEIGHTED = 'latency_weighted'
+
+
+class CircuitState(object):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class Node(object):
+    def __init__(self, client: Union[Rpc, Restful, AioRpc, AioRestful]):
+        self.client = client
+        self.outstanding = 0
+        self.latency = None
+        self.failures = 0
+        self.state = CircuitState.CLOSED
+        self.opened_at = 0.0
+
+    @property
+    def address(self) -> str:
+        return self.client.get_address()
+
+    def is_available(self, now: float, recovery_timeout: float) -> bool:
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN and now - self.opened_at >= recovery_timeout:
+            self.state = CircuitState.HALF_OPEN
+        if self.state == CircuitState.HALF_OPEN:
+            return self.outstanding == 0
+        return False
+
+    def record_success(self, latency: float, alpha: float):
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency = alpha * latency + (1 - alpha) * self.latency
+        self.failures = 0
+        self.state = CircuitState.CLOSED
+
+    def record_failure(self, now: float, failure_threshold: int):
+        self.failures += 1
+        if self.state == CircuitState.HALF_OPEN or self.failures >= failure_threshold:
+            self.trip(now)
+
+    def trip(self, now: float):
+        self.state = CircuitState.OPEN
+        self.opened_at = now
+
+
+class NodePool(object):
+    """
+    A network client which spreads the calls over several nodes. Every method of the wrapped client is available
+    on the pool. A node which fails to connect is skipped for a while (circuit breaking), and the failed call is
+    retried on another node.
+    """
+
+    def __init__(self, clients: List[Union[Rpc, Restful, AioRpc, AioRestful]],
+                 strategy: str = SelectStrategy.LEAST_OUTSTANDING, failure_threshold: int = 3,
+                 recovery_timeout: float = 30, max_attempts: int = 0, latency_alpha: float = 0.3):
+        """
+        :param clients: a list of network clients of the same type, each one connects to a different node.
+        :param strategy: the node selection strategy, least outstanding requests or latency weighted.
+        :param failure_threshold: the number of consecutive connection failures which opens the circuit of a node.
+        :param recovery_timeout: the seconds before an opened node is tried again.
+        :param max_attempts: the maximum number of nodes tried for one call, 0 means all the nodes.
+        :param latency_alpha: the smoothing factor of the exponentially weighted moving average latency.
+        """
+        if len(clients) == 0:
+            raise SDKException(ErrorCode.param_err('at least one network client is required.'))
+        if strategy not in (SelectStrategy.LEAST_OUTSTANDING, SelectStrategy.LATENCY_WEIGHTED):
+            raise SDKException(ErrorCode.param_err(f'unknown select strategy: {strategy}'))
+        self.__nodes = [Node(client) for client in clients]
+        self.__strategy = strategy
+        self.__failure_threshold = failure_threshold
+        self.__recovery_timeout = recovery_timeout
+        self.__max_attempts = max_attempts if max_attempts > 0 else len(clients)
+        self.__latency_alpha = latency_alpha
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def from_addresses(cls, addresses: List[str], client_type=Rpc, **kwargs):
+        """
+        This interface is used to create a node pool from a list of node addresses,
+        e.g. NodePool.from_addresses(MAIN_RPC_ADDRESS, Rpc).
+        """
+        return cls([client_type(address) for address in addresses], **kwargs)
+
+    @property
+    def nodes(self) -> List[Node]:
+        return list(self.__nodes)
+
+    @property
+    def clients(self) -> list:
+        return [node.client for node in self.__nodes]
+
+    def get_address(self) -> List[str]:
+        return [node.address for node in self.__nodes]
+
+    def __select(self, excluded: List[Node]) -> Node:
+        with self.__lock:
+            now = time.monotonic()
+            candidates = [node for node in self.__nodes
+                          if node not in excluded and node.is_available(now, self.__recovery_timeout)]
+            if len(candidates) == 0:
+                raise SDKException(ErrorCode.no_available_node)
+            if self.__strategy == SelectStrategy.LEAST_OUTSTANDING:
+                node = min(candidates, key=lambda n: (n.outstanding, n.latency or 0))
+            else:
+                measured = [n.latency for n in candidates if n.latency is not None]
+                fastest = min(measured) if len(measured) != 0 else 1.0
+                weights = [1 / max(fastest if n.latency is None else n.latency, 1e-6) for n in candidates]
+                node = random.choices(candidates, weights)[0]
+            node.outstanding += 1
+            return node
+
+    def __release(self, node: Node, start: float, succeed: bool = True, connected: bool = True):
+        with self.__lock:
+            node.outstanding -= 1
+            if not connected:
+                node.record_failure(time.monotonic(), self.__failure_threshold)
+            elif succeed:
+                node.record_success(time.perf_counter() - start, self.__latency_alpha)
+
+    def __call(self, name: str, *args, **kwargs):
+        tried, last_error = list(), None
+        for _ in range(self.__max_attempts):
+            try:
+                node = self.__select(tried)
+            except SDKException:
+                if last_error is not None:
+                    raise last_error from None
+                raise
+            tried.append(node)
+            start = time.perf_counter()
+            try:
+                result = getattr(node.client, name)(*args, **kwargs)
+            except SDKException as e:
+                if e.args[0] not in CONNECT_ERROR_CODES:
+                    self.__release(node, start)
+                    raise
+                self.__release(node, start, connected=False)
+                last_error = e
+                continue
+            except TRANSPORT_ERRORS as e:
+                self.__release(node, start, connected=False)
+                last_error = e
+                continue
+            except BaseException:
+                self.__release(node, start, succeed=False)
+                raise
+            self.__release(node, start)
+            return result
+        raise last_error
+
+    async def __aio_call(self, name: str, *args, **kwargs):
+        tried, last_error = list(), None
+        for _ in range(self.__max_attempts):
+            try:
+                node = self.__select(tried)
+            except SDKException:
+                if last_error is not None:
+                    raise last_error from None
+                raise
+            tried.append(node)
+            start = time.perf_counter()
+            try:
+                result = await getattr(node.client, name)(*args, **kwargs)
+            except SDKException as e:
+                if e.args[0] not in CONNECT_ERROR_CODES:
+                    self.__release(node, start)
+                    raise
+                self.__release(node, start, connected=False)
+                last_error = e
+                continue
+            except TRANSPORT_ERRORS as e:
+                self.__release(node, start, connected=False)
+                last_error = e
+                continue
+            except BaseException:
+                self.__release(node, start, succeed=False)
+                raise
+            self.__release(node, start)
+            return result
+        raise last_error
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        attr = getattr(self.__nodes[0].client, name)
+        if not callable(attr):
+            return attr
+        if inspect.iscoroutinefunction(attr):
+            @wraps(attr)
+            async def aio_wrapper(*args, **kwargs):
+                return await self.__aio_call(name, *args, **kwargs)
+
+            return aio_wrapper
+
+        @wraps(attr)
+        def wrapper(*args, **kwargs):
+            return self.__call(name, *args, **kwargs)
+
+        return wrapper
+
+    def __record_health(self, node: Node, start: float, healthy: bool):
+        with self.__lock:
+            if healthy:
+                node.record_success(time.perf_counter() - start, self.__latency_alpha)
+            else:
+                node.trip(time.monotonic())
+
+    def check_health(self) -> dict:
+        """
+        This interface is used to probe every node of a synchronous pool by querying its block count.
+        A node which does not respond is skipped until its recovery timeout has elapsed.
+
+        :return: a dict which maps the node address to whether the node is healthy.
+        """
+        health = dict()
+        for node in self.__nodes:
+            start = time.perf_counter()
+            try:
+                node.client.get_block_count()
+                healthy = True
+            except (SDKException,) + TRANSPORT_ERRORS:
+                healthy = False
+            self.__record_health(node, start, healthy)
+            health[node.address] = healthy
+        return health
+
+    async def aio_check_health(self) -> dict:
+        """
+        This interface is used to probe every node of an asynchronous pool concurrently by querying its block count.
+
+        :return: a dict which maps the node address to whether the node is healthy.
+        """
+
+        async def probe(node: Node) -> bool:
+            start = time.perf_counter()
+            try:
+                await node.client.get_block_count()
+                healthy = True
+            except (SDKException,) + TRANSPORT_ERRORS:
+                healthy = False
+            self.__record_health(node, start, healthy)
+            return healthy
+
+        result = await asyncio.gather(*[probe(node) for node in self.__nodes])
+        return dict(zip([node.address for node in self.__nodes], result))
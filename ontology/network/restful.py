@@ -21,6 +21,7 @@ import requests
 
 from typing import List, Union
 
+from requests import Session
 from Cryptodome.Random.random import randint
 
 from ontology.account.account import Account
@@ -32,6 +33,8 @@ from ontology.utils.transaction import ensure_bytearray_contract_address
 from ontology.contract.neo.abi.abi_function import AbiFunction
 from ontology.vm.build_params import BuildParams
 from ontology.contract.neo.invoke_function import NeoInvokeFunction
+from ontology.network.session import get_default_session
+from ontology.network.cache import ResponseCache, CacheMethod
 
 TEST_RESTFUL_ADDRESS = ['http://polaris1.ont.io:20334', 'http://polaris2.ont.io:20334', 'http://polaris3.ont.io:20334']
 MAIN_RESTFUL_ADDRESS = ['http://dappnode1.ont.io:20334', 'http://dappnode2.ont.io:20334']
@@ -132,8 +135,51 @@ class RestfulMethod(object):
 
 
 class Restful(object):
-    def __init__(self, url: str = ''):
+    def __init__(self, url: str = '', session: Session = None, cache: ResponseCache = None):
         self._url = url
+        self.__session = session
+        self.__cache = cache
+
+    @property
+    def session(self) -> Session:
+        if self.__session is None:
+            self.__session = get_default_session()
+        return self.__session
+
+    @session.setter
+    def session(self, session: Session):
+        if not isinstance(session, Session):
+            raise SDKException(ErrorCode.param_error)
+        self.__session = session
+
+    @property
+    def cache(self) -> ResponseCache:
+        return self.__cache
+
+    @cache.setter
+    def cache(self, cache: ResponseCache):
+        if cache is not None and not isinstance(cache, ResponseCache):
+            raise SDKException(ErrorCode.param_error)
+        self.__cache = cache
+
+    def __cache_namespace(self) -> str:
+        return f'restful@{self._url}'
+
+    def _get_cached_response(self, method: str, key):
+        if self.__cache is None:
+            return None
+        return self.__cache.get(self.__cache_namespace(), method, key)
+
+    def _cache_response(self, method: str, key, response: dict):
+        if self.__cache is None:
+            return
+        namespace = self.__cache_namespace()
+        self.__cache.put(namespace, method, key, response)
+        block = response.get('Result')
+        if method == CacheMethod.BLOCK_BY_HEIGHT and isinstance(block, dict) and 'Hash' in block:
+            self.__cache.put(namespace, CacheMethod.BLOCK_BY_HASH, block['Hash'], response)
+        elif method == CacheMethod.BLOCK_BY_HASH and isinstance(block, dict) and 'Header' in block:
+            self.__cache.put(namespace, CacheMethod.BLOCK_BY_HEIGHT, block['Header']['Height'], response)
 
     def set_address(self, url: str):
         self._url = url
@@ -158,7 +204,7 @@ class Restful(object):
 
     def __post(self, url: str, data: str):
         try:
-            response = requests.post(url, data=data, timeout=10)
+            response = self.session.post(url, data=data, timeout=10)
         except requests.exceptions.MissingSchema as e:
             raise SDKException(ErrorCode.connect_err(e.args[0]))
         except (requests.exceptions.ConnectTimeout, requests.exceptions.ConnectionError):
@@ -173,9 +219,16 @@ class Restful(object):
             raise SDKException(ErrorCode.other_error(response['Result']))
         return response
 
+    def __cached_get(self, method: str, key, url: str):
+        response = self._get_cached_response(method, key)
+        if response is None:
+            response = self.__get(url)
+            self._cache_response(method, key, response)
+        return response
+
     def __get(self, url: str):
         try:
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
         except requests.exceptions.MissingSchema as e:
             raise SDKException(ErrorCode.connect_err(e.args[0]))
         except (requests.exceptions.ConnectTimeout, requests.exceptions.ConnectionError):
@@ -251,14 +304,14 @@ class Restful(object):
 
     def get_block_by_hash(self, block_hash: str, is_full: bool = False) -> int or dict:
         url = RestfulMethod.get_block_by_hash(self._url, block_hash)
-        response = self.__get(url)
+        response = self.__cached_get(CacheMethod.BLOCK_BY_HASH, block_hash, url)
         if is_full:
             return response
         return response['Result']
 
     def get_block_by_height(self, height: int, is_full: bool = False):
         url = RestfulMethod.get_block_by_height(self._url, height)
-        response = self.__get(url)
+        response = self.__cached_get(CacheMethod.BLOCK_BY_HEIGHT, height, url)
         if is_full:
             return response
         return response['Result']
@@ -314,7 +367,7 @@ class Restful(object):
 
     def get_contract_event_by_tx_hash(self, tx_hash: str, is_full: bool = False):
         url = RestfulMethod.get_contract_event_by_tx_hash(self._url, tx_hash)
-        response = self.__get(url)
+        response = self.__cached_get(CacheMethod.CONTRACT_EVENT, tx_hash, url)
         if is_full:
             return response
         result = response['Result']
@@ -329,7 +382,7 @@ class Restful(object):
 
     def get_transaction_by_tx_hash(self, tx_hash: str, is_full: bool = False):
         url = RestfulMethod.get_transaction(self._url, tx_hash)
-        response = self.__get(url)
+        response = self.__cached_get(CacheMethod.TRANSACTION, tx_hash, url)
         if is_full:
             return response
         result = response['Result']
@@ -355,7 +408,7 @@ class Restful(object):
 
     def get_merkle_proof(self, tx_hash: str, is_full: bool = False):
         url = RestfulMethod.get_merkle_proof(self._url, tx_hash)
-        response = self.__get(url)
+        response = self.__cached_get(CacheMethod.MERKLE_PROOF, tx_hash, url)
         if is_full:
             return response
         return response['Result']
@@ -22,17 +22,20 @@ import requests
 from sys import maxsize
 from typing import List
 
+from requests import Session
 from Cryptodome.Random.random import randint
 
 from ontology.account.account import Account
 from ontology.contract.neo.vm import NeoVm
 from ontology.core.transaction import Transaction, TxType
-from ontology.exception.error_code import ErrorCode
+from ontology.exception.error_code import ErrorCode, CONNECT_ERROR_CODES
 from ontology.exception.exception import SDKException
 from ontology.utils.transaction import ensure_bytearray_contract_address
 from ontology.contract.neo.abi.abi_function import AbiFunction
 from ontology.vm.build_params import BuildParams
 from ontology.contract.neo.invoke_function import NeoInvokeFunction
+from ontology.network.session import get_default_session
+from ontology.network.cache import ResponseCache, CacheMethod
 
 TEST_RPC_ADDRESS = ['http://polaris1.ont.io:20336', 'http://polaris2.ont.io:20336', 'http://polaris3.ont.io:20336',
                     'http://polaris4.ont.io:20336']
@@ -69,11 +72,54 @@ class RpcMethod(object):
 
 
 class Rpc(object):
-    def __init__(self, url: str = '', qid: int = 0):
+    def __init__(self, url: str = '', qid: int = 0, session: Session = None, cache: ResponseCache = None):
         self._url = url
         self._qid = qid
+        self.__session = session
+        self.__cache = cache
         self._generate_qid()
 
+    @property
+    def session(self) -> Session:
+        if self.__session is None:
+            self.__session = get_default_session()
+        return self.__session
+
+    @session.setter
+    def session(self, session: Session):
+        if not isinstance(session, Session):
+            raise SDKException(ErrorCode.param_error)
+        self.__session = session
+
+    @property
+    def cache(self) -> ResponseCache:
+        return self.__cache
+
+    @cache.setter
+    def cache(self, cache: ResponseCache):
+        if cache is not None and not isinstance(cache, ResponseCache):
+            raise SDKException(ErrorCode.param_error)
+        self.__cache = cache
+
+    def __cache_namespace(self) -> str:
+        return f'rpc@{self._url}'
+
+    def _get_cached_response(self, method: str, key):
+        if self.__cache is None:
+            return None
+        return self.__cache.get(self.__cache_namespace(), method, key)
+
+    def _cache_response(self, method: str, key, response: dict):
+        if self.__cache is None:
+            return
+        namespace = self.__cache_namespace()
+        self.__cache.put(namespace, method, key, response)
+        block = response.get('result')
+        if method == CacheMethod.BLOCK_BY_HEIGHT and isinstance(block, dict) and 'Hash' in block:
+            self.__cache.put(namespace, CacheMethod.BLOCK_BY_HASH, block['Hash'], response)
+        elif method == CacheMethod.BLOCK_BY_HASH and isinstance(block, dict) and 'Header' in block:
+            self.__cache.put(namespace, CacheMethod.BLOCK_BY_HEIGHT, block['Header']['Height'], response)
+
     def set_address(self, url: str):
         self._url = url
 
@@ -100,11 +146,19 @@ class Rpc(object):
         rpc_address = f'http://dappnode{index}.ont.io:20336'
         self.set_address(rpc_address)
 
-    @staticmethod
-    def __post(url, payload):
+    def __post(self, url, payload):
+        content = self.__send(url, payload)
+        if content['error'] != 0:
+            if content['result'] != '':
+                raise SDKException(ErrorCode.other_error(content['result'])) from None
+            else:
+                raise SDKException(ErrorCode.other_error(content['desc'])) from None
+        return content
+
+    def __send(self, url, payload):
         header = {'Content-type': 'application/json'}
         try:
-            response = requests.post(url, json=payload, headers=header, timeout=10)
+            response = self.session.post(url, json=payload, headers=header, timeout=10)
         except requests.exceptions.MissingSchema as e:
             raise SDKException(ErrorCode.connect_err(e.args[0])) from None
         except (requests.exceptions.ConnectTimeout,
@@ -121,18 +175,19 @@ class Rpc(object):
             content = json.loads(content)
         except json.decoder.JSONDecodeError as e:
             raise SDKException(ErrorCode.other_error(e.args[0])) from None
-        if content['error'] != 0:
-            if content['result'] != '':
-                raise SDKException(ErrorCode.other_error(content['result'])) from None
-            else:
-                raise SDKException(ErrorCode.other_error(content['desc'])) from None
         return content
 
-    @staticmethod
-    def __get(url, payload):
+    def __cached_post(self, method: str, key, payload):
+        response = self._get_cached_response(method, key)
+        if response is None:
+            response = self.__post(self._url, payload)
+            self._cache_response(method, key, response)
+        return response
+
+    def __get(self, url, payload):
         header = {'Content-type': 'application/json'}
         try:
-            response = requests.get(url, params=json.dumps(payload), headers=header, timeout=10)
+            response = self.session.get(url, params=json.dumps(payload), headers=header, timeout=10)
         except requests.exceptions.MissingSchema as e:
             raise SDKException(ErrorCode.connect_err(e.args[0]))
         except (requests.exceptions.ConnectionError, requests.exceptions.ConnectTimeout):
@@ -154,12 +209,67 @@ class Rpc(object):
                 raise SDKException(ErrorCode.other_error(content['desc']))
         return content
 
-    def generate_json_rpc_payload(self, method, param=None):
+    def generate_json_rpc_payload(self, method, param=None, qid: int = 0):
         if param is None:
             param = list()
-        json_rpc_payload = dict(jsonrpc=RpcMethod.RPC_VERSION, id=self._qid, method=method, params=param)
+        if qid == 0:
+            qid = self._qid
+        json_rpc_payload = dict(jsonrpc=RpcMethod.RPC_VERSION, id=qid, method=method, params=param)
         return json_rpc_payload
 
+    def generate_json_rpc_batch_payload(self, calls: List[tuple]) -> List[dict]:
+        """
+        This interface is used to pack a list of (method, params) calls into a JSON-RPC 2.0 batch,
+        each call is given an unique id which is its 1-based position in the list.
+        """
+        return [self.generate_json_rpc_payload(method, param, index) for index, (method, param) in
+                enumerate(calls, start=1)]
+
+    @staticmethod
+    def _demux_batch_response(batch_payload: List[dict], content) -> List[dict]:
+        if not isinstance(content, list):
+            if isinstance(content, dict) and content.get('error', 0) != 0:
+                raise SDKException(ErrorCode.batch_not_supported(content.get('desc', '')))
+            raise SDKException(ErrorCode.batch_not_supported('invalid batch response'))
+        response_map = dict()
+        for response in content:
+            if isinstance(response, dict):
+                response_map[response.get('id')] = response
+        response_list = list()
+        for payload in batch_payload:
+            response = response_map.get(payload['id'])
+            if response is None:
+                msg = f'missing response of batch request {payload["id"]}'
+                raise SDKException(ErrorCode.batch_not_supported(msg))
+            if response.get('error', 0) != 0:
+                if response.get('result', '') not in ('', None):
+                    raise SDKException(ErrorCode.other_error(response['result']))
+                raise SDKException(ErrorCode.other_error(response.get('desc', '')))
+            response_list.append(response)
+        return response_list
+
+    def batch(self, calls: List[tuple], is_full: bool = False) -> List:
+        """
+        This interface is used to send a list of (method, params) calls in a single JSON-RPC 2.0 batch request.
+
+        :param calls: a list of (method, params) tuple, e.g. [(RpcMethod.GET_BALANCE, [b58_address, 1])].
+        :param is_full:
+        :return: a list of results in the same order as the calls.
+        """
+        if len(calls) == 0:
+            return list()
+        payload = self.generate_json_rpc_batch_payload(calls)
+        try:
+            content = self.__send(self._url, payload)
+        except SDKException as e:
+            if e.args[0] in CONNECT_ERROR_CODES:
+                raise
+            raise SDKException(ErrorCode.batch_not_supported(e.args[1])) from None
+        response_list = self._demux_batch_response(payload, content)
+        if is_full:
+            return response_list
+        return [response['result'] for response in response_list]
+
     def get_version(self, is_full: bool = False) -> dict or str:
         """
         This interface is used to get the version information of the connected node in current network.
@@ -217,7 +327,7 @@ class Rpc(object):
         :return: the block information of the specified block hash.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK, [block_hash, 1])
-        response = self.__post(self._url, payload)
+        response = self.__cached_post(CacheMethod.BLOCK_BY_HASH, block_hash, payload)
         if is_full:
             return response
         return response['result']
@@ -229,7 +339,7 @@ class Rpc(object):
             the decimal total number of blocks in current network.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK, [height, 1])
-        response = self.__post(self._url, payload)
+        response = self.__cached_post(CacheMethod.BLOCK_BY_HEIGHT, height, payload)
         if is_full:
             return response
         return response['result']
@@ -311,6 +421,22 @@ class Rpc(object):
             return response
         return response['result']
 
+    def get_balance_batch(self, b58_address_list: List[str], is_full: bool = False) -> List[dict]:
+        """
+        This interface is used to get the account balances of a list of base58 encoded addresses in one request.
+
+        :param b58_address_list: a list of base58 encoded account address.
+        :param is_full:
+        :return: a list of account balance in dictionary form, in the same order as the addresses.
+        """
+        calls = [(RpcMethod.GET_BALANCE, [b58_address, 1]) for b58_address in b58_address_list]
+        response_list = self.batch(calls, is_full=True)
+        for response in response_list:
+            response['result'] = dict((k.upper(), int(v)) for k, v in response.get('result', dict()).items())
+        if is_full:
+            return response_list
+        return [response['result'] for response in response_list]
+
     def get_unbound_ong(self, b58_address: str, is_full: bool = False):
         payload = self.generate_json_rpc_payload(RpcMethod.GET_UNBOUND_ONG, [b58_address])
         response = self.__post(self._url, payload)
@@ -364,12 +490,42 @@ class Rpc(object):
         :return: the information of smart contract event in dictionary form.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_SMART_CONTRACT_EVENT, [tx_hash, 1])
-        response = self.__post(self._url, payload)
+        response = self.__cached_post(CacheMethod.CONTRACT_EVENT, tx_hash, payload)
         if is_full:
             return response
         result = response['result']
         return dict() if result is None else result
 
+    def get_storage_batch(self, hex_contract_address: str, hex_key_list: List[str],
+                          is_full: bool = False) -> List[str]:
+        """
+        This interface is used to get the stored values of a list of hexadecimal keys in one request.
+
+        :param hex_contract_address: hexadecimal contract address.
+        :param hex_key_list: a list of hexadecimal stored key.
+        :param is_full:
+        :return: a list of contract storage, in the same order as the keys.
+        """
+        calls = [(RpcMethod.GET_STORAGE, [hex_contract_address, hex_key, 1]) for hex_key in hex_key_list]
+        response_list = self.batch(calls, is_full=True)
+        if is_full:
+            return response_list
+        return [response['result'] for response in response_list]
+
+    def get_contract_event_by_tx_hash_batch(self, tx_hash_list: List[str], is_full: bool = False) -> List[dict]:
+        """
+        This interface is used to get the smart contract events of a list of transaction hash in one request.
+
+        :param tx_hash_list: a list of hexadecimal hash value.
+        :param is_full:
+        :return: a list of smart contract event in dictionary form, in the same order as the hashes.
+        """
+        calls = [(RpcMethod.GET_SMART_CONTRACT_EVENT, [tx_hash, 1]) for tx_hash in tx_hash_list]
+        response_list = self.batch(calls, is_full=True)
+        if is_full:
+            return response_list
+        return [dict() if response['result'] is None else response['result'] for response in response_list]
+
     def get_contract_event_by_height(self, height: int, is_full: bool = False) -> List[dict]:
         """
         This interface is used to get the corresponding smart contract event based on the height of block.
@@ -397,7 +553,7 @@ class Rpc(object):
         :return: dict
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_TRANSACTION, [tx_hash, 1])
-        response = self.__post(self._url, payload)
+        response = self.__cached_post(CacheMethod.TRANSACTION, tx_hash, payload)
         if is_full:
             return response
         return response['result']
@@ -427,7 +583,7 @@ class Rpc(object):
         :return: the merkle proof in dictionary form.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_MERKLE_PROOF, [tx_hash, 1])
-        response = self.__post(self._url, payload)
+        response = self.__cached_post(CacheMethod.MERKLE_PROOF, tx_hash, payload)
         if is_full:
             return response
         return response['result']
@@ -476,6 +632,17 @@ class Rpc(object):
             return response
         return response['result']
 
+    def send_raw_transaction_pre_exec_batch(self, tx_list: List[Transaction], is_full: bool = False) -> List[dict]:
+        """
+        This interface is used to pre-execute a list of transactions in one batch request.
+
+        :param tx_list: a list of Transaction object in ontology Python SDK.
+        :param is_full: Whether to return all information.
+        :return: a list of the execution results, in the same order as the transactions.
+        """
+        calls = [(RpcMethod.SEND_TRANSACTION, [tx.serialize(is_hex=True), 1]) for tx in tx_list]
+        return self.batch(calls, is_full)
+
     def send_neo_vm_tx_pre_exec(self, contract_address: str or bytes or bytearray, func: AbiFunction or NeoInvokeFunction,
                                 signer: Account = None, is_full: bool = False):
         contract_address = ensure_bytearray_contract_address(contract_address)
@@ -0,0 +1,95 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import threading
+
+from aiohttp import TCPConnector
+from aiohttp.client import ClientSession
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+DEFAULT_CONNECTOR_LIMIT = 100
+DEFAULT_DNS_CACHE_TTL = 300
+
+__default_session__ = None
+__default_session_lock__ = threading.Lock()
+
+
+def create_session(pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                   max_retries: int = 0) -> Session:
+    """
+    This interface is used to create a keep-alive HTTP session backed by a connection pool.
+
+    :param pool_connections: the number of hosts whose connection pools are cached.
+    :param pool_maxsize: the maximum number of persistent connections kept for each host.
+    :param max_retries: the number of retries on failed connections.
+    :return: a requests Session object which can be shared between network clients.
+    """
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries)
+    session = Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'Connection': 'keep-alive'})
+    return session
+
+
+def get_default_session() -> Session:
+    """
+    This interface is used to get the process-wide HTTP session shared by Rpc and Restful clients.
+
+    :return: the default requests Session object.
+    """
+    global __default_session__
+    if __default_session__ is None:
+        with __default_session_lock__:
+            if __default_session__ is None:
+                __default_session__ = create_session()
+    return __default_session__
+
+
+def create_client_session(connector_limit: int = DEFAULT_CONNECTOR_LIMIT) -> ClientSession:
+    """
+    This interface is used to create an aiohttp session whose connector bounds the number of concurrent connections.
+    It should be called inside the event loop which will use the session.
+
+    :param connector_limit: the maximum number of simultaneous connections, 0 means no limit.
+    :return: an aiohttp ClientSession object.
+    """
+    connector = TCPConnector(limit=connector_limit, ttl_dns_cache=DEFAULT_DNS_CACHE_TTL)
+    return ClientSession(connector=connector)
+
+
+def release_client_session(session: ClientSession, loop: asyncio.AbstractEventLoop):
+    """
+    This interface is used to close a session created in another event loop, which can not be awaited directly.
+    A session of a closed loop is closed in the current loop, otherwise it is closed in the loop it belongs to.
+
+    :param session: an aiohttp ClientSession object.
+    :param loop: the event loop in which the session was created.
+    """
+    if session is None or session.closed:
+        return
+    if loop is None or loop.is_closed():
+        asyncio.ensure_future(session.close())
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+    else:
+        loop.create_task(session.close())
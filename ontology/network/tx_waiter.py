@@ -0,0 +1,122 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+
+from typing import Iterable
+
+from ontology.utils.scan import aio_ordered_map
+from ontology.network.websocket import Websocket
+from ontology.exception.error_code import CONNECT_ERROR_CODES
+from ontology.exception.exception import SDKException
+
+DEFAULT_WAIT_TIMEOUT = 60
+DEFAULT_POLL_INTERVAL = 1
+DEFAULT_MAX_POLL_INTERVAL = 6
+
+
+def _collect_block(block: dict, pending: set, found: dict):
+    height = block.get('Header', dict()).get('Height', 0)
+    for tx in block.get('Transactions', list()):
+        tx_hash = tx.get('Hash', '')
+        if tx_hash in pending:
+            pending.discard(tx_hash)
+            found[tx_hash] = height
+
+
+async def _poll_blocks(network, pending: set, found: dict, last_height: int, poll_interval: float,
+                       max_poll_interval: float):
+    delay = poll_interval
+    while len(pending) != 0:
+        current_height = await network.get_block_height()
+        if current_height <= last_height:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            continue
+        delay = poll_interval
+        blocks = aio_ordered_map(network.get_block_by_height, range(last_height + 1, current_height + 1))
+        try:
+            async for block in blocks:
+                _collect_block(block, pending, found)
+        finally:
+            await blocks.aclose()
+        last_height = current_height
+
+
+async def _stream_blocks(websocket: Websocket, pending: set, found: dict, last_height: int):
+    stream = websocket.stream(events=False, blocks=True, start_height=last_height + 1)
+    try:
+        async for push in stream:
+            if push.get('Action', '') == 'sendjsonblock':
+                _collect_block(push.get('Result', dict()), pending, found)
+            if len(pending) == 0:
+                return
+    finally:
+        await stream.aclose()
+
+
+async def aio_wait_for_transactions(network, tx_hashes: Iterable[str], timeout: float = DEFAULT_WAIT_TIMEOUT,
+                                    poll_interval: float = DEFAULT_POLL_INTERVAL,
+                                    max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+                                    websocket: Websocket = None) -> dict:
+    """
+    This interface is used to wait until the transactions are committed, and return the block heights of them in
+    the form of {tx_hash: height}. The transactions which are not committed in the timeout are left out.
+
+    The transactions committed before waiting are found by their hash, and after that each new block is fetched
+    once and shared by all the pending transactions, so the number of queries does not grow with transactions.
+
+    :param network: an asynchronous network client, e.g. sdk.default_aio_network.
+    :param poll_interval: the initial seconds between two block height polls, doubled while no block is produced.
+    :param max_poll_interval: the maximum seconds between two block height polls.
+    :param websocket: if set, the new blocks are received from its block subscription instead of polling.
+    """
+    pending = set(tx_hashes)
+    found = dict()
+
+    async def get_height(tx_hash: str):
+        try:
+            return tx_hash, await network.get_block_height_by_tx_hash(tx_hash)
+        except SDKException as e:
+            if e.args[0] in CONNECT_ERROR_CODES:
+                raise
+            return tx_hash, None
+
+    async def wait():
+        last_height = await network.get_block_height()
+        heights = aio_ordered_map(get_height, list(pending))
+        try:
+            async for tx_hash, height in heights:
+                if isinstance(height, int):
+                    pending.discard(tx_hash)
+                    found[tx_hash] = height
+        finally:
+            await heights.aclose()
+        if len(pending) == 0:
+            return
+        if websocket is None:
+            await _poll_blocks(network, pending, found, last_height, poll_interval, max_poll_interval)
+        else:
+            await _stream_blocks(websocket, pending, found, last_height)
+
+    if len(pending) != 0:
+        try:
+            await asyncio.wait_for(wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+    return found
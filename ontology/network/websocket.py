@@ -18,33 +18,48 @@ along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 
 import json
 import socket
+import asyncio
 
-from sys import maxsize
 from websockets import client
+from websockets.exceptions import ConnectionClosed
 from typing import List, Union
+from collections import OrderedDict
 
 from Cryptodome.Random.random import randint
 
 from ontology.account.account import Account
 from ontology.contract.neo.vm import NeoVm
 from ontology.core.transaction import Transaction
-from ontology.exception.error_code import ErrorCode
+from ontology.exception.error_code import ErrorCode, CONNECT_ERROR_CODES
 from ontology.exception.exception import SDKException
 from ontology.contract.neo.abi.abi_function import AbiFunction
 from ontology.vm.build_params import BuildParams
 from ontology.contract.neo.invoke_function import NeoInvokeFunction
 from ontology.utils.transaction import ensure_bytearray_contract_address
 
+MAX_WS_ID = 0x7fffffff
+PUSH_ACTIONS = ('Notify', 'sendjsonblock', 'sendrawblock', 'sendblocktxhashs')
+
 
 class Websocket(object):
-    def __init__(self, url: str = ''):
+    def __init__(self, url: str = '', push_buffer_size: int = 1024, timeout: float = 10):
         self.__url = url
+        self.__timeout = timeout
         self.__id = 0
         self.__ws_client = None
+        self.__reader = None
+        self.__pending = dict()
+        self.__push_queue = None
+        self.__push_buffer_size = push_buffer_size
+        self.__push_limit = 0
+        self.__push_drained = None
+        self.__connect_lock = None
 
     def __generate_ws_id(self):
         if self.__id == 0:
-            self.__id = randint(0, maxsize)
+            self.__id = randint(1, MAX_WS_ID)
+        else:
+            self.__id = self.__id % MAX_WS_ID + 1
         return self.__id
 
     def set_address(self, url: str):
@@ -71,24 +86,86 @@ class Websocket(object):
     async def connect(self):
         try:
             self.__ws_client = await client.connect(self.__url)
-        except ConnectionAbortedError as e:
-            raise SDKException(ErrorCode.other_error(e.args[1])) from None
-        except socket.gaierror as e:
-            raise SDKException(ErrorCode.other_error(e.args[1])) from None
+        except (ConnectionAbortedError, socket.gaierror) as e:
+            raise SDKException(ErrorCode.connect_err(str(e))) from None
+        if self.__push_queue is None:
+            self.__push_queue = asyncio.Queue()
+            self.__push_drained = asyncio.Event()
+        self.__pending = dict()
+        self.__reader = asyncio.ensure_future(self.__read_loop(self.__ws_client, self.__pending))
 
     async def close_connect(self):
         if isinstance(self.__ws_client, client.WebSocketClientProtocol) and not self.__ws_client.closed:
             await self.__ws_client.close()
+        self.__set_push_limit(0)
+        if self.__reader is not None and not self.__reader.done():
+            await asyncio.wait([self.__reader], timeout=1)
 
-    async def __send_recv(self, msg: dict, is_full: bool):
-        if self.__ws_client is None or self.__ws_client.closed:
+    async def __read_loop(self, ws_client, pending: dict):
+        try:
+            async for message in ws_client:
+                try:
+                    response = json.loads(message)
+                except ValueError:
+                    continue
+                future = pending.pop(response.get('Id'), None) if isinstance(response, dict) else None
+                if future is not None:
+                    if not future.done():
+                        future.set_result(response)
+                    continue
+                await self.__put_push(response, pending)
+        except ConnectionClosed:
+            pass
+        finally:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(SDKException(ErrorCode.connect_err('websocket connection closed.')))
+            pending.clear()
+
+    async def __put_push(self, response, pending: dict):
+        while 0 < self.__push_limit <= self.__push_queue.qsize() and len(pending) == 0:
+            self.__push_drained.clear()
+            await self.__push_drained.wait()
+        if 0 < self.__push_buffer_size <= self.__push_queue.qsize():
+            self.__push_queue.get_nowait()
+        self.__push_queue.put_nowait(response)
+
+    def __set_push_limit(self, limit: int):
+        self.__push_limit = limit
+        if self.__push_drained is not None:
+            self.__push_drained.set()
+
+    async def __ensure_connect(self):
+        if self.__ws_client is not None and not self.__ws_client.closed:
+            return
+        if self.__connect_lock is None:
+            self.__connect_lock = asyncio.Lock()
+        async with self.__connect_lock:
+            if self.__ws_client is not None and not self.__ws_client.closed:
+                return
             try:
                 await self.connect()
             except TimeoutError:
                 raise SDKException(ErrorCode.connect_timeout(self.__url)) from None
-        await self.__ws_client.send(json.dumps(msg))
-        response = await self.__ws_client.recv()
-        response = json.loads(response)
+
+    async def __send_recv(self, msg: dict, is_full: bool):
+        await self.__ensure_connect()
+        ws_id = self.__generate_ws_id()
+        msg['Id'] = ws_id
+        pending = self.__pending
+        future = asyncio.get_event_loop().create_future()
+        pending[ws_id] = future
+        if self.__push_drained is not None:
+            self.__push_drained.set()
+        try:
+            await self.__ws_client.send(json.dumps(msg))
+            response = await asyncio.wait_for(future, self.__timeout)
+        except ConnectionClosed:
+            raise SDKException(ErrorCode.connect_err('websocket connection closed.')) from None
+        except asyncio.TimeoutError:
+            raise SDKException(ErrorCode.connect_timeout(self.__url)) from None
+        finally:
+            pending.pop(ws_id, None)
         if is_full:
             return response
         if response['Error'] != 0:
@@ -96,27 +173,19 @@ class Websocket(object):
         return response.get('Result', dict())
 
     async def send_heartbeat(self, is_full: bool = False):
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='heartbeat', Version='V1.0.0', Id=self.__id)
+        msg = dict(Action='heartbeat', Version='V1.0.0')
         return await self.__send_recv(msg, is_full)
 
     async def get_connection_count(self, is_full: bool = False) -> int:
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getconnectioncount', Id=self.__id, Version='1.0.0')
+        msg = dict(Action='getconnectioncount', Version='1.0.0')
         return await self.__send_recv(msg, is_full)
 
     async def get_session_count(self, is_full: bool = False):
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getsessioncount', Id=self.__id, Version='1.0.0')
+        msg = dict(Action='getsessioncount', Version='1.0.0')
         return await self.__send_recv(msg, is_full)
 
     async def get_balance(self, b58_address: str, is_full: bool = False):
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getbalance', Id=self.__id, Version='1.0.0', Addr=b58_address)
+        msg = dict(Action='getbalance', Version='1.0.0', Addr=b58_address)
         response = await self.__send_recv(msg, is_full=True)
         try:
             response['Result'] = dict((k.upper(), int(v)) for k, v in response.get('Result', dict()).items())
@@ -127,48 +196,34 @@ class Websocket(object):
         return response['Result']
 
     async def get_merkle_proof(self, tx_hash: str, is_full: bool = False):
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getmerkleproof', Id=self.__id, Version='1.0.0', Hash=tx_hash, Raw=0)
+        msg = dict(Action='getmerkleproof', Version='1.0.0', Hash=tx_hash, Raw=0)
         return await self.__send_recv(msg, is_full)
 
     async def get_storage(self, hex_contract_address: str, key: str, is_full: bool = False):
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getstorage', Id=self.__id, Version='1.0.0', Hash=hex_contract_address, Key=key)
+        msg = dict(Action='getstorage', Version='1.0.0', Hash=hex_contract_address, Key=key)
         return await self.__send_recv(msg, is_full)
 
     async def get_contract(self, hex_contract_address: str, is_full: bool = False):
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getcontract', Id=self.__id, Version='1.0.0', Hash=hex_contract_address, Raw=0)
+        msg = dict(Action='getcontract', Version='1.0.0', Hash=hex_contract_address, Raw=0)
         response = await self.__send_recv(msg, is_full=True)
         if is_full:
             return response
         return response['Result']
 
     async def get_contract_event_by_tx_hash(self, tx_hash: str, is_full: bool = False) -> dict:
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getsmartcodeeventbyhash', Id=self.__id, Version='1.0.0', Hash=tx_hash, Raw=0)
+        msg = dict(Action='getsmartcodeeventbyhash', Version='1.0.0', Hash=tx_hash, Raw=0)
         return await self.__send_recv(msg, is_full)
 
     async def get_contract_event_by_height(self, height: int, is_full: bool = False):
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getsmartcodeeventbyheight', Id=self.__id, Version='1.0.0', Height=height)
+        msg = dict(Action='getsmartcodeeventbyheight', Version='1.0.0', Height=height)
         return await self.__send_recv(msg, is_full)
 
     async def get_block_height(self, is_full: bool = False) -> dict:
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getblockheight', Id=self.__id, Version='1.0.0')
+        msg = dict(Action='getblockheight', Version='1.0.0')
         return await self.__send_recv(msg, is_full)
 
     async def get_block_height_by_tx_hash(self, tx_hash: str, is_full: bool = False):
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getblockheightbytxhash', Id=self.__id, Version='1.0.0', Hash=tx_hash)
+        msg = dict(Action='getblockheightbytxhash', Version='1.0.0', Hash=tx_hash)
         response = await self.__send_recv(msg, is_full=True)
         if response.get('Result', '') == '':
             raise SDKException(ErrorCode.invalid_tx_hash(tx_hash))
@@ -177,58 +232,184 @@ class Websocket(object):
         return response['Result']
 
     async def get_block_hash_by_height(self, height: int, is_full: bool = False):
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getblockhash', Id=self.__id, Version='1.0.0', Height=height)
+        msg = dict(Action='getblockhash', Version='1.0.0', Height=height)
         return await self.__send_recv(msg, is_full)
 
     async def get_block_by_height(self, height: int, is_full: bool = False) -> dict:
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getblockbyheight', Version='1.0.0', Id=self.__id, Raw=0, Height=height)
+        msg = dict(Action='getblockbyheight', Version='1.0.0', Raw=0, Height=height)
         return await self.__send_recv(msg, is_full)
 
     async def get_block_by_hash(self, block_hash: str, is_full: bool = False) -> dict:
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getblockbyhash', Version='1.0.0', Id=self.__id, Hash=block_hash)
+        msg = dict(Action='getblockbyhash', Version='1.0.0', Hash=block_hash)
         return await self.__send_recv(msg, is_full)
 
     async def get_unbound_ong(self, b58_address: str, is_full: bool = False):
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
-        msg = dict(Action='getunboundong', Version='1.0.0', Id=self.__id, Addr=b58_address)
+        msg = dict(Action='getunboundong', Version='1.0.0', Addr=b58_address)
         return int(await self.__send_recv(msg, is_full))
 
     async def subscribe(self, contract_address_list: List[str] or str, is_event: bool = False,
                         is_json_block: bool = False,
                         is_raw_block: bool = False, is_tx_hash: bool = False, is_full: bool = False) -> dict:
-        if self.__id == 0:
-            self.__id = self.__generate_ws_id()
         if isinstance(contract_address_list, str):
             contract_address_list = [contract_address_list]
-        msg = dict(Action='subscribe', Version='1.0.0', Id=self.__id, ContractsFilter=contract_address_list,
+        msg = dict(Action='subscribe', Version='1.0.0', ContractsFilter=contract_address_list,
                    SubscribeEvent=is_event, SubscribeJsonBlock=is_json_block, SubscribeRawBlock=is_raw_block,
                    SubscribeBlockTxHashs=is_tx_hash)
         return await self.__send_recv(msg, is_full)
 
     async def recv_subscribe_info(self, is_full: bool = False):
-        response = await self.__ws_client.recv()
-        response = json.loads(response)
+        """
+        This interface is used to receive the next message pushed by the node after subscribing,
+        the responses of the requests are never returned here.
+        """
+        if self.__push_queue is None:
+            self.__push_queue = asyncio.Queue()
+            self.__push_drained = asyncio.Event()
+        if not self.__push_queue.empty():
+            response = self.__push_queue.get_nowait()
+        else:
+            if self.__reader is None or self.__reader.done():
+                raise SDKException(ErrorCode.connect_err('websocket connection closed.'))
+            getter = asyncio.ensure_future(self.__push_queue.get())
+            try:
+                await asyncio.wait([getter, self.__reader], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                if not getter.done():
+                    getter.cancel()
+            if not getter.done() or getter.cancelled():
+                raise SDKException(ErrorCode.connect_err('websocket connection closed.'))
+            response = getter.result()
+        self.__push_drained.set()
         if is_full:
             return response
         if response['Error'] != 0:
             raise SDKException(ErrorCode.other_error(response.get('Result', '')))
         return response.get('Result', dict())
 
+    async def stream(self, contracts: List[str] or str = None, events: bool = True, blocks: bool = True,
+                     buffer_size: int = 256, start_height: int = None, heartbeat_interval: float = 30,
+                     reconnect_delay: float = 1, max_reconnect_delay: float = 30):
+        """
+        This interface is used to iterate over the messages pushed by the node, e.g.
+
+            async for push in sdk.websocket.stream(contracts=[hex_contract_address], blocks=False):
+                ...
+
+        The connection is kept alive by heartbeats. When it drops, the client reconnects, subscribes again and
+        replays the blocks and events which were missed since the last seen height.
+
+        :param contracts: a list of hexadecimal contract address used to filter the smart contract events.
+        :param events: whether to receive the smart contract events, pushed as 'Notify' messages.
+        :param blocks: whether to receive the blocks in json form, pushed as 'sendjsonblock' messages.
+        :param buffer_size: the maximum number of messages buffered before the socket stops being read, the socket
+                            is still read while a request is waiting for its response.
+        :param start_height: if set, the blocks and events since this height are replayed before the live ones.
+        :param heartbeat_interval: the seconds between two heartbeats.
+        :param reconnect_delay: the initial seconds waited before reconnecting, doubled on each failure.
+        :param max_reconnect_delay: the maximum seconds waited before reconnecting.
+        :return: an asynchronous iterator of the pushed messages in full form.
+        """
+        if contracts is None:
+            contracts = list()
+        elif isinstance(contracts, str):
+            contracts = [contracts]
+        last_height = None if start_height is None else start_height - 1
+        recent_tx = OrderedDict()
+        delay = reconnect_delay
+        while True:
+            heartbeat = None
+            try:
+                await self.__ensure_connect()
+                self.__set_push_limit(0)
+                await self.subscribe(contracts, is_event=events, is_json_block=blocks, is_tx_hash=not blocks)
+                current_height = await self.get_block_height()
+                if last_height is None:
+                    last_height = current_height
+                for height in range(last_height + 1, current_height + 1):
+                    for push in await self.__replay_height(height, contracts, events, blocks):
+                        if self.__is_new_push(push, recent_tx, buffer_size):
+                            yield push
+                    last_height = height
+                self.__set_push_limit(buffer_size)
+                heartbeat = asyncio.ensure_future(self.__heartbeat_loop(heartbeat_interval))
+                delay = reconnect_delay
+                while True:
+                    push = await self.recv_subscribe_info(is_full=True)
+                    action = push.get('Action', '')
+                    if action not in PUSH_ACTIONS:
+                        continue
+                    if action != 'Notify':
+                        height = self.__get_push_height(push)
+                        if height <= last_height:
+                            continue
+                        last_height = height
+                        if not blocks:
+                            continue
+                    elif not self.__is_new_push(push, recent_tx, buffer_size):
+                        continue
+                    yield push
+            except SDKException as e:
+                if e.args[0] not in CONNECT_ERROR_CODES:
+                    raise
+            except (ConnectionClosed, OSError):
+                pass
+            finally:
+                if heartbeat is not None:
+                    heartbeat.cancel()
+                self.__set_push_limit(0)
+            await self.close_connect()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_reconnect_delay)
+
+    async def __replay_height(self, height: int, contracts: List[str], events: bool, blocks: bool) -> List[dict]:
+        push_list = list()
+        if events:
+            event_list = await self.get_contract_event_by_height(height)
+            for event in event_list if isinstance(event_list, list) else list():
+                notify_list = event.get('Notify', list())
+                if len(contracts) != 0 and all(n.get('ContractAddress') not in contracts for n in notify_list):
+                    continue
+                push_list.append(dict(Action='Notify', Desc='SUCCESS', Error=0, Result=event, Version='1.0.0'))
+        if blocks:
+            block = await self.get_block_by_height(height)
+            push_list.append(dict(Action='sendjsonblock', Desc='SUCCESS', Error=0, Result=block, Version='1.0.0'))
+        return push_list
+
+    @staticmethod
+    def __get_push_height(push: dict) -> int:
+        result = push.get('Result', dict())
+        if 'Header' in result:
+            return result['Header']['Height']
+        return result.get('Height', 0)
+
+    @staticmethod
+    def __is_new_push(push: dict, recent_tx: OrderedDict, capacity: int) -> bool:
+        if push['Action'] != 'Notify':
+            return True
+        tx_hash = push.get('Result', dict()).get('TxHash', '')
+        if tx_hash in recent_tx:
+            return False
+        recent_tx[tx_hash] = None
+        while len(recent_tx) > max(capacity, 1024):
+            recent_tx.popitem(last=False)
+        return True
+
+    async def __heartbeat_loop(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.send_heartbeat()
+            except SDKException:
+                pass
+
     async def send_raw_transaction(self, tx: Transaction, is_full: bool = False):
         tx_data = tx.serialize(is_hex=True)
-        msg = dict(Action='sendrawtransaction', Version='1.0.0', Id=self.__id, PreExec='0', Data=tx_data)
+        msg = dict(Action='sendrawtransaction', Version='1.0.0', PreExec='0', Data=tx_data)
         return await self.__send_recv(msg, is_full)
 
     async def send_raw_transaction_pre_exec(self, tx: Transaction, is_full: bool = False):
         tx_data = tx.serialize(is_hex=True)
-        msg = dict(Action='sendrawtransaction', Version='1.0.0', Id=self.__id, PreExec='1', Data=tx_data)
+        msg = dict(Action='sendrawtransaction', Version='1.0.0', PreExec='1', Data=tx_data)
         return await self.__send_recv(msg, is_full)
 
     async def send_neo_vm_tx_pre_exec(self, contract_address: Union[str, bytes, bytearray],
@@ -21,6 +21,7 @@ import inspect
 
 from typing import Union
 
+from requests import Session
 from Cryptodome.Random.random import choice
 
 from ontology.contract.wasm.vm import WasmVm
@@ -30,6 +31,7 @@ from ontology.service.service import Service
 from ontology.contract.native.vm import NativeVm
 from ontology.network.websocket import Websocket
 from ontology.network.aiorestful import AioRestful
+from ontology.network.cache import ResponseCache
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 from ontology.wallet.wallet_manager import WalletManager
@@ -68,13 +70,14 @@ class AioRunner(object):
 
 class Ontology(AioRunner, metaclass=_Singleton):
     def __init__(self, rpc_address: str = '', restful_address: str = '', ws_address: str = '',
-                 default_signature_scheme: SignatureScheme = SignatureScheme.SHA256withECDSA):
+                 default_signature_scheme: SignatureScheme = SignatureScheme.SHA256withECDSA,
+                 http_session: Session = None, response_cache: ResponseCache = None):
         if not isinstance(default_signature_scheme, SignatureScheme):
             raise SDKException(ErrorCode.param_err('SignatureScheme object is required.'))
-        self.__rpc = Rpc(rpc_address)
-        self.__aio_rpc = AioRpc(rpc_address)
-        self.__restful = Restful(restful_address)
-        self.__aio_restful = AioRestful(restful_address)
+        self.__rpc = Rpc(rpc_address, session=http_session, cache=response_cache)
+        self.__aio_rpc = AioRpc(rpc_address, cache=response_cache)
+        self.__restful = Restful(restful_address, session=http_session, cache=response_cache)
+        self.__aio_restful = AioRestful(restful_address, cache=response_cache)
         self.__websocket = Websocket(ws_address)
         self.__default_network = self.__rpc
         self.__default_aio_network = self.__aio_rpc
@@ -128,6 +131,15 @@ class Ontology(AioRunner, metaclass=_Singleton):
         else:
             raise SDKException(ErrorCode.other_error('Invalid signature scheme'))
 
+    @property
+    def http_session(self) -> Session:
+        return self.__rpc.session
+
+    @http_session.setter
+    def http_session(self, session: Session):
+        self.__rpc.session = session
+        self.__restful.session = session
+
     @property
     def rpc(self) -> Rpc:
         return self.__rpc
@@ -228,6 +240,20 @@ class Ontology(AioRunner, metaclass=_Singleton):
     def service(self):
         return self.__service
 
+    async def close(self):
+        """
+        This interface is used to release the sessions and connections held by the asynchronous network clients.
+        """
+        await self.__aio_rpc.close()
+        await self.__aio_restful.close()
+        await self.__websocket.close_connect()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
     @staticmethod
     def get_random_test_rpc_address():
         return choice(TEST_RPC_ADDRESS)
@@ -19,6 +19,7 @@ along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 from ontology.claim.claim import Claim
 from ontology.sigsvr.sigsvr import SigSvr
 from ontology.claim.proof import BlockchainProof
+from ontology.claim.validator import ClaimValidator
 from ontology.merkle.tx_verifier import TxVerifier
 
 
@@ -27,6 +28,7 @@ class Service(object):
         self.__sdk = sdk
         self.__sig_svr = None
         self.__claim = None
+        self.__claim_validator = None
         self.__tx_verifier = None
         self.__blockchain_proof = None
 
@@ -45,6 +47,11 @@ class Service(object):
             self.__claim = Claim(self.__sdk)
         return self.__claim
 
+    def claim_validator(self):
+        if self.__claim_validator is None:
+            self.__claim_validator = ClaimValidator(self.__sdk)
+        return self.__claim_validator
+
     @property
     def sig_svr(self):
         if self.__sig_svr is None:
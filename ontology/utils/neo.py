@@ -20,8 +20,7 @@ from typing import List, Union
 
 from ontology.common.address import Address
 from ontology.vm.build_params import BuildParams
-from ontology.io.binary_reader import BinaryReader
-from ontology.io.memory_stream import StreamManager
+from ontology.io.codec import BufferReader
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 from ontology.contract.neo.abi.struct_type import Struct
@@ -83,9 +82,7 @@ class NeoData(object):
         elif 80 < int(op_code, base=16) < 103:
             return int(op_code, base=16) - 80
         else:
-            op_code = bytearray.fromhex(op_code)
-            stream = StreamManager.get_stream(op_code)
-            reader = BinaryReader(stream)
+            reader = BufferReader(bytes.fromhex(op_code))
             op_code = bytearray(reader.read_var_bytes())
             return NeoData.neo_bytearray_to_big_int(op_code)
 
@@ -191,12 +188,11 @@ class NeoData(object):
 
     @staticmethod
     def to_dict(item_serialize: str) -> dict:
-        stream = StreamManager.get_stream(bytearray.fromhex(item_serialize))
-        reader = BinaryReader(stream)
+        reader = BufferReader(bytes.fromhex(item_serialize))
         return NeoData.__deserialize_stack_item(reader)
 
     @staticmethod
-    def __deserialize_stack_item(reader: BinaryReader) -> dict or bytearray:
+    def __deserialize_stack_item(reader: BufferReader) -> dict or bytearray:
         param_type = reader.read_byte()
         if param_type == BuildParams.Type.bytearray_type.value:
             b = reader.read_var_bytes()
@@ -0,0 +1,192 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import json
+import asyncio
+
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Callable, Awaitable
+
+from ontology.exception.error_code import ErrorCode, CONNECT_ERROR_CODES
+from ontology.exception.exception import SDKException
+
+BATCH_NOT_SUPPORTED_ERROR_CODE = ErrorCode.batch_not_supported('')['error']
+
+
+class ScanCheckpoint(object):
+    """
+    A file which records how many items of a scan have been consumed, so that an interrupted scan can be resumed.
+    """
+
+    def __init__(self, path: str):
+        self.__path = path
+        self.__offset = 0
+        if os.path.isfile(path):
+            with open(path, 'r') as f:
+                self.__offset = int(json.load(f).get('offset', 0))
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def offset(self) -> int:
+        return self.__offset
+
+    def skip(self, iterable: Iterable) -> Iterator:
+        """
+        This interface is used to skip the items which have been consumed in the previous scan.
+        """
+        return islice(iterable, self.__offset, None)
+
+    def advance(self, count: int):
+        self.__offset += count
+
+    def save(self):
+        temp_path = f'{self.__path}.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(dict(offset=self.__offset), f)
+        os.replace(temp_path, self.__path)
+
+    def reset(self):
+        self.__offset = 0
+        if os.path.isfile(self.__path):
+            os.remove(self.__path)
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def scan(iterable: Iterable, query: Callable[[list], list], batch_size: int = 100,
+         checkpoint: ScanCheckpoint = None) -> Iterator[tuple]:
+    """
+    This interface is used to query the items chunk by chunk and yield the (item, result) pairs in order.
+    If a checkpoint is given, the items consumed in the previous scan are skipped, and the offset is saved after
+    each chunk and when the scan is stopped.
+    """
+    if checkpoint is not None:
+        iterable = checkpoint.skip(iterable)
+    try:
+        for chunk in chunked(iterable, batch_size):
+            for item, result in zip(chunk, query(chunk)):
+                yield item, result
+                if checkpoint is not None:
+                    checkpoint.advance(1)
+            if checkpoint is not None:
+                checkpoint.save()
+    finally:
+        if checkpoint is not None:
+            checkpoint.save()
+
+
+class BatchMapper(object):
+    """
+    Maps a list of items to their results with one batch request, and falls back to concurrent single requests
+    if the node does not support batch requests. If a batch fails because of some of its items, the items are
+    requested one by one so that the error of the failed item is raised, and the later batches are still sent.
+    """
+
+    def __init__(self, single_func: Callable, batch_func: Callable = None, concurrency: int = 8):
+        self.__single_func = single_func
+        self.__batch_func = batch_func
+        self.__executor = ThreadPoolExecutor(max_workers=max(concurrency, 1))
+
+    @property
+    def batch_supported(self) -> bool:
+        return self.__batch_func is not None
+
+    def __call__(self, items: list) -> list:
+        if self.__batch_func is not None:
+            try:
+                return self.__batch_func(items)
+            except SDKException as e:
+                if e.args[0] in CONNECT_ERROR_CODES:
+                    raise
+                if e.args[0] == BATCH_NOT_SUPPORTED_ERROR_CODE:
+                    self.__batch_func = None
+        return list(self.__executor.map(self.__single_func, items))
+
+    def close(self):
+        self.__executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+async def aio_scan(iterable: Iterable, query: Callable[..., Awaitable], concurrency: int = 16,
+                   checkpoint: ScanCheckpoint = None, checkpoint_interval: int = 100):
+    """
+    This interface is used to query the items concurrently and yield the (item, result) pairs in order.
+    If a checkpoint is given, the items consumed in the previous scan are skipped, and the offset is saved after
+    every checkpoint_interval items and when the scan is stopped.
+    """
+    if checkpoint is not None:
+        iterable = checkpoint.skip(iterable)
+
+    async def query_item(item):
+        return item, await query(item)
+
+    results = aio_ordered_map(query_item, iterable, concurrency)
+    try:
+        count = 0
+        async for item, result in results:
+            yield item, result
+            if checkpoint is not None:
+                checkpoint.advance(1)
+                count += 1
+                if count % checkpoint_interval == 0:
+                    checkpoint.save()
+    finally:
+        await results.aclose()
+        if checkpoint is not None:
+            checkpoint.save()
+
+
+async def aio_ordered_map(func: Callable[..., Awaitable], iterable: Iterable, concurrency: int = 16):
+    """
+    This interface is used to apply func to each item with at most concurrency calls in flight,
+    the results are yielded in the order of the items.
+    """
+    pending = deque()
+    iterator = iter(iterable)
+    try:
+        for item in islice(iterator, max(concurrency, 1)):
+            pending.append(asyncio.ensure_future(func(item)))
+        while len(pending) != 0:
+            result = await pending[0]
+            pending.popleft()
+            for item in islice(iterator, 1):
+                pending.append(asyncio.ensure_future(func(item)))
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        if len(pending) != 0:
+            await asyncio.gather(*pending, return_exceptions=True)
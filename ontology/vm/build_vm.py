@@ -16,6 +16,8 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+from typing import List
+
 from ontology.vm.op_code import *
 from ontology.common.address import Address
 from ontology.exception.error_code import ErrorCode
@@ -23,6 +25,60 @@ from ontology.exception.exception import SDKException
 from ontology.contract.neo.params_builder import NeoParamsBuilder
 
 
+class InvokeCodeTemplate(object):
+    """
+    The fixed segments of an invoke code around its parameters, which is used to generate the invoke codes
+    of the same method without rebuilding the fixed part.
+    """
+
+    def __init__(self, segments: List[bytes]):
+        if len(segments) < 2:
+            raise SDKException(ErrorCode.param_err('a template should have at least two segments.'))
+        self.__segments = [bytes(segment) for segment in segments]
+
+    @property
+    def param_count(self) -> int:
+        return len(self.__segments) - 1
+
+    def build(self, *params) -> bytearray:
+        """
+        This interface is used to generate the invoke code by pushing each parameter between the segments.
+        """
+        if len(params) != self.param_count:
+            raise SDKException(ErrorCode.param_err(f'the template requires {self.param_count} parameters.'))
+        builder = NeoParamsBuilder()
+        for segment, param in zip(self.__segments, params):
+            builder.write_bytes(segment)
+            builder.push_vm_param(param)
+        builder.write_bytes(self.__segments[-1])
+        return builder.to_bytearray()
+
+
+def build_native_invoke_code_template(contract_address: bytes, version: bytes, method: str,
+                                      field_count: int) -> InvokeCodeTemplate:
+    """
+    This interface is used to generate the template of a native invoke code whose parameter is a list with one
+    struct of field_count fields, e.g. the state of a native transfer.
+    """
+    builder = NeoParamsBuilder()
+    builder.push_int(0)
+    builder.emit(NEWSTRUCT)
+    builder.emit(TOALTSTACK)
+    prefix = builder.to_bytes()
+    separator = DUPFROMALTSTACK + SWAP + APPEND
+    builder = NeoParamsBuilder()
+    builder.emit(FROMALTSTACK)
+    builder.push_int(1)
+    builder.emit(PACK)
+    builder.push_bytearray(method.encode())
+    builder.push_bytearray(contract_address)
+    builder.push_int(int.from_bytes(version, 'little'))
+    builder.emit(SYSCALL)
+    builder.push_bytearray(b'Ontology.Native.Invoke')
+    suffix = builder.to_bytes()
+    return InvokeCodeTemplate([prefix] + [separator] * (field_count - 1) + [separator + suffix])
+
+
 def build_native_invoke_code(contract_address: bytes, version: bytes, method: str, params):
     builder = NeoParamsBuilder()
     build_neo_vm_param(builder, params)
@@ -17,9 +17,11 @@ along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 from typing import List
+from operator import attrgetter
 
 from ontology.common.define import DID_ONT
 from ontology.wallet.control import Control
+from ontology.wallet.indexed_list import IndexedList
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 
@@ -36,7 +38,7 @@ class Identity(object):
         self.__ont_id = ont_id
         self.label = label
         self.lock = lock
-        self.__controls = controls
+        self.__controls = IndexedList(attrgetter('kid'), controls)
         self.is_default = is_default
 
     def __iter__(self):
@@ -74,7 +76,13 @@ class Identity(object):
         for ctrl in ctrl_lst:
             if not isinstance(ctrl, Control):
                 raise SDKException(ErrorCode.require_control_params)
-        self.__controls = ctrl_lst
+        self.__controls = IndexedList(attrgetter('kid'), ctrl_lst)
+
+    def get_control_by_kid(self, kid: str) -> Control:
+        ctrl = self.__controls.find(kid)
+        if ctrl is None:
+            raise SDKException(ErrorCode.other_error(f'Get control {kid} failed.'))
+        return ctrl
 
     def add_control(self, ctrl: Control):
         if not isinstance(ctrl, Control):
@@ -0,0 +1,121 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from typing import Callable, Iterable
+
+
+class IndexedList(list):
+    """
+    A list which keeps a hash index of its items by a key, so that an item can be found by the key in O(1).
+    If several items have the same key, the first one is found as a linear scan does.
+    If the key of an item is changed after it is added, reindex must be called so that the item is found by its
+    new key.
+    """
+
+    def __init__(self, key: Callable, iterable: Iterable = ()):
+        super().__init__()
+        self.__key = key
+        self.__index = dict()
+        self.__duplicated = False
+        self.extend(iterable)
+
+    def __reduce__(self):
+        return type(self), (self.__key, list(self))
+
+    def __add_index(self, item):
+        if self.__index.setdefault(self.__key(item), item) is not item:
+            self.__duplicated = True
+
+    def __remove_index(self, item):
+        key = self.__key(item)
+        if self.__index.get(key) is not item:
+            return
+        del self.__index[key]
+        if not self.__duplicated:
+            return
+        for other in self:
+            if self.__key(other) == key:
+                self.__index[key] = other
+                break
+
+    def reindex(self):
+        self.__index.clear()
+        self.__duplicated = False
+        for item in self:
+            self.__add_index(item)
+
+    def find(self, key):
+        """
+        This interface is used to find the first item of the key, None is returned if there is no such item.
+        """
+        item = self.__index.get(key)
+        if item is None or self.__key(item) == key:
+            return item
+        self.reindex()
+        return self.__index.get(key)
+
+    def append(self, item):
+        super().append(item)
+        self.__add_index(item)
+
+    def extend(self, iterable: Iterable):
+        for item in iterable:
+            self.append(item)
+
+    def __iadd__(self, iterable: Iterable):
+        self.extend(iterable)
+        return self
+
+    def insert(self, index: int, item):
+        super().insert(index, item)
+        if self.__duplicated or self.__key(item) in self.__index:
+            self.reindex()
+        else:
+            self.__add_index(item)
+
+    def remove(self, item):
+        super().remove(item)
+        self.__remove_index(item)
+
+    def pop(self, index: int = -1):
+        item = super().pop(index)
+        self.__remove_index(item)
+        return item
+
+    def clear(self):
+        super().clear()
+        self.__index.clear()
+        self.__duplicated = False
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        if self.__duplicated:
+            self.reindex()
+
+    def reverse(self):
+        super().reverse()
+        if self.__duplicated:
+            self.reindex()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self.reindex()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.reindex()
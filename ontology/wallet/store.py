@@ -0,0 +1,301 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import json
+import codecs
+import sqlite3
+
+from datetime import datetime
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+from ontology.crypto.scrypt import Scrypt
+from ontology.wallet.wallet import WalletData
+from ontology.wallet.identity import Identity
+from ontology.wallet.account import AccountData
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+META_KEYS = ('name', 'version', 'createTime', 'defaultOntid', 'defaultAccountAddress', 'scrypt')
+DEFAULT_FETCH_SIZE = 1000
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS accounts (seq INTEGER PRIMARY KEY AUTOINCREMENT, address TEXT NOT NULL UNIQUE,
+                                     data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS identities (seq INTEGER PRIMARY KEY AUTOINCREMENT, ont_id TEXT NOT NULL UNIQUE,
+                                       data TEXT NOT NULL);
+'''
+
+
+class WalletStore(object):
+    """
+    A wallet which is stored in a SQLite file. Each account and identity is stored as a row in the format of
+    wallet file, so that an entry is written, updated or loaded without rewriting or parsing the whole wallet.
+    The changes in a transaction block are committed atomically.
+    """
+
+    def __init__(self, path: str):
+        if not isinstance(path, str):
+            raise SDKException(ErrorCode.require_str_params)
+        self.__path = path
+        self.__depth = 0
+        try:
+            self.__conn = sqlite3.connect(path)
+            self.__conn.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            raise SDKException(ErrorCode.other_error(e.args[0])) from None
+        if self.__get_meta('name') is None:
+            wallet = WalletData(create_time=datetime.today().strftime("%Y-%m-%d %H:%M:%S"))
+            with self.transaction():
+                self.__put_meta(dict(wallet))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def close(self):
+        self.__conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """
+        This interface is used to group the changes into a transaction, which is committed when the outermost
+        block exits. If an exception is raised, the changes of the block are rolled back, and a nested block is
+        rolled back to a savepoint, so that the changes of the outer block are kept if the exception is caught.
+        """
+        savepoint = f'block{self.__depth}'
+        if self.__depth == 0:
+            if not self.__conn.in_transaction:
+                self.__execute('BEGIN')
+        else:
+            self.__execute(f'SAVEPOINT {savepoint}')
+        self.__depth += 1
+        try:
+            yield self
+        except BaseException:
+            self.__depth -= 1
+            if self.__depth == 0:
+                self.__conn.rollback()
+            else:
+                self.__execute(f'ROLLBACK TO {savepoint}')
+                self.__execute(f'RELEASE {savepoint}')
+            raise
+        self.__depth -= 1
+        if self.__depth == 0:
+            self.__conn.commit()
+        else:
+            self.__execute(f'RELEASE {savepoint}')
+
+    def __execute(self, sql: str, params: Iterable = ()) -> sqlite3.Cursor:
+        try:
+            return self.__conn.execute(sql, tuple(params))
+        except sqlite3.Error as e:
+            raise SDKException(ErrorCode.other_error(e.args[0])) from None
+
+    def __get_meta(self, key: str):
+        row = self.__execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def __put_meta(self, wallet_dict: dict):
+        for key in META_KEYS:
+            if key in wallet_dict:
+                self.__execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                               (key, json.dumps(wallet_dict[key])))
+
+    @property
+    def name(self) -> str:
+        return self.__get_meta('name')
+
+    @property
+    def default_account_address(self) -> str:
+        return self.__get_meta('defaultAccountAddress')
+
+    @property
+    def default_ont_id(self) -> str:
+        return self.__get_meta('defaultOntid')
+
+    @property
+    def scrypt(self) -> Scrypt:
+        scrypt_dict = self.__get_meta('scrypt')
+        return Scrypt(scrypt_dict.get('n', 16384), scrypt_dict.get('r', 8), scrypt_dict.get('p', 8),
+                      scrypt_dict.get('dkLen', 64))
+
+    @scrypt.setter
+    def scrypt(self, scrypt: Scrypt):
+        if not isinstance(scrypt, Scrypt):
+            raise SDKException(ErrorCode.param_error)
+        with self.transaction():
+            self.__put_meta(dict(scrypt=dict(scrypt)))
+
+    def get_meta(self) -> dict:
+        """
+        This interface is used to get the wallet fields except identities and accounts.
+        """
+        return {key: self.__get_meta(key) for key in META_KEYS}
+
+    def get_account_count(self) -> int:
+        return self.__execute('SELECT COUNT(*) FROM accounts').fetchone()[0]
+
+    def get_identity_count(self) -> int:
+        return self.__execute('SELECT COUNT(*) FROM identities').fetchone()[0]
+
+    def put_accounts(self, accounts: Iterable[AccountData]):
+        """
+        This interface is used to add the accounts or update the accounts of the same address,
+        the order of the updated accounts is kept.
+        """
+        with self.transaction():
+            for acct in accounts:
+                self.__execute('INSERT INTO accounts (address, data) VALUES (?, ?) '
+                               'ON CONFLICT(address) DO UPDATE SET data = excluded.data',
+                               (acct.b58_address, json.dumps(dict(acct))))
+
+    def put_account(self, acct: AccountData):
+        self.put_accounts([acct])
+
+    def get_account_by_b58_address(self, b58_address: str) -> AccountData:
+        row = self.__execute('SELECT data FROM accounts WHERE address = ?', (b58_address,)).fetchone()
+        if row is None:
+            raise SDKException(ErrorCode.other_error('Get account failed.'))
+        return WalletData.parse_account(json.loads(row[0]))
+
+    def remove_account(self, b58_address: str):
+        with self.transaction():
+            if self.__execute('DELETE FROM accounts WHERE address = ?', (b58_address,)).rowcount == 0:
+                raise SDKException(ErrorCode.get_account_by_address_err)
+
+    def set_default_account_by_address(self, b58_address: str):
+        """
+        This interface is used to set the default account, only the rows whose default state is changed
+        are rewritten.
+        """
+        with self.transaction():
+            acct = self.get_account_by_b58_address(b58_address)
+            default_rows = list(self.__iter_rows('accounts', "WHERE data LIKE '%\"isDefault\": true%'"))
+            for default_acct in map(WalletData.parse_account, default_rows):
+                if default_acct.is_default:
+                    default_acct.is_default = False
+                    self.put_account(default_acct)
+            acct.is_default = True
+            self.put_account(acct)
+            self.__put_meta(dict(defaultAccountAddress=b58_address))
+
+    def put_identities(self, identities: Iterable[Identity]):
+        with self.transaction():
+            for identity in identities:
+                self.__execute('INSERT INTO identities (ont_id, data) VALUES (?, ?) '
+                               'ON CONFLICT(ont_id) DO UPDATE SET data = excluded.data',
+                               (identity.ont_id, json.dumps(dict(identity))))
+
+    def put_identity(self, identity: Identity):
+        self.put_identities([identity])
+
+    def get_identity_by_ont_id(self, ont_id: str) -> Identity:
+        row = self.__execute('SELECT data FROM identities WHERE ont_id = ?', (ont_id,)).fetchone()
+        if row is None:
+            raise SDKException(ErrorCode.other_error('Get identity failed.'))
+        return WalletData.parse_identity(json.loads(row[0]))
+
+    def remove_identity(self, ont_id: str):
+        with self.transaction():
+            if self.__execute('DELETE FROM identities WHERE ont_id = ?', (ont_id,)).rowcount == 0:
+                raise SDKException(ErrorCode.param_error)
+
+    def __iter_rows(self, table: str, condition: str = '', fetch_size: int = DEFAULT_FETCH_SIZE) -> Iterator[dict]:
+        cursor = self.__execute(f'SELECT data FROM {table} {condition} ORDER BY seq')
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if len(rows) == 0:
+                return
+            for row in rows:
+                yield json.loads(row[0])
+
+    def iter_accounts(self) -> Iterator[AccountData]:
+        """
+        This interface is used to load the accounts one by one in the order of insertion.
+        """
+        for acct in self.__iter_rows('accounts'):
+            yield WalletData.parse_account(acct)
+
+    def iter_identities(self) -> Iterator[Identity]:
+        for identity in self.__iter_rows('identities'):
+            yield WalletData.parse_identity(identity)
+
+    def import_wallet_data(self, wallet: WalletData):
+        """
+        This interface is used to import the fields, identities and accounts of a WalletData in one transaction.
+        """
+        with self.transaction():
+            self.__put_meta(dict(wallet))
+            self.put_identities(wallet.identities)
+            self.put_accounts(wallet.accounts)
+
+    def to_wallet_data(self) -> WalletData:
+        meta = self.get_meta()
+        return WalletData(meta['name'], meta['version'], meta['createTime'], meta['defaultOntid'],
+                          meta['defaultAccountAddress'], self.scrypt, list(self.iter_identities()),
+                          list(self.iter_accounts()))
+
+    def import_json(self, wallet_path: str):
+        """
+        This interface is used to import a wallet file in the standard JSON format.
+        """
+        with open(wallet_path, 'rb') as f:
+            content = f.read()
+        if content.startswith(codecs.BOM_UTF8):
+            content = content[len(codecs.BOM_UTF8):]
+        wallet_dict = json.loads(content.decode('utf-8'))
+        for key in ['name', 'version', 'scrypt', 'accounts']:
+            if key not in wallet_dict:
+                raise SDKException(ErrorCode.param_err(f'wallet file format error: {key}.'))
+        identities = [WalletData.parse_identity(item) for item in wallet_dict.get('identities', list())]
+        accounts = [WalletData.parse_account(item) for item in wallet_dict['accounts']]
+        with self.transaction():
+            self.__put_meta(wallet_dict)
+            self.put_identities(identities)
+            self.put_accounts(accounts)
+
+    def export_json(self, wallet_path: str):
+        """
+        This interface is used to export the wallet in the standard JSON format. The entries are written one by one,
+        and the file is replaced atomically after all of them are written.
+        """
+        temp_path = f'{wallet_path}.tmp'
+        meta = self.get_meta()
+        with open(temp_path, 'w') as f:
+            f.write('{\n')
+            for key in META_KEYS:
+                f.write(f'    {json.dumps(key)}: {json.dumps(meta[key])},\n')
+            for table in ['identities', 'accounts']:
+                f.write(f'    "{table}": [')
+                for index, item in enumerate(self.__iter_rows(table)):
+                    f.write(',\n        ' if index != 0 else '\n        ')
+                    f.write(json.dumps(item))
+                f.write('\n    ]' + (',\n' if table == 'identities' else '\n'))
+            f.write('}\n')
+        os.replace(temp_path, wallet_path)
@@ -0,0 +1,108 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import hmac
+import time
+import hashlib
+import threading
+
+from typing import Callable
+
+from ontology.account.account import Account
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.crypto.signature_scheme import SignatureScheme
+
+
+class UnlockedAccountCache(object):
+    """
+    A cache of the decrypted private keys, so that an account is decrypted by scrypt only once in the ttl.
+    The passwords are kept as keyed digests, while the private keys stay in memory until they are evicted and
+    are not wiped, so the cache is disabled unless a ttl is given.
+    """
+
+    def __init__(self, ttl: float = 0):
+        self.__secret = os.urandom(32)
+        self.__entries = dict()
+        self.__lock = threading.Lock()
+        self.__ttl = 0
+        self.ttl = ttl
+
+    def __len__(self):
+        with self.__lock:
+            self.__evict_expired()
+            return len(self.__entries)
+
+    @property
+    def ttl(self) -> float:
+        return self.__ttl
+
+    @ttl.setter
+    def ttl(self, ttl: float):
+        if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl < 0:
+            raise SDKException(ErrorCode.param_error)
+        self.__ttl = ttl
+        if ttl == 0:
+            self.clear()
+
+    def __digest(self, password: str) -> bytes:
+        return hmac.new(self.__secret, password.encode('utf-8'), hashlib.sha256).digest()
+
+    def __evict_expired(self):
+        now = time.monotonic()
+        for key in [key for key, entry in self.__entries.items() if entry[2] <= now]:
+            del self.__entries[key]
+
+    def get_account(self, key: str, password: str, b58_address: str, salt: bytes, n: int, scheme: SignatureScheme,
+                    decrypt: Callable[[], str]) -> Account:
+        """
+        This interface is used to get the account of an encrypted private key. The decrypt function is called
+        only if the private key is not cached or the password does not match the cached one.
+        """
+        if not isinstance(password, str):
+            raise SDKException(ErrorCode.require_str_params)
+        cache_key = (key, b58_address, bytes(salt), n, scheme)
+        digest = self.__digest(password)
+        with self.__lock:
+            self.__evict_expired()
+            entry = self.__entries.get(cache_key)
+            if entry is not None and hmac.compare_digest(entry[1], digest):
+                return Account(entry[0], scheme)
+        private_key = bytes.fromhex(decrypt())
+        account = Account(private_key, scheme)
+        if self.__ttl == 0:
+            return account
+        with self.__lock:
+            self.__entries[cache_key] = (private_key, digest, time.monotonic() + self.__ttl, b58_address)
+        return account
+
+    def lock(self, b58_address: str) -> int:
+        """
+        This interface is used to evict the cached private keys of an address, and return the number of
+        evicted keys.
+        """
+        with self.__lock:
+            keys = [key for key, entry in self.__entries.items() if entry[3] == b58_address]
+            for key in keys:
+                del self.__entries[key]
+        return len(keys)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
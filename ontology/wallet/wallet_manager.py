@@ -16,15 +16,17 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import os
 import copy
 import json
 import uuid
 import base64
 import codecs
 
-from typing import List
 from os import remove, path
 from datetime import datetime
+from typing import List, Callable
+from concurrent.futures import ProcessPoolExecutor
 
 from ontology.common.define import DID_ONT
 from ontology.crypto.scrypt import Scrypt
@@ -39,16 +41,53 @@ from ontology.exception.error_code import ErrorCode
 from ontology.wallet.account_info import AccountInfo
 from ontology.exception.exception import SDKException
 from ontology.crypto.signature_scheme import SignatureScheme
+from ontology.wallet.unlocked_cache import UnlockedAccountCache
+
+SCRYPT_R = 8
+DEFAULT_KDF_MEMORY_LIMIT = 256 * 1024 * 1024
+
+
+def _encrypt_private_key(task: tuple) -> str:
+    private_key, password, salt, n, scheme = task
+    return Account(private_key, scheme).export_gcm_encrypted_private_key(password, salt, n)
+
+
+def _reencrypt_private_key(task: tuple) -> tuple:
+    key, password, b58_address, salt, n, new_password, new_salt, new_n, scheme = task
+    private_key = Account.get_gcm_decoded_private_key(key, password, b58_address, salt, n, scheme)
+    if new_password is None:
+        return private_key, key
+    return private_key, Account(private_key, scheme).export_gcm_encrypted_private_key(new_password, new_salt, new_n)
+
+
+def map_kdf_tasks(func: Callable, tasks: List[tuple], n: int, max_workers: int = None,
+                  memory_limit: int = DEFAULT_KDF_MEMORY_LIMIT) -> list:
+    """
+    This interface is used to run the scrypt tasks in a process pool, the number of processes is limited so that
+    the scrypt memory (about 128 * r * n bytes for each process) of all processes is not over memory_limit.
+
+    :param max_workers: the number of processes, 0 means running in current process,
+     and None means the number of processors.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(tasks), max(memory_limit // (128 * SCRYPT_R * n), 1))
+    if max_workers <= 1:
+        return [func(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers) as executor:
+        return list(executor.map(func, tasks, chunksize=max(len(tasks) // (max_workers * 4), 1)))
 
 
 class WalletManager(object):
-    def __init__(self, wallet_path: str = '', scheme: SignatureScheme = SignatureScheme.SHA256withECDSA):
+    def __init__(self, wallet_path: str = '', scheme: SignatureScheme = SignatureScheme.SHA256withECDSA,
+                 unlock_ttl: float = 0):
         if not isinstance(scheme, SignatureScheme):
             raise SDKException(ErrorCode.other_error('Invalid signature scheme.'))
         self.scheme = scheme
         self.wallet_file = WalletData()
         self.wallet_in_mem = WalletData()
         self.__wallet_path = wallet_path
+        self.__unlocked_cache = UnlockedAccountCache(unlock_ttl)
 
     @staticmethod
     def __check_ont_id(ont_id: str):
@@ -68,8 +107,48 @@ class WalletManager(object):
             raise SDKException(ErrorCode.invalid_wallet_path(self.__wallet_path))
         self.wallet_file = self.load_file()
         self.wallet_in_mem = copy.deepcopy(self.wallet_file)
+        self.lock_all()
         return self.wallet_file
 
+    @property
+    def unlock_ttl(self) -> float:
+        """
+        The seconds for which a decrypted account is kept unlocked, 0 by default which means that the accounts are
+        never cached. The decrypted private keys stay in the memory of the process while they are cached.
+        """
+        return self.__unlocked_cache.ttl
+
+    @unlock_ttl.setter
+    def unlock_ttl(self, ttl: float):
+        self.__unlocked_cache.ttl = ttl
+
+    def lock_account(self, b58_address: str) -> bool:
+        """
+        This interface is used to evict the unlocked account of the address (or the identity of the address),
+        so that the password is required to be checked by scrypt again.
+
+        :return: whether any unlocked account is evicted.
+        """
+        if not isinstance(b58_address, str):
+            raise SDKException(ErrorCode.require_str_params)
+        if b58_address.startswith(DID_ONT):
+            b58_address = b58_address.replace(DID_ONT, '')
+        return self.__unlocked_cache.lock(b58_address) != 0
+
+    def lock_all(self):
+        """
+        This interface is used to evict all the unlocked accounts.
+        """
+        self.__unlocked_cache.clear()
+
+    def __decrypt_account(self, key: str, password: str, b58_address: str, salt: bytes) -> Account:
+        n = self.wallet_in_mem.scrypt.n
+
+        def decrypt() -> str:
+            return Account.get_gcm_decoded_private_key(key, password, b58_address, salt, n, self.scheme)
+
+        return self.__unlocked_cache.get_account(key, password, b58_address, salt, n, self.scheme, decrypt)
+
     @property
     def wallet_path(self):
         return self.__wallet_path
@@ -122,9 +201,15 @@ class WalletManager(object):
         return wallet
 
     def save(self):
+        """
+        This interface is used to save the wallet into the wallet file. The wallet is written into a temporary file
+        which replaces the wallet file atomically, so the wallet file is never left half written.
+        """
+        temp_path = f'{self.__wallet_path}.tmp'
         try:
-            with open(self.__wallet_path, 'w') as f:
+            with open(temp_path, 'w') as f:
                 json.dump(dict(self.wallet_in_mem), f, indent=4)
+            os.replace(temp_path, self.__wallet_path)
         except FileNotFoundError as e:
             raise SDKException(ErrorCode.other_error(e.args[1])) from None
 
@@ -145,6 +230,7 @@ class WalletManager(object):
 
     def reset(self):
         self.wallet_in_mem = WalletData()
+        self.lock_all()
 
     def get_signature_scheme(self):
         return self.scheme
@@ -164,13 +250,13 @@ class WalletManager(object):
         :param b58_address: a base58 encode address which correspond with the encrypted private key provided.
         :return: if succeed, an Identity object will be returned.
         """
-        scrypt_n = Scrypt().n
+        scrypt_n = self.wallet_in_mem.scrypt.n
         pri_key = Account.get_gcm_decoded_private_key(encrypted_pri_key, pwd, b58_address, salt, scrypt_n, self.scheme)
         info = self.__create_identity(label, pwd, salt, pri_key)
-        for identity in self.wallet_in_mem.identities:
-            if identity.ont_id == info.ont_id:
-                return identity
-        raise SDKException(ErrorCode.other_error('Import identity failed.'))
+        identity = self.wallet_in_mem.identities.find(info.ont_id)
+        if identity is None:
+            raise SDKException(ErrorCode.other_error('Import identity failed.'))
+        return identity
 
     def create_identity(self, pwd: str, label: str = '') -> Identity:
         """
@@ -219,20 +305,20 @@ class WalletManager(object):
         return self.get_account_by_b58_address(acct.get_address_base58(), pwd)
 
     def del_account_by_b58_address(self, b58_address: str):
-        for acct in self.wallet_in_mem.accounts:
-            if acct.b58_address == b58_address:
-                self.wallet_in_mem.accounts.remove(acct)
-                return
-        raise SDKException(ErrorCode.other_error(f'{b58_address} not exist.'))
+        acct = self.wallet_in_mem.accounts.find(b58_address)
+        if acct is None:
+            raise SDKException(ErrorCode.other_error(f'{b58_address} not exist.'))
+        self.wallet_in_mem.accounts.remove(acct)
+        self.lock_account(b58_address)
 
     def __create_account(self, label: str, pwd: str, salt: str, private_key: str, account_flag: bool) -> Account:
         account = Account(private_key, self.scheme)
         if self.scheme == SignatureScheme.SHA256withECDSA:
-            acct_data = AccountData()
+            acct_data = AccountData(is_default=False)
         else:
             raise SDKException(ErrorCode.other_error('Scheme type is error.'))
         if pwd is not None:
-            acct_data.key = account.export_gcm_encrypted_private_key(pwd, salt)
+            acct_data.key = account.export_gcm_encrypted_private_key(pwd, salt, self.wallet_in_mem.scrypt.n)
         else:
             acct_data.key = account.get_private_key_hex()
 
@@ -240,9 +326,8 @@ class WalletManager(object):
         if len(label) == 0 or label is None:
             label = uuid.uuid4().hex[0:8]
         if account_flag:
-            for memory_acct in self.wallet_in_mem.accounts:
-                if memory_acct.b58_address == account.get_address_base58():
-                    raise SDKException(ErrorCode.other_error('Wallet account exists.'))
+            if self.wallet_in_mem.accounts.find(acct_data.b58_address) is not None:
+                raise SDKException(ErrorCode.other_error('Wallet account exists.'))
             if len(self.wallet_in_mem.accounts) == 0:
                 acct_data.is_default = True
                 self.wallet_in_mem.default_account_address = acct_data.b58_address
@@ -251,9 +336,8 @@ class WalletManager(object):
             acct_data.public_key = account.get_public_key_hex()
             self.wallet_in_mem.accounts.append(acct_data)
         else:
-            for identity in self.wallet_in_mem.identities:
-                if identity.ont_id == DID_ONT + acct_data.b58_address:
-                    raise SDKException(ErrorCode.other_error('Wallet identity exists.'))
+            if self.wallet_in_mem.identities.find(DID_ONT + acct_data.b58_address) is not None:
+                raise SDKException(ErrorCode.other_error('Wallet identity exists.'))
             idt = Identity()
             idt.ont_id = DID_ONT + acct_data.b58_address
             idt.label = label
@@ -272,7 +356,7 @@ class WalletManager(object):
         if len(salt) == 0:
             salt = get_random_hex_str(16)
         account = Account(private_key, self.scheme)
-        key = account.export_gcm_encrypted_private_key(password, salt)
+        key = account.export_gcm_encrypted_private_key(password, salt, self.wallet_in_mem.scrypt.n)
         b58_address = account.get_address_base58()
         public_key = account.get_public_key_hex()
         b64_salt = base64.b64encode(salt.encode('utf-8')).decode('ascii')
@@ -316,19 +400,17 @@ class WalletManager(object):
         salt = base64.b64decode(b64_salt.encode('ascii')).decode('latin-1')
         private_key = Account.get_gcm_decoded_private_key(encrypted_pri_key, pwd, b58_address, salt, n, self.scheme)
         acct_info = self.create_account_info(label, pwd, salt, private_key)
-        for acct in self.wallet_in_mem.accounts:
-            if not isinstance(acct, AccountData):
-                raise SDKException(ErrorCode.other_error('Invalid account data in memory.'))
-            if acct_info.address_base58 == acct.b58_address:
-                return acct
-        raise SDKException(ErrorCode.other_error('Import account failed.'))
+        acct = self.wallet_in_mem.accounts.find(acct_info.address_base58)
+        if not isinstance(acct, AccountData):
+            raise SDKException(ErrorCode.other_error('Import account failed.'))
+        return acct
 
     def create_account_info(self, label: str, pwd: str, salt: str, private_key: str) -> AccountInfo:
         acct = self.__create_account(label, pwd, salt, private_key, True)
         info = AccountInfo()
         info.address_base58 = Address.from_public_key(acct.get_public_key_bytes()).b58encode()
         info.public_key = acct.get_public_key_bytes().hex()
-        info.encrypted_pri_key = acct.export_gcm_encrypted_private_key(pwd, salt)
+        info.encrypted_pri_key = acct.export_gcm_encrypted_private_key(pwd, salt, self.wallet_in_mem.scrypt.n)
         info.address_u160 = acct.get_address().to_bytes().hex()
         info.salt = salt
         return info
@@ -347,10 +429,130 @@ class WalletManager(object):
         if len(label) == 0 or label is None:
             label = uuid.uuid4().hex[0:8]
         info = self.create_account_info(label, password, salt, private_key)
-        for acct in self.wallet_in_mem.accounts:
-            if info.address_base58 == acct.b58_address:
-                return acct
-        raise SDKException(ErrorCode.other_error(f'Create account from key {private_key} failed.'))
+        acct = self.wallet_in_mem.accounts.find(info.address_base58)
+        if acct is None:
+            raise SDKException(ErrorCode.other_error(f'Create account from key {private_key} failed.'))
+        return acct
+
+    def __append_account_data_list(self, account_list: List[Account], key_list: List[str], salt_list: List[str],
+                                   label_list: List[str]) -> List[AccountData]:
+        acct_data_list = list()
+        for account, key, salt, label in zip(account_list, key_list, salt_list, label_list):
+            acct_data = AccountData(is_default=False)
+            acct_data.key = key
+            acct_data.b58_address = account.get_address_base58()
+            acct_data.label = label if label else uuid.uuid4().hex[0:8]
+            acct_data.salt = base64.b64encode(salt.encode('latin-1')).decode('ascii')
+            acct_data.public_key = account.get_public_key_hex()
+            acct_data_list.append(acct_data)
+        if len(self.wallet_in_mem.accounts) == 0 and len(acct_data_list) != 0:
+            acct_data_list[0].is_default = True
+            self.wallet_in_mem.default_account_address = acct_data_list[0].b58_address
+        self.wallet_in_mem.accounts.extend(acct_data_list)
+        return acct_data_list
+
+    def __check_new_addresses(self, b58_address_list: List[str]):
+        new_addresses = set()
+        for b58_address in b58_address_list:
+            if b58_address in new_addresses or self.wallet_in_mem.accounts.find(b58_address) is not None:
+                raise SDKException(ErrorCode.other_error('Wallet account exists.'))
+            new_addresses.add(b58_address)
+
+    def __check_scheme(self):
+        if self.scheme != SignatureScheme.SHA256withECDSA:
+            raise SDKException(ErrorCode.other_error('Scheme type is error.'))
+
+    def create_account_from_private_key_batch(self, password: str, private_keys: List[str], labels: List[str] = None,
+                                              max_workers: int = None,
+                                              memory_limit: int = DEFAULT_KDF_MEMORY_LIMIT) -> List[AccountData]:
+        """
+        This interface is used to create accounts by providing private keys, the private keys are encrypted
+        in a process pool, and the accounts are added into the wallet in one step after all of them are encrypted.
+
+        :param password: a password which is used to encrypt the private keys.
+        :param private_keys: a list of private keys in the form of string.
+        :param labels: a list of labels for accounts, a random label is used if it is None or empty.
+        :param max_workers: the number of processes, 0 means encrypting in current process,
+         and None means the number of processors.
+        :param memory_limit: the max bytes of scrypt memory used by all processes.
+        :return: a list of AccountData objects in the same order as the private keys.
+        """
+        self.__check_scheme()
+        if labels is None:
+            labels = [''] * len(private_keys)
+        if len(labels) != len(private_keys):
+            raise SDKException(ErrorCode.param_err('the length of labels should be equal to private keys.'))
+        account_list = [Account(private_key, self.scheme) for private_key in private_keys]
+        self.__check_new_addresses([account.get_address_base58() for account in account_list])
+        n = self.wallet_in_mem.scrypt.n
+        salt_list = [get_random_hex_str(16) for _ in account_list]
+        tasks = [(account.get_private_key_bytes(), password, salt, n, self.scheme)
+                 for account, salt in zip(account_list, salt_list)]
+        key_list = map_kdf_tasks(_encrypt_private_key, tasks, n, max_workers, memory_limit)
+        return self.__append_account_data_list(account_list, key_list, salt_list, labels)
+
+    def create_account_batch(self, password: str, count: int, labels: List[str] = None, max_workers: int = None,
+                             memory_limit: int = DEFAULT_KDF_MEMORY_LIMIT) -> List[AccountData]:
+        """
+        This interface is used to create a number of accounts with random private keys in a process pool.
+        """
+        private_keys = [get_random_hex_str(64) for _ in range(count)]
+        return self.create_account_from_private_key_batch(password, private_keys, labels, max_workers, memory_limit)
+
+    def import_account_batch(self, acct_list: List[tuple], n: int = 16384, max_workers: int = None,
+                             memory_limit: int = DEFAULT_KDF_MEMORY_LIMIT) -> List[AccountData]:
+        """
+        This interface is used to import accounts in a process pool, and add them into the wallet in one step
+        after all of the private keys are decrypted.
+
+        :param acct_list: a list of (label, encrypted_pri_key, pwd, b58_address, b64_salt) as import_account.
+        :param n: the CPU/Memory cost parameter of the encrypted private keys.
+        :return: a list of AccountData objects in the same order as acct_list.
+        """
+        self.__check_scheme()
+        self.__check_new_addresses([item[3] for item in acct_list])
+        wallet_n = self.wallet_in_mem.scrypt.n
+        tasks = list()
+        for _, encrypted_pri_key, pwd, b58_address, b64_salt in acct_list:
+            salt = base64.b64decode(b64_salt.encode('ascii')).decode('latin-1')
+            new_pwd = None if n == wallet_n else pwd
+            tasks.append((encrypted_pri_key, pwd, b58_address, salt, n, new_pwd, salt, wallet_n, self.scheme))
+        results = map_kdf_tasks(_reencrypt_private_key, tasks, max(n, wallet_n), max_workers, memory_limit)
+        account_list = [Account(private_key, self.scheme) for private_key, _ in results]
+        key_list = [key for _, key in results]
+        salt_list = [task[3] for task in tasks]
+        label_list = [item[0] for item in acct_list]
+        return self.__append_account_data_list(account_list, key_list, salt_list, label_list)
+
+    def change_password_batch(self, old_password: str, new_password: str, n: int = None, max_workers: int = None,
+                              memory_limit: int = DEFAULT_KDF_MEMORY_LIMIT):
+        """
+        This interface is used to re-encrypt all the accounts and identity controls of the wallet with a new
+        password and new salts in a process pool, and optionally change the scrypt parameter n of the wallet.
+        The wallet is changed in one step after all of the private keys are re-encrypted, and it is not changed
+        if any private key fails to be decrypted by the old password.
+        """
+        self.__check_scheme()
+        old_n = self.wallet_in_mem.scrypt.n
+        if n is None:
+            n = old_n
+        if not isinstance(n, int) or n <= 1 or n & (n - 1) != 0:
+            raise SDKException(ErrorCode.param_err('n should be a power of 2.'))
+        items = list(self.wallet_in_mem.accounts)
+        for identity in self.wallet_in_mem.identities:
+            items.extend(identity.controls)
+        tasks = list()
+        for item in items:
+            salt = base64.b64decode(item.salt).decode('latin-1')
+            tasks.append((item.key, old_password, item.b58_address, salt, old_n, new_password,
+                          get_random_hex_str(16), n, self.scheme))
+        results = map_kdf_tasks(_reencrypt_private_key, tasks, max(n, old_n), max_workers, memory_limit)
+        for item, task, (_, key) in zip(items, tasks, results):
+            item.key = key
+            item.salt = base64.b64encode(task[6].encode('latin-1')).decode('ascii')
+        scrypt = self.wallet_in_mem.scrypt
+        self.wallet_in_mem.scrypt = Scrypt(n, scrypt.r, scrypt.p, scrypt.dk_len)
+        self.lock_all()
 
     def create_account_from_wif(self, wif: str, password: str, label: str = '') -> Account:
         private_key = Account.get_private_key_from_wif(wif).hex()
@@ -367,14 +569,12 @@ class WalletManager(object):
         :return:
         """
         WalletManager.__check_ont_id(ont_id)
-        for identity in self.wallet_in_mem.identities:
-            if identity.ont_id == ont_id:
-                addr = identity.ont_id.replace(DID_ONT, "")
-                key = identity.controls[0].key
-                salt = base64.b64decode(identity.controls[0].salt)
-                n = self.wallet_in_mem.scrypt.n
-                private_key = Account.get_gcm_decoded_private_key(key, password, addr, salt, n, self.scheme)
-                return Account(private_key, self.scheme)
+        identity = self.wallet_in_mem.identities.find(ont_id)
+        if identity is not None:
+            addr = identity.ont_id.replace(DID_ONT, "")
+            key = identity.controls[0].key
+            salt = base64.b64decode(identity.controls[0].salt)
+            return self.__decrypt_account(key, password, addr, salt)
         raise SDKException(ErrorCode.other_error(f'Get account {ont_id} failed.'))
 
     def get_identity_by_ont_id(self, ont_id: str) -> Identity:
@@ -408,10 +608,7 @@ class WalletManager(object):
 
     def __get_control_account(self, ctrl_info: Control, password: str) -> Account:
         salt = base64.b64decode(ctrl_info.salt)
-        n = self.wallet_in_mem.scrypt.n
-        private_key = Account.get_gcm_decoded_private_key(ctrl_info.key, password, ctrl_info.b58_address, salt, n,
-                                                          self.scheme)
-        return Account(private_key, self.scheme)
+        return self.__decrypt_account(ctrl_info.key, password, ctrl_info.b58_address, salt)
 
     def get_control_account_by_b58_address(self, ont_id: str, b58_address: str, password: str) -> Account:
         WalletManager.__check_ont_id(ont_id)
@@ -421,12 +618,12 @@ class WalletManager(object):
     def get_account_data_by_b58_address(self, b58_address: str) -> AccountData:
         if not isinstance(b58_address, str):
             raise SDKException(ErrorCode.require_str_params)
-        for acct in self.wallet_in_mem.accounts:
-            if not isinstance(acct, AccountData):
-                raise SDKException(ErrorCode.other_error('Invalid account data in memory.'))
-            if acct.b58_address == b58_address:
-                return acct
-        raise SDKException(ErrorCode.other_error(f'Get account {b58_address} failed.'))
+        acct = self.wallet_in_mem.accounts.find(b58_address)
+        if acct is None:
+            raise SDKException(ErrorCode.other_error(f'Get account {b58_address} failed.'))
+        if not isinstance(acct, AccountData):
+            raise SDKException(ErrorCode.other_error('Invalid account data in memory.'))
+        return acct
 
     def get_account_by_b58_address(self, b58_address: str, password: str) -> Account:
         """
@@ -435,10 +632,8 @@ class WalletManager(object):
         :return:
         """
         acct = self.get_account_data_by_b58_address(b58_address)
-        n = self.wallet_in_mem.scrypt.n
         salt = base64.b64decode(acct.salt)
-        private_key = Account.get_gcm_decoded_private_key(acct.key, password, b58_address, salt, n, self.scheme)
-        return Account(private_key, self.scheme)
+        return self.__decrypt_account(acct.key, password, b58_address, salt)
 
     def get_default_identity(self) -> Identity:
         for identity in self.wallet_in_mem.identities:
@@ -462,6 +657,4 @@ class WalletManager(object):
     def get_default_account(self, password: str) -> Account:
         acct = self.get_default_account_data()
         salt = base64.b64decode(acct.salt)
-        n = self.wallet_in_mem.scrypt.n
-        private_key = Account.get_gcm_decoded_private_key(acct.key, password, acct.b58_address, salt, n, self.scheme)
-        return Account(private_key, self.scheme)
+        return self.__decrypt_account(acct.key, password, acct.b58_address, salt)
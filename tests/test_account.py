@@ -20,6 +20,7 @@ along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import base64
+import pickle
 import unittest
 
 from tests import password
@@ -27,7 +28,9 @@ from tests import password
 from ontology.utils import utils
 from ontology.account.account import Account
 from ontology.wallet.account import AccountData
+from ontology.exception.exception import SDKException
 from ontology.crypto.signature_scheme import SignatureScheme
+from ontology.crypto.signature_handler import SignatureHandler
 
 
 class TestAccount(unittest.TestCase):
@@ -75,6 +78,30 @@ class TestAccount(unittest.TestCase):
         result = account.verify_signature(msg, signature)
         self.assertEqual(True, result)
 
+    def test_self_verify(self):
+        account = Account('523c5fcf74823831756f0bcb3634234f10b3beb1c05595058534577752ad2d9f')
+        self.assertTrue(account.self_verify)
+        with self.assertRaises(SDKException):
+            account.self_verify = 1
+        account.self_verify = False
+        msg = utils.get_random_bytes(32)
+        signature = account.generate_signature(msg)
+        self.assertTrue(account.verify_signature(msg, signature))
+        self.assertTrue(SignatureHandler.verify_signature(account.get_public_key_bytes(), msg, signature))
+        self.assertFalse(account.verify_signature(utils.get_random_bytes(32), signature))
+        self.assertFalse(account.verify_signature(msg, signature[:-1]))
+        with self.assertRaises(SDKException):
+            Account(bytes(32))
+
+    def test_pickle(self):
+        account = Account('523c5fcf74823831756f0bcb3634234f10b3beb1c05595058534577752ad2d9f')
+        msg = utils.get_random_bytes(32)
+        signature = account.generate_signature(msg)
+        new_account = pickle.loads(pickle.dumps(account))
+        self.assertEqual(account.get_address_base58(), new_account.get_address_base58())
+        self.assertTrue(new_account.verify_signature(msg, signature))
+        self.assertTrue(account.verify_signature(msg, new_account.generate_signature(msg)))
+
     def test_get_private_key_bytes(self):
         hex_private_key = '523c5fcf74823831756f0bcb3634234f10b3beb1c05595058534577752ad2d9f'
         account = Account(hex_private_key, SignatureScheme.SHA256withECDSA)
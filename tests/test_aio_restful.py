@@ -16,11 +16,13 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import asyncio
 import unittest
 
 from tests import sdk, acct4, acct3, acct2, acct1, not_panic_exception
 
 from ontology.sdk import Ontology
+from ontology.network.aiorestful import AioRestful
 from ontology.utils.neo import NeoData
 from ontology.vm.vm_type import VmType
 from ontology.common.address import Address
@@ -44,6 +46,41 @@ class TestAioRestful(unittest.TestCase):
         if version != '':
             self.assertIn('v', version)
 
+    @not_panic_exception
+    @Ontology.runner
+    async def test_session(self):
+        async with AioRestful(sdk.restful.get_address(), connector_limit=4) as client:
+            self.assertIsNone(client.session)
+            await client.get_version()
+            session = client.session
+            self.assertEqual(4, session.connector.limit)
+            await client.get_version()
+            self.assertIs(session, client.session)
+        self.assertTrue(session.closed)
+        self.assertIsNone(client.session)
+
+    def test_session_in_new_loop(self):
+        client = AioRestful('http://127.0.0.1:1')
+
+        async def get_session():
+            with self.assertRaises(SDKException):
+                await client.get_version()
+            return client.session
+
+        loop = asyncio.new_event_loop()
+        old_session = loop.run_until_complete(get_session())
+        loop.close()
+        loop = asyncio.new_event_loop()
+        try:
+            new_session = loop.run_until_complete(get_session())
+            self.assertIsNot(old_session, new_session)
+            loop.run_until_complete(asyncio.sleep(0))
+            self.assertTrue(old_session.closed)
+            loop.run_until_complete(client.close())
+            self.assertTrue(new_session.closed)
+        finally:
+            loop.close()
+
     @not_panic_exception
     @Ontology.runner
     async def test_get_connection_count(self):
@@ -104,6 +141,17 @@ class TestAioRestful(unittest.TestCase):
         block = await sdk.aio_restful.get_block_by_height(height)
         self.assertEqual(block['Header']['Height'], height)
 
+    @not_panic_exception
+    @Ontology.runner
+    async def test_fetch_blocks(self):
+        height = 0
+        async for block in sdk.aio_restful.fetch_blocks(0, 9, concurrency=4):
+            self.assertEqual(height, block['Header']['Height'])
+            height += 1
+        self.assertEqual(10, height)
+        async for block, event_list in sdk.aio_restful.fetch_blocks(0, 1, with_events=True):
+            self.assertTrue(isinstance(event_list, list))
+
     @not_panic_exception
     @Ontology.runner
     async def test_get_balance(self):
@@ -16,12 +16,14 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import asyncio
 import unittest
 
 from asyncio import sleep
 from time import perf_counter
 
 from ontology.sdk import Ontology
+from ontology.network.aiorpc import AioRpc
 from ontology.utils.neo import NeoData
 from ontology.vm.vm_type import VmType
 from ontology.common.address import Address
@@ -47,6 +49,41 @@ class TestAioRpc(unittest.TestCase):
         if version != '':
             self.assertIn('v', version)
 
+    @not_panic_exception
+    @Ontology.runner
+    async def test_session(self):
+        async with AioRpc(sdk.rpc.get_address(), connector_limit=4) as client:
+            self.assertIsNone(client.session)
+            await client.get_version()
+            session = client.session
+            self.assertEqual(4, session.connector.limit)
+            await client.get_version()
+            self.assertIs(session, client.session)
+        self.assertTrue(session.closed)
+        self.assertIsNone(client.session)
+
+    def test_session_in_new_loop(self):
+        client = AioRpc('http://127.0.0.1:1')
+
+        async def get_session():
+            with self.assertRaises(SDKException):
+                await client.get_version()
+            return client.session
+
+        loop = asyncio.new_event_loop()
+        old_session = loop.run_until_complete(get_session())
+        loop.close()
+        loop = asyncio.new_event_loop()
+        try:
+            new_session = loop.run_until_complete(get_session())
+            self.assertIsNot(old_session, new_session)
+            loop.run_until_complete(asyncio.sleep(0))
+            self.assertTrue(old_session.closed)
+            loop.run_until_complete(client.close())
+            self.assertTrue(new_session.closed)
+        finally:
+            loop.close()
+
     @not_panic_exception
     @Ontology.runner
     async def test_get_connection_count(self):
@@ -84,6 +121,17 @@ class TestAioRpc(unittest.TestCase):
         block = await sdk.aio_rpc.get_block_by_height(height)
         self.assertEqual(block['Header']['Height'], height)
 
+    @not_panic_exception
+    @Ontology.runner
+    async def test_fetch_blocks(self):
+        height = 0
+        async for block in sdk.aio_rpc.fetch_blocks(0, 9, concurrency=4):
+            self.assertEqual(height, block['Header']['Height'])
+            height += 1
+        self.assertEqual(10, height)
+        async for block, event_list in sdk.aio_rpc.fetch_blocks(0, 1, with_events=True):
+            self.assertTrue(isinstance(event_list, list))
+
     @not_panic_exception
     @Ontology.runner
     async def test_get_block_height(self):
@@ -133,6 +181,16 @@ class TestAioRpc(unittest.TestCase):
             self.assertGreaterEqual(balance['ONT'], 0)
             self.assertGreaterEqual(balance['ONG'], 0)
 
+    @not_panic_exception
+    @Ontology.runner
+    async def test_get_balance_batch(self):
+        address_list = [acct1.get_address_base58(), acct2.get_address_base58(), acct3.get_address_base58()]
+        balance_list = await sdk.aio_rpc.get_balance_batch(address_list)
+        self.assertEqual(len(address_list), len(balance_list))
+        for balance in balance_list:
+            self.assertGreaterEqual(balance['ONT'], 0)
+            self.assertGreaterEqual(balance['ONG'], 0)
+
     @not_panic_exception
     @Ontology.runner
     async def test_get_unbound_ong(self):
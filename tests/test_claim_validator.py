@@ -0,0 +1,104 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import json
+import base64
+import unittest
+
+from time import time
+from unittest.mock import patch
+
+from tests import sdk, acct1, acct2
+from ontology.claim.claim import Claim
+from ontology.contract.native.ontid import OntId
+from ontology.claim.validator import ClaimValidator, IssuerKeyCache
+
+
+class TestClaimValidator(unittest.TestCase):
+    def setUp(self):
+        self.iss_ont_id = acct1.get_ont_id()
+        self.kid = f'{self.iss_ont_id}#keys-1'
+        self.pub_keys = [dict(PubKeyId=self.kid, Value=acct1.get_public_key_hex())]
+
+    def new_claim(self, exp: int, signer=acct1) -> str:
+        claim = Claim(sdk)
+        clm = dict(Name='NashMiao')
+        clm_rev = dict(typ='AttestContract', addr='8055b362904715fd84536e754868f4c8d27ca3f6')
+        claim.set_claim(self.kid, self.iss_ont_id, acct2.get_ont_id(), exp, 'https://example.com/template/v1', clm,
+                        clm_rev)
+        claim.generate_signature(signer, verify_kid=False)
+        return claim.to_base64()
+
+    def test_issuer_key_cache(self):
+        pub_keys = list(self.pub_keys)
+        queries = list()
+
+        def get_public_keys(ont_id):
+            queries.append(ont_id)
+            return list(pub_keys)
+
+        cache = IssuerKeyCache(get_public_keys, ttl=600, refresh_interval=0)
+        self.assertEqual(acct1.get_public_key_hex(), cache.get_public_key(self.iss_ont_id, self.kid))
+        self.assertEqual(acct1.get_public_key_hex(), cache.get_public_key(self.iss_ont_id, self.kid))
+        self.assertEqual(1, len(queries))
+        pub_keys.append(dict(PubKeyId=f'{self.iss_ont_id}#keys-2', Value=acct2.get_public_key_hex()))
+        self.assertEqual(acct2.get_public_key_hex(), cache.get_public_key(self.iss_ont_id, f'{self.iss_ont_id}#keys-2'))
+        self.assertEqual(2, len(queries))
+        pub_keys.pop(0)
+        self.assertEqual(acct1.get_public_key_hex(), cache.get_public_key(self.iss_ont_id, self.kid))
+        self.assertTrue(cache.invalidate(self.iss_ont_id))
+        self.assertEqual('', cache.get_public_key(self.iss_ont_id, self.kid))
+        self.assertEqual(3, len(queries))
+
+    def test_validate_many(self):
+        now = int(time())
+        valid_claim = self.new_claim(now + 3600)
+        expired_claim = self.new_claim(now - 3600)
+        forged_claim = self.new_claim(now + 3600, acct2)
+        b64_head, b64_payload, b64_signature, _ = valid_claim.split('.')
+        tx_hash = '0' * 64
+        root = '1' * 64
+        blk_proof = dict(Type='MerkleProof', TxnHash=tx_hash, ContractAddr='', BlockHeight=10, MerkleRoot=root,
+                         Nodes=list())
+        b64_blk_proof = base64.b64encode(json.dumps(blk_proof).encode('utf-8')).decode('ascii')
+        proof_claim = f'{b64_head}.{b64_payload}.{b64_signature}.{b64_blk_proof}'
+        block = dict(Header=dict(TransactionsRoot=root), Transactions=[dict(Hash=tx_hash)])
+        validator = ClaimValidator(sdk, max_workers=0)
+        with patch.object(OntId, 'get_public_keys', return_value=self.pub_keys) as mock_get_public_keys, \
+                patch.object(type(sdk.default_network), 'get_block_by_height', return_value=block) as mock_get_block:
+            claims = [valid_claim, expired_claim, forged_claim, 'invalid claim', proof_claim, proof_claim]
+            results = validator.validate_many(claims)
+            self.assertEqual(1, mock_get_public_keys.call_count)
+            self.assertEqual(1, mock_get_block.call_count)
+            self.assertEqual([True, False, False, False, True, True], [result.valid for result in results])
+            self.assertEqual([True, True, False, False, True, True], [result.signature for result in results])
+            self.assertEqual([False, True, False, None, False, False], [result.expired for result in results])
+            self.assertEqual([None, None, None, None, True, True], [result.blk_proof for result in results])
+            self.assertNotEqual('', results[3].error)
+            self.assertEqual(self.kid, dict(results[0])['kid'])
+            self.assertTrue(validator.validate(valid_claim).valid)
+            self.assertEqual(1, mock_get_public_keys.call_count)
+        with patch.object(OntId, 'get_public_keys', return_value=list()):
+            validator.invalidate(self.iss_ont_id)
+            result = validator.validate(valid_claim)
+            self.assertFalse(result.valid)
+            self.assertNotEqual('', result.error)
+
+
+if __name__ == '__main__':
+    unittest.main()
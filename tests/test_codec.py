@@ -0,0 +1,116 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import unittest
+import threading
+
+from ontology.core.sig import Sig
+from ontology.core.program import ProgramBuilder
+from ontology.core.transaction import Transaction
+from ontology.exception.exception import SDKException
+from ontology.io.codec import BufferWriter, BufferReader, acquire_writer, release_writer, pooled_writer
+
+
+class TestCodec(unittest.TestCase):
+    def test_write_read(self):
+        writer = BufferWriter(capacity=1)
+        writer.write_byte(15)
+        writer.write_byte('a')
+        writer.write_byte(b'byte')
+        writer.write_bool(True)
+        writer.write_int8(-1)
+        writer.write_uint16(0xabcd)
+        writer.write_int32(-2)
+        writer.write_uint64(2 ** 64 - 1)
+        for value in [0, 0xfc, 0xfd, 0xffff, 0x10000, 0xffffffff, 0x100000000]:
+            writer.write_var_int(value)
+        writer.write_var_bytes(b'\x01' * 300)
+        writer.write_var_str('ontology')
+        data = writer.to_bytes()
+        self.assertEqual(len(data), len(writer))
+        self.assertEqual('0f6162', data[:3].hex())
+        reader = BufferReader(data)
+        self.assertEqual([15, 0x61, 0x62], [reader.read_byte() for _ in range(3)])
+        self.assertEqual(True, reader.read_bool())
+        self.assertEqual(-1, reader.read_int8())
+        self.assertEqual(0xabcd, reader.read_uint16())
+        self.assertEqual(-2, reader.read_int32())
+        self.assertEqual(2 ** 64 - 1, reader.read_uint64())
+        for value in [0, 0xfc, 0xfd, 0xffff, 0x10000, 0xffffffff, 0x100000000]:
+            self.assertEqual(value, reader.read_var_int())
+        self.assertEqual(b'\x01' * 300, reader.read_var_bytes())
+        self.assertEqual(b'ontology', reader.read_var_str())
+        self.assertEqual(0, reader.remaining)
+        self.assertRaises(SDKException, reader.read_byte)
+        self.assertRaises(SDKException, reader.read_uint32)
+        self.assertRaises(SDKException, reader.read_bytes, 1)
+
+    def test_param_error(self):
+        writer = BufferWriter()
+        self.assertRaises(SDKException, writer.write_uint8, 256)
+        self.assertRaises(SDKException, writer.write_var_int, -1)
+        self.assertEqual(b'', writer.to_bytes())
+
+    def test_read_view(self):
+        data = bytearray(b'\x01\x02\x03\x04')
+        reader = BufferReader(data)
+        view = reader.read_view(2)
+        self.assertTrue(isinstance(view, memoryview))
+        self.assertEqual(b'\x01\x02', view.tobytes())
+        self.assertEqual(2, reader.position)
+
+    def test_pool(self):
+        writer = acquire_writer()
+        writer.write_uint32(1)
+        release_writer(writer)
+        self.assertIs(writer, acquire_writer())
+        self.assertEqual(0, len(writer))
+        with pooled_writer() as outer, pooled_writer() as inner:
+            self.assertIsNot(outer, inner)
+        result = dict()
+
+        def acquire():
+            result['writer'] = acquire_writer()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        thread.join()
+        self.assertIsNot(writer, result['writer'])
+
+    def test_push_bytes(self):
+        for size, prefix in [(1, '01'), (75, '4b'), (76, '4c4c'), (256, '4d0001'), (65536, '4e00000100')]:
+            code = ProgramBuilder.push_bytes(b'\x01' * size)
+            self.assertTrue(isinstance(code, bytearray))
+            self.assertEqual(prefix, code[:len(prefix) // 2].hex())
+            self.assertEqual([b'\x01' * size], ProgramBuilder.get_param_info(bytes(code)))
+
+    def test_transaction(self):
+        pub_key = bytes.fromhex('03036c12be3726eb283d078dff481175e96224f0b0c632c7a37e10eb40fe6be889')
+        sig = Sig([pub_key], 1, [b'\x01' * 64])
+        tx = Transaction(0, 0xd1, 500, 20000, b'\x02' * 20, bytearray(b'\x03' * 300), 1, bytearray(), [sig])
+        tx_bytes = tx.serialize()
+        self.assertEqual(tx.serialize_unsigned(), tx_bytes[:len(tx.serialize_unsigned())])
+        self.assertEqual(sig.serialize(), tx_bytes[-len(sig.serialize()):])
+        new_tx = Transaction.deserialize_from(tx_bytes)
+        self.assertEqual(tx_bytes, new_tx.serialize())
+        self.assertEqual([pub_key], new_tx.sig_list[0].public_keys)
+        self.assertEqual([b'\x01' * 64], new_tx.sig_list[0].sig_data)
+
+
+if __name__ == '__main__':
+    unittest.main()
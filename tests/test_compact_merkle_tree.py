@@ -0,0 +1,127 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import hashlib
+import unittest
+import tempfile
+
+from ontology.sdk import Ontology
+from ontology.exception.exception import SDKException
+from ontology.merkle.merkle_verifier import MerkleVerifier, hash_children
+from ontology.merkle.compact_merkle_tree import CompactMerkleTree, FileHashStore, EMPTY_ROOT
+
+
+def merkle_tree_hash(leaves: list) -> bytes:
+    if len(leaves) == 0:
+        return EMPTY_ROOT
+    if len(leaves) == 1:
+        return leaves[0]
+    k = 1 << ((len(leaves) - 1).bit_length() - 1)
+    return hash_children(merkle_tree_hash(leaves[:k]), merkle_tree_hash(leaves[k:]))
+
+
+class TestCompactMerkleTree(unittest.TestCase):
+    def setUp(self):
+        self.leaves = [hashlib.sha256(index.to_bytes(4, 'little')).digest() for index in range(37)]
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'merkle_tree.db')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_root(self):
+        tree = CompactMerkleTree()
+        self.assertEqual(EMPTY_ROOT, tree.root)
+        for index, leaf in enumerate(self.leaves):
+            tree.append(leaf)
+            self.assertEqual(merkle_tree_hash(self.leaves[:index + 1]), tree.root)
+        for tree_size in range(len(self.leaves) + 1):
+            self.assertEqual(merkle_tree_hash(self.leaves[:tree_size]), tree.get_root(tree_size))
+        self.assertRaises(SDKException, tree.get_root, len(self.leaves) + 1)
+        self.assertRaises(SDKException, tree.append, b'\x00')
+
+    def test_inclusion_proof(self):
+        tree = CompactMerkleTree()
+        tree.extend(self.leaves)
+        for tree_size in range(1, len(self.leaves) + 1):
+            root = merkle_tree_hash(self.leaves[:tree_size])
+            for index in range(tree_size):
+                self.assertTrue(tree.get_inclusion_proof(index, tree_size).validate(root))
+                merkle_proof = tree.get_merkle_proof(index, tree_size)
+                proof_node = MerkleVerifier.get_proof(index, merkle_proof['TargetHashes'], tree_size - 1)
+                self.assertTrue(MerkleVerifier.validate_proof(proof_node, merkle_proof['TransactionsRoot'],
+                                                              merkle_proof['CurBlockRoot'], True))
+        proofs = [tree.get_inclusion_proof(index) for index in range(len(self.leaves))]
+        self.assertEqual([True] * len(self.leaves), MerkleVerifier.validate_compact_proofs(proofs, tree.root))
+        self.assertRaises(SDKException, tree.get_inclusion_proof, 5, 5)
+
+    def test_consistency_proof(self):
+        tree = CompactMerkleTree()
+        tree.extend(self.leaves)
+        for new_size in range(1, len(self.leaves) + 1):
+            new_root = tree.get_root(new_size)
+            for old_size in range(1, new_size + 1):
+                old_root = tree.get_root(old_size)
+                proof = tree.get_consistency_proof(old_size, new_size)
+                self.assertTrue(MerkleVerifier.validate_consistency_proof(old_size, new_size, old_root, new_root,
+                                                                          proof))
+                self.assertFalse(MerkleVerifier.validate_consistency_proof(old_size, new_size, old_root,
+                                                                           EMPTY_ROOT, proof))
+                if len(proof) != 0:
+                    forged = [EMPTY_ROOT] + proof[1:]
+                    self.assertFalse(MerkleVerifier.validate_consistency_proof(old_size, new_size, old_root,
+                                                                               new_root, forged))
+        self.assertRaises(SDKException, tree.get_consistency_proof, 0)
+
+    def test_file_hash_store(self):
+        with CompactMerkleTree(FileHashStore(self.path)) as tree:
+            tree.extend(self.leaves[:23])
+            tree.flush()
+        with open(self.path, 'ab') as f:
+            f.write(b'\x01' * 72)
+        with CompactMerkleTree(FileHashStore(self.path)) as tree:
+            self.assertEqual(23, tree.tree_size)
+            self.assertEqual(merkle_tree_hash(self.leaves[:23]), tree.root)
+            tree.extend(self.leaves[23:])
+            self.assertEqual(merkle_tree_hash(self.leaves), tree.root)
+            self.assertTrue(tree.get_inclusion_proof(7).validate(tree.root))
+
+    @Ontology.runner
+    async def test_aio_sync(self):
+        blocks = [dict(Header=dict(Height=height, TransactionsRoot=leaf[::-1].hex()))
+                  for height, leaf in enumerate(self.leaves)]
+
+        class Network(object):
+            @staticmethod
+            async def get_block_height():
+                return len(blocks) - 1
+
+            @staticmethod
+            async def get_block_by_height(height: int):
+                return blocks[height]
+
+        tree = CompactMerkleTree()
+        self.assertEqual(10, await tree.aio_sync(Network(), 9))
+        self.assertEqual(len(self.leaves), await tree.aio_sync(Network()))
+        self.assertEqual(merkle_tree_hash(self.leaves), tree.root)
+        self.assertRaises(SDKException, tree.append_block, blocks[3])
+
+
+if __name__ == '__main__':
+    unittest.main()
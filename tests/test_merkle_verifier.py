@@ -16,11 +16,36 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import hashlib
 import unittest
 
 from tests import not_panic_exception
 
-from ontology.merkle.merkle_verifier import MerkleVerifier
+from ontology.exception.exception import SDKException
+from ontology.merkle.merkle_verifier import MerkleVerifier, CompactMerkleProof
+
+
+def build_tree(leaves: list) -> list:
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        nodes = levels[-1]
+        parents = [hashlib.sha256(b'\x01' + nodes[i] + nodes[i + 1]).digest() for i in range(0, len(nodes) - 1, 2)]
+        if len(nodes) % 2 == 1:
+            parents.append(nodes[-1])
+        levels.append(parents)
+    return levels
+
+
+def get_merkle_proof(levels: list, index: int) -> dict:
+    target_hashes = list()
+    position = index
+    for nodes in levels[:-1]:
+        sibling = position ^ 1
+        if sibling < len(nodes):
+            target_hashes.append(nodes[sibling][::-1].hex())
+        position //= 2
+    return dict(BlockHeight=index, CurBlockHeight=len(levels[0]) - 1, TransactionsRoot=levels[0][index][::-1].hex(),
+                CurBlockRoot=levels[-1][0][::-1].hex(), TargetHashes=target_hashes)
 
 
 class TestMerkleVerifier(unittest.TestCase):
@@ -73,6 +98,35 @@ class TestMerkleVerifier(unittest.TestCase):
         result = MerkleVerifier.validate_proof(proof_node, target_hash, current_block_root)
         self.assertTrue(result)
 
+    def test_compact_proof(self):
+        levels = build_tree([hashlib.sha256(bytes([i])).digest() for i in range(13)])
+        for index in range(13):
+            merkle_proof = get_merkle_proof(levels, index)
+            proof = CompactMerkleProof.from_merkle_proof(merkle_proof)
+            self.assertEqual(levels[-1][0], proof.root())
+            proof_node = MerkleVerifier.get_proof(index, merkle_proof['TargetHashes'], 12)
+            self.assertEqual(proof_node, proof.to_proof_node(True))
+            self.assertTrue(MerkleVerifier.validate_proof(proof_node, merkle_proof['TransactionsRoot'],
+                                                          merkle_proof['CurBlockRoot'], True))
+            self.assertEqual(proof.siblings, CompactMerkleProof.from_proof_node(proof_node, merkle_proof[
+                'TransactionsRoot'], True).siblings)
+        merkle_proof['BlockHeight'] = 13
+        self.assertRaises(SDKException, CompactMerkleProof.from_merkle_proof, merkle_proof)
+
+    def test_validate_compact_proofs(self):
+        levels = build_tree([hashlib.sha256(bytes([i])).digest() for i in range(21)])
+        merkle_proofs = [get_merkle_proof(levels, index) for index in range(21)]
+        proofs = [CompactMerkleProof.from_merkle_proof(merkle_proof) for merkle_proof in merkle_proofs]
+        merkle_root = merkle_proofs[0]['CurBlockRoot']
+        self.assertEqual([True] * 21, MerkleVerifier.validate_compact_proofs(proofs, merkle_root))
+        forged = dict(merkle_proofs[5], TransactionsRoot='00' * 32)
+        proofs.insert(0, CompactMerkleProof.from_merkle_proof(forged))
+        proofs.append(CompactMerkleProof.from_merkle_proof(forged))
+        proofs.append(CompactMerkleProof(proofs[1].target_hash, proofs[1].directions, proofs[1].siblings))
+        results = MerkleVerifier.validate_compact_proofs(proofs, merkle_root)
+        self.assertEqual([False] + [True] * 21 + [False, True], results)
+        self.assertEqual([False] * 24, MerkleVerifier.validate_compact_proofs(proofs, '00' * 32))
+
 
 if __name__ == '__main__':
     unittest.main()
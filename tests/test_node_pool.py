@@ -0,0 +1,108 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import requests
+import unittest
+
+from ontology.sdk import Ontology
+from ontology.network.rpc import Rpc
+from ontology.network.aiorpc import AioRpc
+from ontology.network.restful import Restful
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.network.pool import NodePool, CircuitState, SelectStrategy
+
+from tests import sdk, not_panic_exception
+
+UNREACHABLE_ADDRESS = 'http://127.0.0.1:1'
+
+
+class TestNodePool(unittest.TestCase):
+    def test_init(self):
+        with self.assertRaises(SDKException):
+            NodePool([])
+        with self.assertRaises(SDKException):
+            NodePool([Rpc(UNREACHABLE_ADDRESS)], strategy='')
+
+    def test_no_available_node(self):
+        pool = NodePool.from_addresses([UNREACHABLE_ADDRESS], Rpc, failure_threshold=1)
+        with self.assertRaises(SDKException) as context:
+            pool.get_version()
+        self.assertEqual(60002, context.exception.args[0])
+        self.assertEqual(CircuitState.OPEN, pool.nodes[0].state)
+        with self.assertRaises(SDKException) as context:
+            pool.get_version()
+        self.assertEqual(60003, context.exception.args[0])
+
+    def test_connect_errors(self):
+        class DeadNode(object):
+            def __init__(self, error: Exception):
+                self.error = error
+                self.calls = 0
+
+            def get_address(self):
+                return str(self.error)
+
+            def get_version(self):
+                self.calls += 1
+                raise self.error
+
+        errors = [SDKException(ErrorCode.connect_err('')), requests.exceptions.ConnectionError('reset'),
+                  ConnectionResetError('reset')]
+        clients = [DeadNode(error) for error in errors]
+        pool = NodePool(clients, failure_threshold=1)
+        with self.assertRaises(Exception):
+            pool.get_version()
+        self.assertEqual([1] * len(clients), [client.calls for client in clients])
+        self.assertEqual([CircuitState.OPEN] * len(clients), [node.state for node in pool.nodes])
+        pool = NodePool([DeadNode(SDKException(ErrorCode.other_error('')))], failure_threshold=1)
+        with self.assertRaises(SDKException):
+            pool.get_version()
+        self.assertEqual(CircuitState.CLOSED, pool.nodes[0].state)
+
+    @not_panic_exception
+    def test_failover(self):
+        pool = NodePool.from_addresses([UNREACHABLE_ADDRESS, sdk.rpc.get_address()], Rpc, failure_threshold=1)
+        for _ in range(3):
+            self.assertGreater(pool.get_block_count(), 0)
+        self.assertEqual(CircuitState.OPEN, pool.nodes[0].state)
+        self.assertEqual(CircuitState.CLOSED, pool.nodes[1].state)
+        self.assertIsNotNone(pool.nodes[1].latency)
+
+    @not_panic_exception
+    def test_check_health(self):
+        pool = NodePool.from_addresses([UNREACHABLE_ADDRESS, sdk.restful.get_address()], Restful,
+                                       strategy=SelectStrategy.LATENCY_WEIGHTED)
+        health = pool.check_health()
+        self.assertFalse(health[UNREACHABLE_ADDRESS])
+        self.assertTrue(health[sdk.restful.get_address()])
+        self.assertGreater(pool.get_block_height(), 0)
+
+    @not_panic_exception
+    @Ontology.runner
+    async def test_aio_pool(self):
+        pool = NodePool.from_addresses([UNREACHABLE_ADDRESS, sdk.aio_rpc.get_address()], AioRpc)
+        health = await pool.aio_check_health()
+        self.assertFalse(health[UNREACHABLE_ADDRESS])
+        self.assertGreater(await pool.get_block_count(), 0)
+        for client in pool.clients:
+            await client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -114,6 +114,32 @@ class TestOep4(unittest.TestCase):
         balance = oep4.balance_of(b58_address2)
         self.assertGreaterEqual(balance, 1)
 
+    @not_panic_exception
+    def test_balance_of_many(self):
+        oep4 = sdk.neo_vm.oep4(self.contract_address)
+        b58_address_list = [acct1.get_address_base58(), acct2.get_address_base58(), acct3.get_address_base58(),
+                            acct4.get_address_base58()]
+        for network in self.networks:
+            sdk.default_network = network
+            result = list(oep4.balance_of_many(b58_address_list, batch_size=3))
+            self.assertEqual(b58_address_list, [item[0] for item in result])
+            for b58_address, balance in result:
+                self.assertEqual(oep4.balance_of(b58_address), balance)
+        sdk.default_network = sdk.rpc
+
+    def test_new_transfer_tx_batch(self):
+        oep4 = sdk.neo_vm.oep4(self.contract_address)
+        from_list = [acct1.get_address_base58(), acct2.get_address_base58()]
+        to_list = [acct2.get_address_base58(), acct3.get_address_base58()]
+        amount_list = [1, 10 ** 9]
+        payer = acct1.get_address_base58()
+        tx_list = oep4.new_transfer_tx_batch(from_list, to_list, amount_list, payer, self.gas_price, self.gas_limit)
+        for index, tx in enumerate(tx_list):
+            ref_tx = oep4.new_transfer_tx(from_list[index], to_list[index], amount_list[index], payer, self.gas_price,
+                                          self.gas_limit)
+            ref_tx.nonce = tx.nonce
+            self.assertEqual(ref_tx.serialize_unsigned(), tx.serialize_unsigned())
+
     @not_panic_exception
     def test_transfer_multi(self):
         oep4 = sdk.neo_vm.oep4()
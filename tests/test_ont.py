@@ -23,7 +23,9 @@ from Cryptodome.Random.random import randint
 from ontology.utils.event import Event
 
 from ontology.common.address import Address
+from ontology.core.batch_transaction import sign_transaction_batch
 
+from ontology.exception.exception import SDKException
 from tests import sdk, not_panic_exception, acct1, acct2, acct3, acct4
 
 
@@ -83,6 +85,36 @@ class TestOnt(unittest.TestCase):
         self.assertEqual(acct4.get_address_base58(), notify['States'][1])
         self.assertEqual(self.gas_price * self.gas_limit, notify['States'][3])
 
+    def test_new_transfer_tx_batch(self):
+        ont = sdk.native_vm.ont()
+        from_list = [acct1.get_address_base58(), acct2.get_address_base58(), acct1.get_address_base58()]
+        to_list = [acct2.get_address_base58(), acct3.get_address_base58(), acct4.get_address()]
+        amount_list = [1, 16, 10 ** 9]
+        payer = acct1.get_address_base58()
+        tx_list = ont.new_transfer_tx_batch(from_list, to_list, amount_list, payer, self.gas_price, self.gas_limit, 7)
+        self.assertEqual([7, 8, 9], [tx.nonce for tx in tx_list])
+        for index, tx in enumerate(tx_list):
+            ref_tx = ont.new_transfer_tx(from_list[index], to_list[index], amount_list[index], payer, self.gas_price,
+                                         self.gas_limit)
+            ref_tx.nonce = tx.nonce
+            self.assertEqual(ref_tx.serialize_unsigned(), tx.serialize_unsigned())
+        with self.assertRaises(SDKException):
+            ont.new_transfer_tx_batch(from_list, to_list, [1, 2], payer, self.gas_price, self.gas_limit)
+        with self.assertRaises(SDKException):
+            ont.new_transfer_tx_batch(from_list, to_list, [1, 0, 2], payer, self.gas_price, self.gas_limit)
+        signer_list = [[acct1], [acct2, acct1], [acct1, acct1]]
+        sign_transaction_batch(tx_list, signer_list, max_workers=2, chunk_size=1)
+        self.assertEqual([1, 2, 1], [len(tx.sig_list) for tx in tx_list])
+        for tx, signers in zip(tx_list, signer_list):
+            for sig, signer in zip(tx.sig_list, signers):
+                self.assertEqual([signer.get_public_key_bytes()], sig.public_keys)
+                self.assertTrue(signer.verify_signature(tx.hash256(), sig.sig_data[0]))
+        for _ in range(15):
+            tx_list[0].add_sign_transaction(acct1)
+        with self.assertRaises(SDKException):
+            sign_transaction_batch(tx_list, [acct2], max_workers=0)
+        self.assertEqual([16, 2, 1], [len(tx.sig_list) for tx in tx_list])
+
     @not_panic_exception
     def test_transfer_from_tx(self):
         acct2_b58_address = acct2.get_address_base58()
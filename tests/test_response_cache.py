@@ -0,0 +1,109 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import json
+import unittest
+import tempfile
+
+from ontology.network.rpc import Rpc
+from ontology.exception.exception import SDKException
+from ontology.network.cache import ResponseCache, CacheMethod
+
+
+def make_response(height: int) -> dict:
+    block = dict(Hash=f'{height:064x}', Header=dict(Height=height))
+    return dict(desc='SUCCESS', error=0, id=1, jsonrpc='2.0', result=block)
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_get_put(self):
+        cache = ResponseCache()
+        self.assertIsNone(cache.get('rpc', CacheMethod.BLOCK_BY_HEIGHT, 1))
+        cache.put('rpc', CacheMethod.BLOCK_BY_HEIGHT, 1, make_response(1))
+        response = cache.get('rpc', CacheMethod.BLOCK_BY_HEIGHT, 1)
+        self.assertEqual(make_response(1), response)
+        response['result'] = None
+        self.assertEqual(make_response(1), cache.get('rpc', CacheMethod.BLOCK_BY_HEIGHT, 1))
+        self.assertIsNone(cache.get('restful', CacheMethod.BLOCK_BY_HEIGHT, 1))
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(2, cache.misses)
+
+    def test_empty_result(self):
+        cache = ResponseCache()
+        for result in [None, '', dict(), list()]:
+            cache.put('rpc', CacheMethod.CONTRACT_EVENT, 'aa', dict(error=0, result=result))
+            self.assertIsNone(cache.get('rpc', CacheMethod.CONTRACT_EVENT, 'aa'))
+        self.assertEqual(0, len(cache))
+
+    def test_hash_key(self):
+        cache = ResponseCache()
+        cache.put('rpc', CacheMethod.TRANSACTION, 'AB' * 32, make_response(1))
+        self.assertEqual(make_response(1), cache.get('rpc', CacheMethod.TRANSACTION, 'ab' * 32))
+
+    def test_lru(self):
+        entry_size = len(json.dumps(make_response(0), separators=(',', ':')))
+        cache = ResponseCache(max_bytes=entry_size * 3)
+        for height in range(5):
+            cache.put('rpc', CacheMethod.BLOCK_BY_HEIGHT, height, make_response(height))
+        self.assertEqual(3, len(cache))
+        self.assertLessEqual(cache.size, cache.max_bytes)
+        self.assertIsNone(cache.get('rpc', CacheMethod.BLOCK_BY_HEIGHT, 0))
+        self.assertIsNotNone(cache.get('rpc', CacheMethod.BLOCK_BY_HEIGHT, 2))
+        cache.put('rpc', CacheMethod.BLOCK_BY_HEIGHT, 5, make_response(5))
+        self.assertIsNotNone(cache.get('rpc', CacheMethod.BLOCK_BY_HEIGHT, 2))
+        self.assertIsNone(cache.get('rpc', CacheMethod.BLOCK_BY_HEIGHT, 3))
+
+    def test_disk(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = os.path.join(dir_path, 'cache.db')
+            cache = ResponseCache(disk_path=path)
+            cache.put('rpc', CacheMethod.MERKLE_PROOF, 'ab' * 32, make_response(1))
+            cache.close()
+            cache = ResponseCache(max_bytes=0, disk_path=path)
+            self.assertEqual(make_response(1), cache.get('rpc', CacheMethod.MERKLE_PROOF, 'ab' * 32))
+            self.assertEqual(0, len(cache))
+            cache.clear()
+            self.assertIsNone(cache.get('rpc', CacheMethod.MERKLE_PROOF, 'ab' * 32))
+            cache.close()
+
+    def test_client_cache(self):
+        cache = ResponseCache()
+        rpc = Rpc('http://127.0.0.1:1', cache=cache)
+        self.assertIs(cache, rpc.cache)
+        rpc._cache_response(CacheMethod.BLOCK_BY_HEIGHT, 1, make_response(1))
+        self.assertEqual(make_response(1)['result'], rpc.get_block_by_height(1))
+        self.assertEqual(make_response(1)['result'], rpc.get_block_by_hash(f'{1:064x}'))
+        with self.assertRaises(SDKException):
+            rpc.get_block_by_height(2)
+        other_rpc = Rpc('http://127.0.0.2:1', cache=cache)
+        with self.assertRaises(SDKException):
+            other_rpc.get_block_by_height(1)
+        rpc.set_address('http://127.0.0.2:1')
+        with self.assertRaises(SDKException):
+            rpc.get_block_by_height(1)
+        rpc.set_address('http://127.0.0.1:1')
+        with self.assertRaises(SDKException):
+            rpc.cache = dict()
+        rpc.cache = None
+        with self.assertRaises(SDKException):
+            rpc.get_block_by_height(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
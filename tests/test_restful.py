@@ -21,6 +21,8 @@ along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 
 import unittest
 
+from requests import Session
+
 from ontology.vm.vm_type import VmType
 from ontology.utils.neo import NeoData
 from tests import sdk, acct4, acct3, acct1, acct2, not_panic_exception
@@ -28,6 +30,7 @@ from tests import sdk, acct4, acct3, acct1, acct2, not_panic_exception
 from ontology.common.address import Address
 from ontology.account.account import Account
 from ontology.exception.exception import SDKException
+from ontology.network.restful import Restful
 from ontology.crypto.signature_scheme import SignatureScheme
 
 
@@ -45,6 +48,14 @@ class TestRestful(unittest.TestCase):
         if version != '':
             self.assertIn('v', version)
 
+    def test_session(self):
+        session = sdk.restful.session
+        self.assertTrue(isinstance(session, Session))
+        self.assertIs(session, Restful().session)
+        self.assertIs(session, sdk.rpc.session)
+        with self.assertRaises(SDKException):
+            sdk.restful.session = None
+
     @not_panic_exception
     def test_get_connection_count(self):
         count = sdk.restful.get_connection_count()
@@ -22,10 +22,14 @@ along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 import time
 import unittest
 
+from requests import Session
+
 from ontology.vm.vm_type import VmType
 from ontology.utils.neo import NeoData
 from ontology.common.address import Address
+from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
+from ontology.network.rpc import Rpc, RpcMethod
 
 from tests import sdk, acct1, acct2, acct3, acct4, not_panic_exception
 
@@ -44,6 +48,14 @@ class TestRpcClient(unittest.TestCase):
         if version != '':
             self.assertIn('v', version)
 
+    def test_session(self):
+        session = sdk.rpc.session
+        self.assertTrue(isinstance(session, Session))
+        self.assertIs(session, Rpc().session)
+        self.assertIs(session, sdk.restful.session)
+        with self.assertRaises(SDKException):
+            sdk.rpc.session = None
+
     @not_panic_exception
     def test_get_connection_count(self):
         count = sdk.rpc.get_connection_count()
@@ -124,6 +136,32 @@ class TestRpcClient(unittest.TestCase):
             self.assertGreaterEqual(balance['ONT'], 0)
             self.assertGreaterEqual(balance['ONG'], 0)
 
+    @not_panic_exception
+    def test_get_balance_batch(self):
+        balance_list = sdk.rpc.get_balance_batch(self.address_list)
+        self.assertEqual(len(self.address_list), len(balance_list))
+        for address, balance in zip(self.address_list, balance_list):
+            self.assertEqual(sdk.rpc.get_balance(address), balance)
+
+    def test_demux_batch_response(self):
+        calls = [(RpcMethod.GET_BALANCE, [address, 1]) for address in self.address_list]
+        payload = sdk.rpc.generate_json_rpc_batch_payload(calls)
+        self.assertEqual(list(range(1, len(calls) + 1)), [item['id'] for item in payload])
+        content = [dict(desc='SUCCESS', error=0, id=item['id'], jsonrpc='2.0', result=item['params'][0])
+                   for item in reversed(payload)]
+        response_list = Rpc._demux_batch_response(payload, content)
+        self.assertEqual(self.address_list, [response['result'] for response in response_list])
+        content[0]['error'] = 42001
+        with self.assertRaises(SDKException) as context:
+            Rpc._demux_batch_response(payload, content)
+        self.assertEqual(ErrorCode.other_error('')['error'], context.exception.args[0])
+        with self.assertRaises(SDKException) as context:
+            Rpc._demux_batch_response(payload, content[1:])
+        self.assertEqual(ErrorCode.batch_not_supported('')['error'], context.exception.args[0])
+        with self.assertRaises(SDKException) as context:
+            Rpc._demux_batch_response(payload, dict(desc='INVALID PARAMS', error=42002, result=''))
+        self.assertEqual(ErrorCode.batch_not_supported('')['error'], context.exception.args[0])
+
     @not_panic_exception
     def test_get_unbound_ong(self):
         for address in self.address_list:
@@ -0,0 +1,132 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import asyncio
+import unittest
+import tempfile
+
+from ontology.sdk import Ontology
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.utils.scan import ScanCheckpoint, BatchMapper, chunked, scan, aio_scan
+
+
+class TestScan(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'checkpoint.json')
+        self.batch_count = 0
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def query(self, chunk: list) -> list:
+        self.batch_count += 1
+        return [item * 2 for item in chunk]
+
+    def unsupported_batch(self, chunk: list) -> list:
+        self.batch_count += 1
+        raise SDKException(ErrorCode.batch_not_supported('INVALID PARAMS'))
+
+    def failed_batch(self, chunk: list) -> list:
+        self.batch_count += 1
+        raise SDKException(ErrorCode.other_error('invalid item'))
+
+    def single_query(self, item: int) -> int:
+        if item < 0:
+            raise SDKException(ErrorCode.other_error(f'invalid item {item}'))
+        return item * 2
+
+    def test_chunked(self):
+        self.assertEqual([[0, 1, 2], [3, 4, 5], [6]], list(chunked(range(7), 3)))
+        self.assertEqual([], list(chunked([], 3)))
+
+    def test_scan(self):
+        self.assertEqual([(i, i * 2) for i in range(10)], list(scan(range(10), self.query, 3)))
+        self.assertEqual(4, self.batch_count)
+
+    def test_checkpoint(self):
+        checkpoint = ScanCheckpoint(self.path)
+        result = list()
+        for item in scan(range(10), self.query, 3, checkpoint):
+            if item[0] == 5:
+                break
+            result.append(item)
+        self.assertEqual(5, ScanCheckpoint(self.path).offset)
+        result.extend(scan(range(10), self.query, 3, ScanCheckpoint(self.path)))
+        self.assertEqual([(i, i * 2) for i in range(10)], result)
+        self.assertEqual(10, ScanCheckpoint(self.path).offset)
+        checkpoint.reset()
+        self.assertFalse(os.path.isfile(self.path))
+        self.assertEqual(0, ScanCheckpoint(self.path).offset)
+
+    def test_batch_mapper(self):
+        with BatchMapper(lambda item: item * 2, self.query) as mapper:
+            self.assertEqual([0, 2, 4], mapper([0, 1, 2]))
+            self.assertTrue(mapper.batch_supported)
+        with BatchMapper(lambda item: item * 2, self.unsupported_batch, 4) as mapper:
+            self.assertEqual([0, 2, 4], mapper([0, 1, 2]))
+            self.assertEqual([6, 8], mapper([3, 4]))
+            self.assertFalse(mapper.batch_supported)
+        self.assertEqual(2, self.batch_count)
+        with BatchMapper(self.single_query, self.failed_batch, 4) as mapper:
+            with self.assertRaises(SDKException) as context:
+                mapper([0, -1, 2])
+            self.assertIn('invalid item -1', context.exception.args[1])
+            self.assertEqual([0, 2, 4], mapper([0, 1, 2]))
+            self.assertTrue(mapper.batch_supported)
+        self.assertEqual(4, self.batch_count)
+        for error in (ErrorCode.connect_err('refused'), ErrorCode.connect_timeout('timeout')):
+            def dead_batch(chunk: list) -> list:
+                raise SDKException(error)
+
+            with BatchMapper(self.single_query, dead_batch) as mapper:
+                with self.assertRaises(SDKException) as context:
+                    mapper([0, 1, 2])
+                self.assertEqual(error['error'], context.exception.args[0])
+                self.assertTrue(mapper.batch_supported)
+
+    @Ontology.runner
+    async def test_aio_scan(self):
+        running = list()
+
+        async def query(item):
+            running.append(item)
+            self.assertLessEqual(len(running), 4)
+            try:
+                await asyncio.sleep(0.001 * (10 - item))
+            finally:
+                running.remove(item)
+            return item * 2
+
+        checkpoint = ScanCheckpoint(self.path)
+        result = list()
+        async for item in aio_scan(range(10), query, 4, checkpoint, checkpoint_interval=2):
+            if item[0] == 7:
+                break
+            result.append(item)
+        await asyncio.sleep(0.02)
+        self.assertEqual(7, ScanCheckpoint(self.path).offset)
+        async for item in aio_scan(range(10), query, 4, ScanCheckpoint(self.path)):
+            result.append(item)
+        self.assertEqual([(i, i * 2) for i in range(10)], result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,7 +21,8 @@ import unittest
 from tests import sdk, acct1, acct2
 
 from ontology.crypto.signature_scheme import SignatureScheme
-from ontology.crypto.signature_handler import SignatureHandler
+from ontology.crypto.signature_handler import SignatureHandler, load_public_key
+from ontology.exception.exception import SDKException
 
 
 class TestSignatureHandler(unittest.TestCase):
@@ -43,6 +44,17 @@ class TestSignatureHandler(unittest.TestCase):
         result = acct2.verify_signature(msg, signature)
         self.assertFalse(result)
 
+    def test_scheme_hash_algorithm(self):
+        msg = b'Attack!'
+        for scheme in (SignatureScheme.SHA224withECDSA, SignatureScheme.SHA384withECDSA):
+            handler = SignatureHandler(scheme)
+            signature = bytes.fromhex(handler.generate_signature(acct1.get_private_key_hex(), msg))
+            public_key = load_public_key(acct1.get_public_key_bytes())
+            self.assertTrue(SignatureHandler.verify_signature_by_key(public_key, msg, signature, scheme))
+            self.assertFalse(SignatureHandler.verify_signature_by_key(public_key, msg, signature))
+        with self.assertRaises(SDKException):
+            SignatureHandler.verify_signature_by_key(public_key, msg, signature, SignatureScheme.SM3withSM2)
+
     def test_verify_cyano_signature(self):
         msg = b'123'
         sign = '0b6912568942a1e646b3a532dc904e965eb1085bab877bc34fe06768257f07b3' \
@@ -56,3 +68,48 @@ class TestSignatureHandler(unittest.TestCase):
         handler = SignatureHandler(SignatureScheme.SHA256withECDSA)
         result = handler.verify_signature(bytes.fromhex(pk), msg, bytes.fromhex(sign))
         self.assertTrue(result)
+
+    def test_verify_public_key_format(self):
+        msg = b'123'
+        sign = bytes.fromhex('0b6912568942a1e646b3a532dc904e965eb1085bab877bc34fe06768257f07b3'
+                             '079af3fa69fc759b51fa2bf894a7fd748ab5bc326c8663a01f90dcc518184e65')
+        pk = bytes.fromhex('03036c12be3726eb283d078dff481175e96224f0b0c632c7a37e10eb40fe6be889')
+        handler = SignatureHandler(SignatureScheme.SHA256withECDSA)
+        uncompressed_pk = handler.uncompress_public_key(pk)
+        self.assertEqual(64, len(uncompressed_pk))
+        self.assertEqual(pk[1:], uncompressed_pk[:32])
+        self.assertTrue(handler.verify_signature(b'\x04' + uncompressed_pk, msg, sign))
+        self.assertTrue(handler.verify_signature(pk.hex(), msg, sign))
+        self.assertFalse(handler.verify_signature(pk, b'1234', sign))
+        self.assertFalse(handler.verify_signature(pk, msg, sign[:-1]))
+        self.assertFalse(handler.verify_signature(pk, msg, b'\x00' * 64))
+        self.assertRaises(SDKException, handler.verify_signature, b'\x05' + pk[1:], msg, sign)
+        self.assertRaises(SDKException, handler.verify_signature, pk[:-1], msg, sign)
+
+    def test_verify_many(self):
+        items = list()
+        for index in range(20):
+            msg = index.to_bytes(4, 'little')
+            acct = [acct1, acct2][index % 2]
+            items.append((acct.get_public_key_bytes(), msg, acct.generate_signature(msg)))
+        items.append((acct1.get_public_key_bytes(), b'', items[0][2]))
+        items.append((acct1.get_public_key_bytes().hex(), items[0][1], items[0][2]))
+        items.append((b'\x05' * 33, items[0][1], items[0][2]))
+        expected = [True] * 20 + [False, True, False]
+        self.assertEqual(expected, SignatureHandler.verify_many(items, max_workers=0))
+        self.assertEqual(expected, SignatureHandler.verify_many(items, max_workers=2, chunk_size=4))
+        self.assertEqual([], SignatureHandler.verify_many([]))
+
+    def test_verify_multi_signature(self):
+        msg = b'123'
+        pub_keys = [acct1.get_public_key_bytes(), acct2.get_public_key_bytes()]
+        sig_data = [acct2.generate_signature(msg), acct1.generate_signature(msg)]
+        self.assertTrue(SignatureHandler.verify_multi_signature(pub_keys, 2, msg, sig_data))
+        self.assertTrue(SignatureHandler.verify_multi_signature(pub_keys, 1, msg, sig_data))
+        self.assertFalse(SignatureHandler.verify_multi_signature(pub_keys, 2, msg, sig_data[:1] * 2))
+        self.assertFalse(SignatureHandler.verify_multi_signature(pub_keys, 2, msg, sig_data[:1]))
+        self.assertFalse(SignatureHandler.verify_multi_signature(pub_keys, 3, msg, sig_data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import unittest
+
+from ontology.sdk import Ontology
+from ontology.network.flight import SingleFlight
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.count = 0
+
+    async def query(self):
+        self.count += 1
+        await asyncio.sleep(0.05)
+        return dict(result=self.count)
+
+    async def fail(self):
+        self.count += 1
+        await asyncio.sleep(0.05)
+        raise SDKException(ErrorCode.other_error('failed'))
+
+    @Ontology.runner
+    async def test_coalesce(self):
+        flight = SingleFlight()
+        result = await asyncio.gather(*[flight.do('a', self.query) for _ in range(10)])
+        self.assertEqual(1, self.count)
+        self.assertEqual(0, flight.in_flight)
+        for item in result:
+            self.assertEqual(dict(result=1), item)
+        result[0]['result'] = 0
+        self.assertEqual(1, result[1]['result'])
+        await asyncio.gather(flight.do('a', self.query), flight.do('b', self.query))
+        self.assertEqual(3, self.count)
+
+    @Ontology.runner
+    async def test_ttl(self):
+        flight = SingleFlight()
+        self.assertEqual(dict(result=1), await flight.do('a', self.query, ttl=10))
+        self.assertEqual(dict(result=1), await flight.do('a', self.query, ttl=10))
+        self.assertEqual(dict(result=2), await flight.do('a', self.query))
+        flight.clear()
+        self.assertEqual(dict(result=3), await flight.do('a', self.query, ttl=10))
+
+    @Ontology.runner
+    async def test_exception(self):
+        flight = SingleFlight()
+        result = await asyncio.gather(*[flight.do('a', self.fail, ttl=10) for _ in range(5)], return_exceptions=True)
+        self.assertEqual(1, self.count)
+        for item in result:
+            self.assertTrue(isinstance(item, SDKException))
+        self.assertEqual(dict(result=2), await flight.do('a', self.query, ttl=10))
+
+    @Ontology.runner
+    async def test_cancel(self):
+        flight = SingleFlight()
+        waiter = asyncio.ensure_future(flight.do('a', self.query))
+        result = asyncio.ensure_future(flight.do('a', self.query))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        self.assertEqual(dict(result=1), await result)
+        self.assertEqual(1, self.count)
+
+    def test_loops(self):
+        flight = SingleFlight()
+        old_loop = asyncio.new_event_loop()
+        new_loop = asyncio.new_event_loop()
+        try:
+            waiter = old_loop.create_task(flight.do('a', self.query))
+            old_loop.run_until_complete(asyncio.sleep(0))
+            self.assertEqual(1, flight.in_flight)
+            self.assertEqual(dict(result=2), new_loop.run_until_complete(flight.do('a', self.query)))
+            self.assertEqual(dict(result=2), old_loop.run_until_complete(waiter))
+        finally:
+            old_loop.close()
+            new_loop.close()
+
+    @Ontology.runner
+    async def test_cancel_all(self):
+        flight = SingleFlight()
+        waiters = [asyncio.ensure_future(flight.do('a', self.query)) for _ in range(3)]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+        self.assertEqual(0, flight.in_flight)
+        self.assertEqual(dict(result=2), await flight.do('a', self.query))
+
+    @Ontology.runner
+    async def test_join_after_cancel_all(self):
+        flight = SingleFlight()
+        waiter = asyncio.ensure_future(flight.do('a', self.query))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        late_waiter = asyncio.ensure_future(flight.do('a', self.query))
+        await asyncio.gather(waiter, return_exceptions=True)
+        self.assertEqual(dict(result=2), await late_waiter)
+
+
+if __name__ == '__main__':
+    unittest.main()
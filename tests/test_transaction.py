@@ -26,7 +26,9 @@ from tests import acct1, acct2, acct3, sdk, not_panic_exception
 
 from ontology.utils import utils
 from ontology.common.address import Address
+from ontology.core.sig import Sig
 from ontology.core.transaction import Transaction
+from ontology.core.batch_transaction import verify_transaction_batch
 
 
 class TestTransaction(unittest.TestCase):
@@ -47,6 +49,42 @@ class TestTransaction(unittest.TestCase):
         self.assertGreaterEqual(tx.gas_price, 0)
         self.assertGreaterEqual(tx.nonce, 0)
 
+    def test_unsigned_cache(self):
+        tx = Transaction(0, 0xd1, 500, 20000, acct1.get_address(), bytearray(b'\x01' * 100), 1)
+        tx_hash = tx.hash256()
+        self.assertIs(tx.serialize_unsigned(), tx.serialize_unsigned())
+        self.assertIs(tx_hash, tx.hash256())
+        self.assertEqual(tx_hash.hex(), tx.hash256(is_hex=True))
+        self.assertEqual(tx_hash[::-1].hex(), tx.hash256_explorer())
+        tx.sign_transaction(acct1)
+        self.assertIs(tx_hash, tx.hash256())
+        tx.nonce = 2
+        self.assertNotEqual(tx_hash, tx.hash256())
+        tx_hash = tx.hash256()
+        tx.payload.extend(b'\x02')
+        self.assertNotEqual(tx_hash, tx.hash256())
+        new_tx = Transaction(0, 0xd1, 500, 20000, acct1.get_address(), bytearray(b'\x01' * 100 + b'\x02'), 2)
+        self.assertEqual(new_tx.serialize_unsigned(), tx.serialize_unsigned())
+        tx_hash = tx.hash256()
+        tx.gas_price = 0
+        self.assertNotEqual(tx_hash, tx.hash256())
+
+    def test_verify_signatures(self):
+        pub_keys = [acct1.get_public_key_bytes(), acct2.get_public_key_bytes(), acct3.get_public_key_bytes()]
+        tx = Transaction(0, 0xd1, 500, 20000, acct1.get_address(), bytearray(b'\x01' * 100), 1)
+        self.assertEqual([], tx.verify_signatures())
+        tx.sign_transaction(acct1)
+        tx.add_multi_sign_transaction(2, list(pub_keys), acct3)
+        self.assertEqual([True, False], tx.verify_signatures())
+        tx.add_multi_sign_transaction(2, list(pub_keys), acct1)
+        self.assertEqual([True, True], tx.verify_signatures())
+        tx = Transaction.deserialize_from(tx.serialize())
+        self.assertEqual([True, True], tx.verify_signatures())
+        tx.sig_list[1].sig_data[1] = tx.sig_list[1].sig_data[0]
+        tx.sig_list.append(Sig([acct2.get_public_key_bytes()], 1, [tx.sig_list[0].sig_data[0]]))
+        self.assertEqual([True, False, False], tx.verify_signatures())
+        self.assertEqual([[True, False, False]] * 2, verify_transaction_batch([tx, tx], max_workers=0))
+
     @not_panic_exception
     def test_multi_serialize(self):
         pub_keys = [acct1.get_public_key_bytes(), acct2.get_public_key_bytes(), acct3.get_public_key_bytes()]
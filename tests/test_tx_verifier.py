@@ -16,9 +16,50 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import hashlib
 import unittest
 
 from tests import sdk, not_panic_exception
+from ontology.sdk import Ontology
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.merkle.compact_merkle_tree import CompactMerkleTree
+from ontology.merkle.tx_verifier import TxVerifier, compute_transactions_root
+
+
+class FakeNetwork(object):
+    """
+    A network of blocks whose transactions roots are kept in a local merkle tree.
+    """
+
+    def __init__(self, block_count: int = 6):
+        self.blocks = list()
+        self.tree = CompactMerkleTree()
+        self.block_queries = 0
+        for height in range(block_count):
+            tx_hashes = [hashlib.sha256(f'{height}-{index}'.encode()).hexdigest() for index in range(height % 4 + 1)]
+            tx_root = compute_transactions_root([bytes.fromhex(tx_hash)[::-1] for tx_hash in tx_hashes])
+            self.blocks.append(dict(Header=dict(Height=height, TransactionsRoot=tx_root[::-1].hex()),
+                                    Transactions=[dict(Hash=tx_hash) for tx_hash in tx_hashes]))
+            self.tree.append(tx_root)
+
+    def get_merkle_proof(self, tx_hash: str) -> dict:
+        for block in self.blocks:
+            if tx_hash in [tx['Hash'] for tx in block['Transactions']]:
+                return self.tree.get_merkle_proof(block['Header']['Height'])
+        raise SDKException(ErrorCode.invalid_tx_hash(tx_hash))
+
+    def get_block_by_height(self, height: int) -> dict:
+        self.block_queries += 1
+        return self.blocks[height]
+
+
+class AioFakeNetwork(FakeNetwork):
+    async def get_merkle_proof(self, tx_hash: str) -> dict:
+        return super().get_merkle_proof(tx_hash)
+
+    async def get_block_by_height(self, height: int) -> dict:
+        return super().get_block_by_height(height)
 
 
 class TestMerkleVerifier(unittest.TestCase):
@@ -51,6 +92,55 @@ class TestMerkleVerifier(unittest.TestCase):
             finally:
                 sdk.rpc.connect_to_test_net()
 
+    def test_verify_many(self):
+        fake_sdk = Ontology()
+        fake_sdk.default_network = network = FakeNetwork()
+        verifier = TxVerifier(fake_sdk)
+        verifier.clear_cache()
+        try:
+            tx_hashes = [tx['Hash'] for block in network.blocks for tx in block['Transactions']]
+            results = verifier.verify_many(tx_hashes + tx_hashes[:2])
+            self.assertEqual([True] * (len(tx_hashes) + 2), [result.valid for result in results])
+            self.assertEqual(tx_hashes[1], dict(results[1])['tx_hash'])
+            self.assertEqual(1, results[1].block_height)
+            self.assertEqual(len(network.blocks), network.block_queries)
+            self.assertTrue(verifier.verify_by_tx_hash(tx_hashes[-1]))
+            self.assertEqual(len(network.blocks), network.block_queries)
+            forged_hash = '00' * 32
+            forged_proof = network.get_merkle_proof(tx_hashes[0])
+            network.get_merkle_proof = lambda tx_hash: forged_proof if tx_hash == forged_hash else \
+                FakeNetwork.get_merkle_proof(network, tx_hash)
+            results = verifier.verify_many([forged_hash, 'ff' * 32, tx_hashes[0]])
+            self.assertEqual([True, False, True], [result.proof for result in results])
+            self.assertEqual([False, False, True], [result.in_block for result in results])
+            self.assertEqual([False, False, True], [result.valid for result in results])
+            self.assertNotEqual('', results[1].error)
+            with self.assertRaises(SDKException) as context:
+                verifier.verify_by_tx_hash('ff' * 32)
+            self.assertEqual(ErrorCode.invalid_tx_hash('')['error'], context.exception.args[0])
+        finally:
+            verifier.clear_cache()
+            TxVerifier(sdk)
+
+    @Ontology.runner
+    async def test_aio_verify_many(self):
+        fake_sdk = Ontology()
+        fake_sdk.default_aio_network = network = AioFakeNetwork()
+        verifier = TxVerifier(fake_sdk)
+        verifier.clear_cache()
+        try:
+            tx_hashes = [tx['Hash'] for block in network.blocks for tx in block['Transactions']]
+            results = await verifier.aio_verify_many(tx_hashes)
+            self.assertEqual([True] * len(tx_hashes), [result.valid for result in results])
+            self.assertEqual(len(network.blocks), network.block_queries)
+            network.blocks[2]['Transactions'].append(dict(Hash='00' * 32))
+            verifier.clear_cache()
+            results = await verifier.aio_verify_many(['00' * 32, tx_hashes[0]])
+            self.assertEqual([False, True], [result.valid for result in results])
+        finally:
+            verifier.clear_cache()
+            TxVerifier(sdk)
+
 
 if __name__ == '__main__':
     unittest.main()
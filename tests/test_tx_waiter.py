@@ -0,0 +1,110 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import unittest
+
+from ontology.sdk import Ontology
+from ontology.utils.neo import NeoData
+from ontology.crypto.digest import Digest
+from ontology.claim.claim import Claim
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.network.tx_waiter import aio_wait_for_transactions
+
+
+class FakeNetwork(object):
+    """
+    A network which produces a block when commit is called.
+    """
+
+    def __init__(self):
+        self.blocks = [dict(Header=dict(Height=0, TransactionsRoot='00' * 32), Transactions=list())]
+        self.block_queries = 0
+
+    def commit(self, tx_hashes: list):
+        transactions = [dict(Hash=tx_hash) for tx_hash in tx_hashes]
+        self.blocks.append(dict(Header=dict(Height=len(self.blocks), TransactionsRoot='00' * 32),
+                                Transactions=transactions))
+
+    async def get_block_height(self) -> int:
+        return len(self.blocks) - 1
+
+    async def get_block_by_height(self, height: int) -> dict:
+        self.block_queries += 1
+        return self.blocks[height]
+
+    async def get_block_height_by_tx_hash(self, tx_hash: str) -> int:
+        for block in self.blocks:
+            if tx_hash in [tx['Hash'] for tx in block['Transactions']]:
+                return block['Header']['Height']
+        raise SDKException(ErrorCode.invalid_tx_hash(tx_hash))
+
+    async def get_merkle_proof(self, tx_hash: str) -> dict:
+        height = await self.get_block_height_by_tx_hash(tx_hash)
+        root = NeoData.to_reserve_hex_str(Digest.sha256(bytes.fromhex('01' + '00' * 64), is_hex=True))
+        return dict(BlockHeight=height, CurBlockHeight=1, TransactionsRoot='00' * 32, CurBlockRoot=root,
+                    TargetHashes=['00' * 32])
+
+
+class TestTxWaiter(unittest.TestCase):
+    @Ontology.runner
+    async def test_wait_for_transactions(self):
+        network = FakeNetwork()
+        network.commit(['01' * 32])
+
+        async def produce_blocks():
+            for _ in range(3):
+                await asyncio.sleep(0.02)
+                network.commit(list())
+            network.commit(['02' * 32, '03' * 32])
+
+        producer = asyncio.ensure_future(produce_blocks())
+        heights = await aio_wait_for_transactions(network, ['01' * 32, '02' * 32, '03' * 32], timeout=5,
+                                                  poll_interval=0.005, max_poll_interval=0.01)
+        await producer
+        self.assertEqual({'01' * 32: 1, '02' * 32: 5, '03' * 32: 5}, heights)
+        self.assertEqual(4, network.block_queries)
+        heights = await aio_wait_for_transactions(network, ['01' * 32, '04' * 32], timeout=0.05, poll_interval=0.01)
+        self.assertEqual({'01' * 32: 1}, heights)
+
+    @Ontology.runner
+    async def test_generate_blk_proof_batch(self):
+        sdk = Ontology()
+        sdk.default_aio_network = network = FakeNetwork()
+        tx_hashes = ['01' * 32, '02' * 32, '01' * 32]
+        network.commit(tx_hashes[:2])
+        claims = list()
+        for _ in tx_hashes:
+            claim = Claim(sdk)
+            claim.set_claim('did:ont:TRAtosUZHNSiLhzBdHacyxMX4Bg3cjWy3r#keys-1',
+                            'did:ont:TRAtosUZHNSiLhzBdHacyxMX4Bg3cjWy3r', 'did:ont:SI59Js0zpNSiPOzBdB5cyxu80BO3cjGT70',
+                            0, 'https://example.com/template/v1', dict(), dict())
+            claims.append(claim)
+        blk_proofs = await Claim.aio_generate_blk_proof_batch(claims, tx_hashes, timeout=1)
+        self.assertEqual(tx_hashes, [blk_proof.proof['TxnHash'] for blk_proof in blk_proofs])
+        self.assertEqual([1, 1, 1], [blk_proof.proof['BlockHeight'] for blk_proof in blk_proofs])
+        blk_proofs = await Claim.aio_generate_blk_proof_batch(claims[:2], ['01' * 32, '03' * 32], timeout=0.05)
+        self.assertEqual(claims[0].blk_proof, blk_proofs[0])
+        self.assertTrue(isinstance(blk_proofs[1], SDKException))
+        with self.assertRaises(SDKException):
+            await claims[1].aio_generate_blk_proof('03' * 32, timeout=0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
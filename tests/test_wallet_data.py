@@ -17,6 +17,7 @@ along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import copy
+import pickle
 import unittest
 
 from Cryptodome.Random.random import randint, choice
@@ -154,6 +155,55 @@ class TestWalletData(unittest.TestCase):
             self.assertNotEqual(wallet_1.identities[i].ont_id, wallet_2.identities[i].ont_id)
             self.assertNotEqual(id(wallet_1.identities[i]), id(wallet_2.identities[i]))
 
+    def test_index(self):
+        wallet = WalletData()
+        address_list = [f'address{index}' for index in range(100)]
+        for address in address_list:
+            wallet.add_account(AccountData(address, is_default=False))
+        self.assertEqual(address_list[50], wallet.get_account_by_b58_address(address_list[50]).b58_address)
+        wallet.remove_account(address_list[50])
+        self.assertRaises(SDKException, wallet.get_account_by_b58_address, address_list[50])
+        self.assertIsNone(wallet.accounts.find(address_list[50]))
+        first_acct = wallet.accounts[0]
+        duplicated_acct = AccountData(first_acct.b58_address, is_default=False)
+        wallet.accounts.append(duplicated_acct)
+        self.assertIs(first_acct, wallet.get_account_by_b58_address(first_acct.b58_address))
+        wallet.accounts.pop(0)
+        self.assertIs(duplicated_acct, wallet.get_account_by_b58_address(first_acct.b58_address))
+        wallet.set_default_account_by_address(address_list[10])
+        self.assertTrue(wallet.get_account_by_b58_address(address_list[10]).is_default)
+        self.assertEqual(1, len([acct for acct in wallet.accounts if acct.is_default]))
+        wallet.set_default_account_by_address(address_list[20])
+        self.assertEqual([address_list[20]], [acct.b58_address for acct in wallet.accounts if acct.is_default])
+        wallet.accounts = wallet.accounts[:10]
+        self.assertRaises(SDKException, wallet.get_account_by_b58_address, address_list[11])
+        new_wallet = copy.deepcopy(wallet)
+        self.assertIs(new_wallet.accounts[5], new_wallet.get_account_by_b58_address(address_list[6]))
+        acct = wallet.accounts[1]
+        acct.b58_address = 'new_address'
+        wallet.accounts.reindex()
+        self.assertIsNone(wallet.accounts.find(address_list[2]))
+        self.assertIs(acct, wallet.get_account_by_b58_address('new_address'))
+        acct = AccountData()
+        wallet.accounts.append(acct)
+        acct.b58_address = 'appended_address'
+        self.assertIsNone(wallet.accounts.find('appended_address'))
+        wallet.accounts.reindex()
+        self.assertIs(acct, wallet.accounts.find('appended_address'))
+        self.assertIsNone(wallet.accounts.find('unknown_address'))
+        new_wallet = pickle.loads(pickle.dumps(wallet))
+        self.assertEqual([acct.b58_address for acct in wallet.accounts],
+                         [acct.b58_address for acct in new_wallet.accounts])
+        self.assertIs(new_wallet.accounts[3], new_wallet.accounts.find(wallet.accounts[3].b58_address))
+        new_wallet.accounts.append(AccountData('pickled_address'))
+        self.assertEqual('pickled_address', new_wallet.get_account_by_b58_address('pickled_address').b58_address)
+        ont_id = DID_ONT + address_list[0]
+        wallet.add_identity(Identity(ont_id))
+        self.assertRaises(SDKException, wallet.add_identity, Identity(ont_id))
+        self.assertEqual(ont_id, wallet.get_identity_by_ont_id(ont_id).ont_id)
+        wallet.remove_identity(ont_id)
+        self.assertRaises(SDKException, wallet.get_identity_by_ont_id, ont_id)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,6 +19,8 @@ along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 import os
 import unittest
 
+from unittest.mock import patch
+
 from Cryptodome.Random.random import choice
 
 from tests import password
@@ -177,6 +179,81 @@ class TestWalletManager(unittest.TestCase):
         self.assertEqual(b58_address, import_acct.get_address_base58())
         self.assertEqual(base64_salt, acct1.salt)
 
+    def test_unlock_cache(self):
+        self.assertEqual(0, WalletManager().unlock_ttl)
+        wallet_manager = WalletManager(unlock_ttl=300)
+        acct = wallet_manager.create_account(password)
+        b58_address = acct.get_address_base58()
+        decrypt = Account.get_gcm_decoded_private_key
+        with patch.object(Account, 'get_gcm_decoded_private_key', side_effect=decrypt) as mock_decrypt:
+            acct0 = wallet_manager.get_account_by_b58_address(b58_address, password)
+            acct1 = wallet_manager.get_default_account(password)
+            self.assertEqual(0, mock_decrypt.call_count)
+            self.assertIsNot(acct0, acct1)
+            self.assertEqual(acct0.get_private_key_bytes(), acct1.get_private_key_bytes())
+            self.assertRaises(SDKException, wallet_manager.get_account_by_b58_address, b58_address, 'wrong_password')
+            self.assertEqual(1, mock_decrypt.call_count)
+            self.assertTrue(wallet_manager.lock_account(b58_address))
+            self.assertFalse(wallet_manager.lock_account(b58_address))
+            wallet_manager.get_account_by_b58_address(b58_address, password)
+            self.assertEqual(2, mock_decrypt.call_count)
+            wallet_manager.lock_all()
+            wallet_manager.get_account_by_b58_address(b58_address, password)
+            self.assertEqual(3, mock_decrypt.call_count)
+            wallet_manager.unlock_ttl = 0
+            wallet_manager.get_account_by_b58_address(b58_address, password)
+            wallet_manager.get_account_by_b58_address(b58_address, password)
+            self.assertEqual(5, mock_decrypt.call_count)
+        self.assertEqual(acct.get_private_key_bytes(), acct0.get_private_key_bytes())
+        with self.assertRaises(SDKException):
+            wallet_manager.unlock_ttl = -1
+
+    def test_account_batch(self):
+        wallet_manager = WalletManager()
+        wallet_manager.wallet_in_mem.scrypt.n = 1024
+        acct_data_list = wallet_manager.create_account_batch(password, 4, labels=['a', 'b', '', 'd'], max_workers=2)
+        self.assertEqual(4, wallet_manager.get_account_count())
+        self.assertEqual(['a', 'b', 'd'], [acct_data_list[i].label for i in [0, 1, 3]])
+        self.assertEqual(acct_data_list[0].b58_address, wallet_manager.wallet_in_mem.default_account_address)
+        for acct_data in acct_data_list:
+            acct = wallet_manager.get_account_by_b58_address(acct_data.b58_address, password)
+            self.assertEqual(acct_data.public_key, acct.get_public_key_hex())
+        private_key = acct.get_private_key_hex()
+        self.assertRaises(SDKException, wallet_manager.create_account_from_private_key_batch, password, [private_key])
+        new_wallet_manager = WalletManager()
+        self.assertEqual(16384, new_wallet_manager.wallet_in_mem.scrypt.n)
+        new_wallet_manager.wallet_in_mem.scrypt.n = 2048
+        acct_list = [(acct.label, acct.key, password, acct.b58_address, acct.salt) for acct in acct_data_list]
+        bad_acct_list = acct_list[:1] + [('label', acct_list[1][1], 'wrong_password', acct_list[1][3], acct_list[1][4])]
+        self.assertRaises(SDKException, new_wallet_manager.import_account_batch, bad_acct_list, 1024, max_workers=2)
+        self.assertEqual(0, new_wallet_manager.get_account_count())
+        import_acct_list = new_wallet_manager.import_account_batch(acct_list, 1024, max_workers=2)
+        self.assertEqual([acct.b58_address for acct in acct_data_list], [acct.b58_address for acct in import_acct_list])
+        acct = new_wallet_manager.get_account_by_b58_address(import_acct_list[2].b58_address, password)
+        self.assertEqual(import_acct_list[2].b58_address, acct.get_address_base58())
+        identity_acct = Account(utils.get_random_hex_str(64))
+        salt = utils.get_random_hex_str(16)
+        encrypted_private_key = identity_acct.export_gcm_encrypted_private_key(password, salt, 2048)
+        identity = new_wallet_manager.import_identity('label', encrypted_private_key, password, salt,
+                                                      identity_acct.get_address_base58())
+        self.assertEqual(identity_acct.get_ont_id(), identity.ont_id)
+        wallet_manager.create_identity(password)
+        ont_id = wallet_manager.wallet_in_mem.identities[0].ont_id
+        key_list = [acct.key for acct in wallet_manager.get_acct_data_list()]
+        self.assertRaises(SDKException, wallet_manager.change_password_batch, 'wrong_password', 'new_password')
+        self.assertEqual(key_list, [acct.key for acct in wallet_manager.get_acct_data_list()])
+        wallet_manager.set_signature_scheme(SignatureScheme.SHA384withECDSA)
+        self.assertRaises(SDKException, wallet_manager.change_password_batch, password, 'new_password')
+        self.assertEqual(key_list, [acct.key for acct in wallet_manager.get_acct_data_list()])
+        wallet_manager.set_signature_scheme(SignatureScheme.SHA256withECDSA)
+        wallet_manager.change_password_batch(password, 'new_password', n=2048, max_workers=2)
+        self.assertEqual(2048, wallet_manager.wallet_in_mem.scrypt.n)
+        b58_address = acct_data_list[1].b58_address
+        self.assertRaises(SDKException, wallet_manager.get_account_by_b58_address, b58_address, password)
+        acct = wallet_manager.get_account_by_b58_address(b58_address, 'new_password')
+        self.assertEqual(b58_address, acct.get_address_base58())
+        self.assertEqual(ont_id, wallet_manager.get_account_by_ont_id(ont_id, 'new_password').get_ont_id())
+
     def test_get_accounts(self):
         wm = WalletManager()
         wm.create_wallet_file(self.path)
@@ -265,6 +342,7 @@ class TestWalletManager(unittest.TestCase):
                 wm.get_wallet().set_default_account_by_address(acct.b58_address)
                 default_address = wm.get_wallet().get_default_account_address()
                 self.assertEqual(default_address, acct.b58_address)
+                self.assertEqual([acct.b58_address], [a.b58_address for a in accounts if a.is_default])
         finally:
             wm.del_wallet_file()
 
@@ -0,0 +1,102 @@
+"""
+Copyright (C) 2018-2019 The ontology Authors
+This file is part of The ontology library.
+
+The ontology is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+The ontology is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import unittest
+
+from ontology.common.define import DID_ONT
+from ontology.wallet.store import WalletStore
+from ontology.wallet.identity import Identity
+from ontology.wallet.account import AccountData
+from ontology.exception.exception import SDKException
+from ontology.wallet.wallet_manager import WalletManager
+
+
+class TestWalletStore(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(os.path.dirname(__file__), 'test_wallet_store.db')
+        self.json_path = os.path.join(os.path.dirname(__file__), 'test_wallet_store.json')
+
+    def tearDown(self):
+        for path in [self.path, self.json_path]:
+            if os.path.isfile(path):
+                os.remove(path)
+
+    def test_put_get(self):
+        with WalletStore(self.path) as store:
+            self.assertEqual('MyWallet', store.name)
+            self.assertEqual(16384, store.scrypt.n)
+            store.put_accounts([AccountData(f'address{index}', label=f'{index}') for index in range(10)])
+            store.put_account(AccountData('address3', label='new label'))
+            self.assertEqual(10, store.get_account_count())
+            self.assertEqual('new label', store.get_account_by_b58_address('address3').label)
+            self.assertEqual('address3', [acct.b58_address for acct in store.iter_accounts()][3])
+            store.remove_account('address3')
+            self.assertRaises(SDKException, store.remove_account, 'address3')
+            self.assertRaises(SDKException, store.get_account_by_b58_address, 'address3')
+            store.set_default_account_by_address('address5')
+            self.assertEqual(['address5'], [acct.b58_address for acct in store.iter_accounts() if acct.is_default])
+            self.assertEqual('address5', store.default_account_address)
+            ont_id = DID_ONT + 'address0'
+            store.put_identity(Identity(ont_id, label='identity'))
+            self.assertEqual('identity', store.get_identity_by_ont_id(ont_id).label)
+            self.assertEqual(1, store.get_identity_count())
+        with WalletStore(self.path) as store:
+            self.assertEqual(9, store.get_account_count())
+            self.assertEqual(ont_id, store.get_identity_by_ont_id(ont_id).ont_id)
+
+    def test_transaction(self):
+        with WalletStore(self.path) as store:
+            store.put_account(AccountData('address0'))
+            try:
+                with store.transaction():
+                    store.put_account(AccountData('address1'))
+                    store.remove_account('address0')
+                    store.remove_account('address2')
+            except SDKException:
+                pass
+            self.assertEqual(['address0'], [acct.b58_address for acct in store.iter_accounts()])
+            with store.transaction():
+                store.put_account(AccountData('address1'))
+                try:
+                    with store.transaction():
+                        store.put_account(AccountData('address2'))
+                        store.remove_account('address3')
+                except SDKException:
+                    pass
+                self.assertRaises(SDKException, store.remove_account, 'address3')
+            self.assertEqual(['address0', 'address1'], [acct.b58_address for acct in store.iter_accounts()])
+        with WalletStore(self.path) as store:
+            self.assertEqual(['address0', 'address1'], [acct.b58_address for acct in store.iter_accounts()])
+
+    def test_import_export(self):
+        wallet_path = os.path.join(os.path.dirname(__file__), 'wallet.json')
+        wm = WalletManager()
+        wm.open_wallet(wallet_path)
+        with WalletStore(self.path) as store:
+            store.import_json(wallet_path)
+            self.assertEqual(wm.get_account_count(), store.get_account_count())
+            self.assertEqual(dict(wm.wallet_in_mem), dict(store.to_wallet_data()))
+            store.export_json(self.json_path)
+        new_wm = WalletManager()
+        new_wm.open_wallet(self.json_path, is_create=False)
+        self.assertEqual(dict(wm.wallet_in_mem), dict(new_wm.wallet_in_mem))
+
+
+if __name__ == '__main__':
+    unittest.main()
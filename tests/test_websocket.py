@@ -16,9 +16,12 @@ You should have received a copy of the GNU Lesser General Public License
 along with The ontology.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import json
 import asyncio
 import unittest
 
+import websockets
+
 from tests import sdk, acct1, acct2, acct3, acct4, not_panic_exception
 
 from ontology.sdk import Ontology
@@ -26,6 +29,8 @@ from ontology.utils.neo import NeoData
 from ontology.utils.event import Event
 from ontology.common.address import Address
 from ontology.account.account import Account
+from ontology.network.websocket import Websocket
+from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 from ontology.crypto.signature_scheme import SignatureScheme
 
@@ -78,6 +83,75 @@ class TestWebsocketClient(unittest.TestCase):
         finally:
             await sdk.websocket.close_connect()
 
+    @not_panic_exception
+    @Ontology.runner
+    async def test_concurrent_requests(self):
+        try:
+            height = await sdk.websocket.get_block_height()
+            tasks = [sdk.websocket.get_block_hash_by_height(height - i) for i in range(10)]
+            tasks.append(sdk.websocket.get_connection_count())
+            response = await asyncio.gather(*tasks)
+        finally:
+            await sdk.websocket.close_connect()
+        self.assertEqual(10, len(set(response[:10])))
+        for block_hash in response[:10]:
+            self.assertEqual(64, len(block_hash))
+        self.assertGreater(response[10], 0)
+
+    @not_panic_exception
+    @Ontology.runner
+    async def test_stream(self):
+        height = await sdk.websocket.get_block_height()
+        start_height = height - 2
+        block_height_list = list()
+        try:
+            async for push in sdk.websocket.stream(events=False, blocks=True, start_height=start_height):
+                self.assertEqual('sendjsonblock', push['Action'])
+                block_height_list.append(push['Result']['Header']['Height'])
+                if len(block_height_list) == 3:
+                    break
+        finally:
+            await sdk.websocket.close_connect()
+        self.assertEqual(list(range(start_height, start_height + 3)), block_height_list)
+
+    @Ontology.runner
+    async def test_stream_backpressure(self):
+        def notify(tx_hash: str) -> str:
+            return json.dumps(dict(Action='Notify', Desc='SUCCESS', Error=0, Result=dict(TxHash=tx_hash),
+                                   Version='1.0.0'))
+
+        async def handler(connection, *args):
+            async for message in connection:
+                msg = json.loads(message)
+                result = dict(subscribe=dict(), getblockheight=0, getconnectioncount=1).get(msg['Action'], '')
+                if msg['Action'] == 'getconnectioncount':
+                    for index in range(8):
+                        await connection.send(notify(f'{index:064x}'))
+                await connection.send(json.dumps(dict(Action=msg['Action'], Desc='SUCCESS', Error=0, Id=msg['Id'],
+                                                      Result=result, Version='1.0.0')))
+                if msg['Action'] == 'getblockheight':
+                    await connection.send(notify('ff' * 32))
+
+        async with websockets.serve(handler, '127.0.0.1', 0) as server:
+            websocket = Websocket(f'ws://127.0.0.1:{server.sockets[0].getsockname()[1]}', timeout=2)
+            tx_hashes = list()
+            try:
+                async for push in websocket.stream(blocks=False, buffer_size=2):
+                    tx_hashes.append(push['Result']['TxHash'])
+                    self.assertEqual(1, await websocket.get_connection_count())
+                    if len(tx_hashes) == 9:
+                        break
+            finally:
+                await websocket.close_connect()
+        self.assertEqual(['ff' * 32] + [f'{index:064x}' for index in range(8)], tx_hashes)
+
+    @Ontology.runner
+    async def test_connect_error(self):
+        websocket = Websocket('ws://unknown-host.invalid:20335')
+        with self.assertRaises(SDKException) as context:
+            await websocket.get_block_height()
+        self.assertEqual(ErrorCode.connect_err('')['error'], context.exception.args[0])
+
     @not_panic_exception
     @Ontology.runner
     async def test_get_connection_count(self):